@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+填空答案评分
+Answer grading for the foundation pages (shared by /api/grade and offline tools)
+
+评分规则与页面里的 calculateSimilarity 相同：
+去掉空白和标点后，相似度 = 最长公共子序列(LCS)长度 / 较长文本的长度；
+相似度 ≥ 0.85 为正确（计1分），≥ 0.6 为部分正确（计0.6分），否则为错误。
+
+LCS 使用位并行算法（Hyyrö 2004）：标准答案中每个字符出现的位置编码为一个整数位掩码，
+用户答案的每个字符只需几次整数加减和位运算，不再分配 (n+1)×(m+1) 的表。
+标准答案的位掩码按文本缓存，同一道题被多次评分时只构建一次。
+
+用法:
+    similarity('起初神创造天地', '起初，神创造天地。')   # 1.0
+    keys = AnswerKeys('foundation/data/answers')
+    grade_answers([{'key': 'q1_创 1:1', 'answer': '...'}], keys.get('foundation_L1_S1'))
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from functools import lru_cache
+from itertools import repeat
+
+CORRECT_THRESHOLD = 0.85
+PARTIAL_THRESHOLD = 0.6
+PARTIAL_CREDIT = 0.6
+
+CORRECT = 'correct'
+PARTIAL = 'partial'
+INCORRECT = 'incorrect'
+
+# 与页面脚本中的 /[\s\.,;:!?，。；：！？、""''（）【】《》]/g 一致
+_STRIP_RE = re.compile(r'[\s.,;:!?，。；：！？、"\'（）【】《》]')
+_PAGE_KEY_RE = re.compile(r'^foundation_L\d+_S\d+$')
+
+
+def normalize(text):
+    """去掉空白和标点"""
+    return _STRIP_RE.sub('', text or '')
+
+
+@lru_cache(maxsize=4096)
+def _char_masks(text):
+    """每个字符在 text 中出现位置的位掩码"""
+    masks = {}
+    for i, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def lcs_length(a, b):
+    """最长公共子序列的长度（位并行，按 b 构建位掩码）"""
+    if not a or not b:
+        return 0
+    masks = _char_masks(b)
+    v = (1 << len(b)) - 1
+    for mask in map(masks.get, a, repeat(0)):
+        u = v & mask
+        # 加法的进位只会进入第 len(b) 位以上，不影响低位，循环中无需截断
+        v = (v + u) | (v - u)
+    # 低 len(b) 位中被清零的位数即 LCS 长度
+    return len(b) - bin(v & ((1 << len(b)) - 1)).count('1')
+
+
+@lru_cache(maxsize=65536)
+def similarity(answer, standard):
+    """用户答案与标准答案的相似度（0-1）
+
+    结果按 (答案, 标准答案) 缓存：同一道题不同学生的相同答案只计算一次。
+    """
+    clean_answer = normalize(answer)
+    clean_standard = normalize(standard)
+    if not clean_answer or not clean_standard:
+        return 0
+    if clean_answer == clean_standard:
+        return 1.0
+    return lcs_length(clean_answer, clean_standard) / max(len(clean_answer), len(clean_standard))
+
+
+def grade(score):
+    """相似度 -> correct / partial / incorrect"""
+    if score >= CORRECT_THRESHOLD:
+        return CORRECT
+    if score >= PARTIAL_THRESHOLD:
+        return PARTIAL
+    return INCORRECT
+
+
+def grade_answers(items, answer_key=None):
+    """批量评分
+
+    items 中每一项为 {"key": 答案键, "answer": 用户答案}（标准答案从 answer_key 中查）
+    或 {"answer": 用户答案, "standard": 标准答案}。
+    answer_key 为答案文件中的 answers 字典：答案键 -> {"text", "has_data", ...}。
+    没有标准答案的题目 grade 为 None，不计入总分。
+
+    返回 (每一项的结果列表, 汇总)。
+    """
+    answer_key = answer_key or {}
+    results = []
+    counts = {CORRECT: 0, PARTIAL: 0, INCORRECT: 0}
+    for i, item in enumerate(items):
+        result = {'index': i}
+        key = item.get('key')
+        if key is not None:
+            result['key'] = key
+        if 'standard' in item:
+            standard = item['standard']
+        else:
+            info = answer_key.get(key)
+            standard = info.get('text') if info and info.get('has_data') else None
+        if not standard:
+            result.update(similarity=None, grade=None)
+            results.append(result)
+            continue
+
+        score = similarity(str(item.get('answer') or '').strip(), str(standard))
+        result.update(similarity=round(score, 4), grade=grade(score))
+        if result['grade'] != CORRECT:
+            result['standard'] = standard
+        counts[result['grade']] += 1
+        results.append(result)
+
+    total = sum(counts.values())
+    points = counts[CORRECT] + PARTIAL_CREDIT * counts[PARTIAL]
+    summary = dict(counts, total=total,
+                   # 与页面的 Math.round 一致（.5 向上取整）
+                   score=math.floor(points / total * 100 + 0.5) if total else 0)
+    return results, summary
+
+
+class AnswerKeys:
+    """按页面读取 data/answers/{页面}.json 的 answers 字典，文件未变化时使用缓存（线程安全）"""
+
+    def __init__(self, answers_dir):
+        self.answers_dir = answers_dir
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def get(self, page):
+        """返回页面的答案字典；页面名无效时抛出 ValueError，文件不存在时抛出 FileNotFoundError"""
+        if not _PAGE_KEY_RE.match(page or ''):
+            raise ValueError(f"无效的页面: {page}")
+        path = os.path.join(self.answers_dir, f"{page}.json")
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            cached = self._cache.get(page)
+            if cached and cached[0] == mtime:
+                return cached[1]
+        with open(path, 'r', encoding='utf-8') as f:
+            answers = json.load(f).get('answers', {})
+        with self._lock:
+            self._cache[page] = (mtime, answers)
+        return answers
@@ -5,20 +5,59 @@ Bible Study Server with Verse Editing API
 圣经学习服务器 - 支持经文编辑功能
 """
 
+import argparse
+import email.utils
 import json
 import os
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import signal
+import threading
+from http.server import HTTPServer, ThreadingHTTPServer, SimpleHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import urllib.parse
 
+from answer_grading import AnswerKeys, grade_answers
+from book_store import BookStore
+import scripture_reference
+from edit_journal import EditJournal, JournalLockedError
+from static_cache import StaticCache, choose_encoding, etag_matches
+
+# 默认同时处理的请求数上限（一个班级同时访问时足够）
+DEFAULT_WORKERS = 32
+# keep-alive 连接的空闲超时（秒），0 表示每个请求后关闭连接
+DEFAULT_KEEP_ALIVE = 5
+# 修改过的书卷定时写回磁盘的间隔（秒）
+DEFAULT_FLUSH_INTERVAL = 2.0
+
 class BibleServerHandler(SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
+        self._holding_slot = False
         super().__init__(*args, **kwargs)
     
+    def handle_one_request(self):
+        """处理连接上的一个请求，结束后归还并发名额"""
+        try:
+            super().handle_one_request()
+        finally:
+            if self._holding_slot:
+                self._holding_slot = False
+                self.server.request_slots.release()
+    
+    def parse_request(self):
+        """请求行到达后才占用并发名额：空闲等待的 keep-alive 连接不占名额"""
+        request_slots = getattr(self.server, 'request_slots', None)
+        if request_slots is not None:
+            request_slots.acquire()
+            self._holding_slot = True
+        return super().parse_request()
+    
     def do_POST(self):
-        """处理POST请求 - 用于保存经文编辑"""
+        """处理POST请求 - 用于保存经文编辑和答案评分"""
         if self.path == '/api/save-verse':
             self.handle_save_verse()
+        elif self.path == '/api/save-verses':
+            self.handle_save_verses()
+        elif self.path == '/api/grade':
+            self.handle_grade()
         else:
             self.send_error(404, "Not Found")
     
@@ -26,9 +65,7 @@ class BibleServerHandler(SimpleHTTPRequestHandler):
         """处理经文保存请求"""
         try:
             # 读取请求数据
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = self.read_json_body()
             
             book = data['book']
             chapter = int(data['chapter'])
@@ -37,61 +74,21 @@ class BibleServerHandler(SimpleHTTPRequestHandler):
             
             print(f"保存经文: {book} {chapter}:{verse} -> {new_text[:50]}...")
             
-            # 读取对应的JSON文件
-            json_file = f"data/{book}.json"
-            if not os.path.exists(json_file):
-                self.send_error(404, f"Book file not found: {json_file}")
+            # 在内存书卷中更新（由后台线程批量写回文件）
+            try:
+                old_text = self.server.book_store.update_verse(book, chapter, verse, new_text)
+            except FileNotFoundError:
+                self.send_error(404, f"Book file not found: data/{book}.json")
                 return
             
-            with open(json_file, 'r', encoding='utf-8') as f:
-                book_data = json.load(f)
-            
-            # 查找并更新对应的经文
-            updated = False
-            for verse_data in book_data.get('verses', []):
-                if verse_data['chapter'] == chapter and verse_data['verse'] == verse:
-                    verse_data['text'] = new_text
-                    verse_data['zh'] = new_text  # 同时更新zh字段
-                    updated = True
-                    break
-            
-            if not updated:
-                # 如果没找到，添加新的经文
-                book_data.setdefault('verses', []).append({
-                    'chapter': chapter,
-                    'verse': verse,
-                    'text': new_text,
-                    'zh': new_text
-                })
-            
-            # 保存回文件
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(book_data, f, ensure_ascii=False, indent=2)
-            
-            # 创建备份
-            backup_file = f"backup_original/data/{book}_{chapter}_{verse}_edited.json"
-            os.makedirs(os.path.dirname(backup_file), exist_ok=True)
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'book': book,
-                    'chapter': chapter,
-                    'verse': verse,
-                    'old_text': data.get('old_text', ''),
-                    'new_text': new_text,
-                    'timestamp': __import__('datetime').datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
+            # 记入编辑日志（新增的经文 old_text 为 None，恢复时删除）
+            self.server.edit_journal.append(book, chapter, verse, old_text, new_text)
             
             # 返回成功响应
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            response = {
+            self.send_json({
                 'success': True,
                 'message': f'经文 {book} {chapter}:{verse} 保存成功'
-            }
-            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+            })
             
             print(f"✅ 经文保存成功: {book} {chapter}:{verse}")
             
@@ -99,12 +96,221 @@ class BibleServerHandler(SimpleHTTPRequestHandler):
             print(f"❌ 保存经文失败: {str(e)}")
             self.send_error(500, f"Internal Server Error: {str(e)}")
     
+    def handle_save_verses(self):
+        """批量保存经文：按书卷分组，每卷书一次性应用，返回每一项的结果
+        
+        请求体为 {"edits": [{"book", "chapter", "verse", "text"}, ...]}
+        或直接为编辑数组。
+        """
+        try:
+            data = self.read_json_body()
+            edits = data.get('edits', []) if isinstance(data, dict) else data
+            if not isinstance(edits, list):
+                self.send_error(400, "edits must be a list")
+                return
+            
+            results = [None] * len(edits)
+            by_book = {}
+            for i, item in enumerate(edits):
+                try:
+                    edit = (int(item['chapter']), int(item['verse']), str(item['text']))
+                    by_book.setdefault(item['book'], []).append((i, edit))
+                except (KeyError, TypeError, ValueError) as e:
+                    results[i] = {'index': i, 'success': False, 'error': f'无效的编辑: {str(e)}'}
+            
+            print(f"批量保存经文: {len(edits)} 处修改，涉及 {len(by_book)} 卷书")
+            
+            for book, items in by_book.items():
+                try:
+                    old_texts = self.server.book_store.update_verses(
+                        book, [edit for _, edit in items])
+                except FileNotFoundError:
+                    for i, (chapter, verse, _) in items:
+                        results[i] = {'index': i, 'book': book, 'chapter': chapter,
+                                      'verse': verse, 'success': False,
+                                      'error': f'Book file not found: data/{book}.json'}
+                    continue
+                for (i, (chapter, verse, text)), old_text in zip(items, old_texts):
+                    self.server.edit_journal.append(book, chapter, verse, old_text, text)
+                    results[i] = {'index': i, 'book': book, 'chapter': chapter,
+                                  'verse': verse, 'success': True}
+            
+            saved = sum(1 for r in results if r['success'])
+            self.send_json({
+                'success': saved == len(results),
+                'saved': saved,
+                'failed': len(results) - saved,
+                'results': results
+            })
+            
+            print(f"✅ 批量保存完成: 成功 {saved}，失败 {len(results) - saved}")
+            
+        except Exception as e:
+            print(f"❌ 批量保存经文失败: {str(e)}")
+            self.send_error(500, f"Internal Server Error: {str(e)}")
+    
+    def handle_grade(self):
+        """批量评分：一节的所有答案一次提交，返回每一项的相似度和评分
+        
+        请求体为 {"page": "foundation_L1_S1", "answers": [{"key", "answer"}, ...]}，
+        标准答案从 foundation/data/answers/{page}.json 中按 key 查找；
+        也可以在每一项中直接给出 "standard"（此时可以不提供 page）。
+        评分规则见 answer_grading。
+        """
+        try:
+            data = self.read_json_body()
+            items = data.get('answers') if isinstance(data, dict) else None
+            if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+                self.send_error(400, "answers must be a list of objects")
+                return
+            
+            answer_key = None
+            page = data.get('page')
+            if page:
+                try:
+                    answer_key = self.server.answer_keys.get(page)
+                except ValueError:
+                    self.send_error(400, f"Invalid page: {page}")
+                    return
+                except FileNotFoundError:
+                    self.send_error(404, f"Answers not found: {page}")
+                    return
+            
+            results, summary = grade_answers(items, answer_key)
+            self.send_json({'success': True, 'results': results, 'summary': summary})
+            
+        except Exception as e:
+            print(f"❌ 评分失败: {str(e)}")
+            self.send_error(500, f"Internal Server Error: {str(e)}")
+    
+    def read_json_body(self):
+        """读取并解析JSON请求体"""
+        content_length = int(self.headers['Content-Length'])
+        post_data = self.rfile.read(content_length)
+        return json.loads(post_data.decode('utf-8'))
+    
+    def handle_get_verses(self, query):
+        """经文查询: /api/verses?book=luke&ref=1:1-20 或 ?ref=路 1:1-20 或 ?book=luke&chapter=1
+        
+        ref 的语法见 scripture_reference（支持跨章范围如 7:24-8:2）；
+        book 可以是书卷ID、全名或简称。
+        """
+        params = parse_qs(query)
+        book = params.get('book', [''])[0].strip()
+        ref = params.get('ref', [''])[0].strip()
+        chapter = params.get('chapter', [''])[0].strip()
+        book = scripture_reference.book_id_for(book) or book
+        
+        if ref and not book:
+            parsed = scripture_reference.parse(ref)
+            if parsed is None:
+                self.send_error(400, "Invalid reference")
+                return
+            if parsed.book_id is None:
+                self.send_error(404, "Unknown book")
+                return
+            book = parsed.book_id
+            ranges = parsed.ranges
+        elif ref:
+            ranges = scripture_reference.parse_ranges(ref)
+            if not ranges:
+                self.send_error(400, "Invalid reference")
+                return
+        elif book and chapter.isdigit():
+            ranges = scripture_reference.parse_ranges(chapter)
+        else:
+            self.send_error(400, "Missing book/ref parameters")
+            return
+        
+        try:
+            verses, missing = self.server.book_store.get_ranges(book, ranges)
+            book_data = self.server.book_store.get_book(book).data
+        except FileNotFoundError:
+            self.send_error(404, f"Book file not found: data/{book}.json")
+            return
+        
+        self.send_json({
+            'book': book,
+            'name': book_data.get('name', ''),
+            'ref': ref or chapter,
+            'verses': verses,
+            'missing': [f"{c}:{v}" for c, v in missing]
+        })
+    
+    def do_GET(self):
+        """API请求；静态文件请求前，先把该书卷未写回的修改落盘"""
+        parsed_url = urlparse(self.path)
+        if parsed_url.path == '/api/verses':
+            self.handle_get_verses(parsed_url.query)
+            return
+        path = parsed_url.path
+        if path.startswith('/data/') and path.endswith('.json'):
+            book = path[len('/data/'):-len('.json')]
+            if self.server.book_store.is_dirty(book):
+                self.server.book_store.flush(book)
+        if not self.send_cached_file(head_only=False):
+            super().do_GET()
+    
+    def do_HEAD(self):
+        """HEAD请求同样走缓存"""
+        if not self.send_cached_file(head_only=True):
+            super().do_HEAD()
+    
+    def send_cached_file(self, head_only):
+        """从压缩缓存发送静态文件，支持ETag/304与gzip/br协商
+        
+        只处理普通文件，目录等其他情况返回 False 交给父类处理。
+        """
+        path = self.translate_path(self.path)
+        if path.endswith('/') or os.path.isdir(path):
+            return False
+        cached = self.server.static_cache.get(path)
+        if cached is None:
+            return False
+        
+        encoding = choose_encoding(path, self.headers.get('Accept-Encoding'), cached.size)
+        common_headers = [
+            ('Cache-Control', 'no-cache'),
+            ('Vary', 'Accept-Encoding'),
+            ('Last-Modified', email.utils.formatdate(cached.mtime, usegmt=True)),
+        ]
+        
+        if etag_matches(self.headers.get('If-None-Match'), cached.all_etags()):
+            _, etag = self.server.static_cache.encode(cached, encoding)
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            for name, value in common_headers:
+                self.send_header(name, value)
+            self.end_headers()
+            return True
+        
+        body, etag = self.server.static_cache.encode(cached, encoding)
+        self.send_response(200)
+        self.send_header('Content-type', self.guess_type(path))
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        for name, value in common_headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(body)
+        return True
+    
+    def send_json(self, payload, status=200):
+        """发送JSON响应（带Content-Length，保证keep-alive连接可复用）"""
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
     def do_OPTIONS(self):
         """处理预检请求"""
         self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'POST, GET, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def end_headers(self):
@@ -114,22 +320,106 @@ class BibleServerHandler(SimpleHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         super().end_headers()
 
-def run_server(port=8001):
-    """运行服务器"""
+class BoundedHTTPServer(ThreadingHTTPServer):
+    """每个连接一个线程、限制同时处理请求数的HTTP服务器
+    
+    连接（包括空闲等待下一个请求的 keep-alive 连接）各用一个线程，互不阻塞；
+    只有正在处理的请求占用 request_slots 中的名额，超过 workers 个时后到的请求等待。
+    """
+    daemon_threads = True
+    
+    def __init__(self, server_address, handler_class, workers=DEFAULT_WORKERS):
+        super().__init__(server_address, handler_class)
+        self.workers = workers
+        self.request_slots = threading.BoundedSemaphore(workers)
+    
+    def server_close(self):
+        """关闭监听套接字，并等待正在处理的请求完成（空闲连接不等待）"""
+        super().server_close()
+        for _ in range(self.workers):
+            self.request_slots.acquire()
+
+
+def make_server(port=8001, workers=DEFAULT_WORKERS, keep_alive=DEFAULT_KEEP_ALIVE,
+                flush_interval=DEFAULT_FLUSH_INTERVAL):
+    """创建服务器实例
+    
+    workers 为同时处理的请求数上限，1 时退回单线程 HTTPServer；keep_alive 为空闲连接的超时秒数，
+    大于 0 时使用 HTTP/1.1 持久连接；flush_interval 为修改过的书卷写回磁盘的间隔秒数。
+    """
+    handler_class = type('ConfiguredBibleServerHandler', (BibleServerHandler,), {
+        'protocol_version': 'HTTP/1.1' if keep_alive > 0 else 'HTTP/1.0',
+        'timeout': keep_alive if keep_alive > 0 else None,
+    })
+    # 先独占编辑日志：已有服务器或 edit_journal.py 的写操作在运行时抛出 JournalLockedError
+    edit_journal = EditJournal()
+    edit_journal.acquire_lock()
     server_address = ('', port)
-    httpd = HTTPServer(server_address, BibleServerHandler)
+    try:
+        if workers <= 1:
+            httpd = HTTPServer(server_address, handler_class)
+        else:
+            httpd = BoundedHTTPServer(server_address, handler_class, workers=workers)
+    except Exception:
+        edit_journal.close()
+        raise
+    httpd.static_cache = StaticCache()
+    httpd.edit_journal = edit_journal
+    httpd.answer_keys = AnswerKeys(os.path.join('foundation', 'data', 'answers'))
+    httpd.book_store = BookStore('data', flush_interval=flush_interval,
+                                 before_flush=httpd.edit_journal.sync)
+    return httpd
+
+
+def run_server(port=8001, workers=DEFAULT_WORKERS, keep_alive=DEFAULT_KEEP_ALIVE,
+               flush_interval=DEFAULT_FLUSH_INTERVAL):
+    """运行服务器"""
+    try:
+        httpd = make_server(port, workers, keep_alive, flush_interval)
+    except JournalLockedError as e:
+        print(f"❌ {e}")
+        print("   可能已有服务器在运行，或正在执行 edit_journal.py 的 restore/compact")
+        return
+    httpd.book_store.start()
     
     print(f"🌟 圣经学习服务器启动成功！")
     print(f"📖 访问地址: http://localhost:{port}")
     print(f"✏️  支持经文在线编辑功能")
+    print(f"📝 答案评分接口: /api/grade")
+    print(f"⚙️  并发请求上限: {workers}，keep-alive: {keep_alive}秒")
     print(f"🔧 使用 Ctrl+C 停止服务器")
     print("-" * 50)
     
+    # SIGTERM 与 Ctrl+C 一样优雅退出
+    def handle_sigterm(signum, frame):
+        raise KeyboardInterrupt
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, handle_sigterm)
+    
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
-        print("\n\n服务器已停止")
-        httpd.shutdown()
+        print("\n\n正在停止服务器，等待进行中的请求完成...")
+    finally:
+        httpd.server_close()
+        flushed = httpd.book_store.close()
+        httpd.edit_journal.close()
+        if flushed:
+            print(f"💾 已写回: {', '.join(flushed)}")
+        print("服务器已停止")
+
+def parse_args():
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='圣经学习服务器')
+    parser.add_argument('--port', type=int, default=8001, help='监听端口（默认8001）')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'同时处理的请求数上限，1为单线程（默认{DEFAULT_WORKERS}）')
+    parser.add_argument('--keep-alive', type=int, default=DEFAULT_KEEP_ALIVE,
+                        help=f'keep-alive空闲超时秒数，0为关闭（默认{DEFAULT_KEEP_ALIVE}）')
+    parser.add_argument('--flush-interval', type=float, default=DEFAULT_FLUSH_INTERVAL,
+                        help=f'修改写回磁盘的间隔秒数（默认{DEFAULT_FLUSH_INTERVAL}）')
+    return parser.parse_args()
 
 if __name__ == '__main__':
-    run_server()
\ No newline at end of file
+    args = parse_args()
+    run_server(args.port, args.workers, args.keep_alive, args.flush_interval)
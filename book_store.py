@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+常驻内存的书卷存储 - 延迟批量写回
+Resident book store with write-behind persistence
+
+每卷书只从 data/{book}.json 读取一次，并用 VerseIndex 建立 (章, 节) 索引，
+编辑在内存中 O(1) 完成；被修改的书卷由后台线程定时批量写回，
+或在关闭时写回，写入采用“临时文件 + 重命名”保证原子性。
+"""
+
+import json
+import os
+import tempfile
+import threading
+
+from scripture_reference import END_OF_CHAPTER
+from verse_index import VerseIndex
+
+
+class BookEntry:
+    """单卷书的内存数据"""
+
+    def __init__(self, book_id, path, data):
+        self.book_id = book_id
+        self.path = path
+        self.data = data
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()  # 串行化写盘，避免旧快照覆盖新快照
+        self.index = VerseIndex()
+        self.reindex()
+
+    def reindex(self):
+        """重建经文索引"""
+        self.index = VerseIndex()
+        if self.index.add_book(self.book_id, self.data.setdefault('verses', [])):
+            print(f"⚠️  {self.book_id} 有重复经文，只使用第一条: "
+                  f"{self.index.duplicate_summary(self.book_id)}")
+
+    def add_verse(self, verse_data):
+        """追加一节新经文并更新索引"""
+        self.data['verses'].append(verse_data)
+        self.index.add(self.book_id, verse_data)
+
+    def get_verse(self, chapter, verse):
+        """按章节取经文，不存在时返回 None"""
+        return self.index.get(self.book_id, chapter, verse)
+
+
+class BookStore:
+    """书卷存储：按需加载、内存编辑、定时写回"""
+
+    def __init__(self, data_dir='data', flush_interval=2.0, before_flush=None):
+        self.data_dir = data_dir
+        self.flush_interval = flush_interval
+        self.before_flush = before_flush  # 写回前调用（如先让编辑日志落盘）
+        self._books = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def book_path(self, book_id):
+        """书卷JSON文件路径"""
+        return os.path.join(self.data_dir, f"{book_id}.json")
+
+    def get_book(self, book_id):
+        """取得书卷（首次访问时从磁盘加载），文件不存在时抛出 FileNotFoundError"""
+        entry = self._books.get(book_id)
+        if entry is not None:
+            return entry
+        if not book_id or os.sep in book_id or '/' in book_id or book_id.startswith('.'):
+            raise FileNotFoundError(f"Invalid book id: {book_id}")
+        with self._lock:
+            entry = self._books.get(book_id)
+            if entry is None:
+                path = self.book_path(book_id)
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = BookEntry(book_id, path, json.load(f))
+                self._books[book_id] = entry
+        return entry
+
+    def update_verse(self, book_id, chapter, verse, text):
+        """更新一节经文（不存在则追加），返回修改前的文本"""
+        return self.update_verses(book_id, [(chapter, verse, text)])[0]
+
+    def update_verses(self, book_id, edits):
+        """在同一卷书中一次应用多处修改 [(章, 节, 文本), ...]，返回各节修改前的文本"""
+        entry = self.get_book(book_id)
+        old_texts = []
+        with entry.lock:
+            for chapter, verse, text in edits:
+                verse_data = entry.get_verse(chapter, verse)
+                if verse_data is None:
+                    old_texts.append(None)
+                    entry.add_verse({
+                        'chapter': chapter,
+                        'verse': verse,
+                        'text': text,
+                        'zh': text
+                    })
+                else:
+                    old_texts.append(verse_data.get('zh', verse_data.get('text')))
+                    verse_data['text'] = text
+                    verse_data['zh'] = text  # 同时更新zh字段
+            if edits:
+                entry.dirty = True
+        return old_texts
+
+    def get_ranges(self, book_id, ranges):
+        """按 VerseRange 列表取经文（支持跨章），返回 (找到的经文列表, 缺失的章节列表)
+
+        只有单章内的明确范围能判断缺失的节（整章、跨章范围不报告缺失）。
+        """
+        entry = self.get_book(book_id)
+        found, missing = [], []
+        with entry.lock:
+            for start, end in ranges:
+                verses = entry.index.range(book_id, start, end)
+                found.extend(dict(v) for v in verses)
+                if start[0] == end[0] and end[1] != END_OF_CHAPTER:
+                    present = {v['verse'] for v in verses}
+                    missing.extend((start[0], v) for v in range(start[1], end[1] + 1)
+                                   if v not in present)
+        return found, missing
+
+    def is_dirty(self, book_id):
+        """书卷是否有尚未写回的修改"""
+        entry = self._books.get(book_id)
+        return entry is not None and entry.dirty
+
+    def flush(self, book_id=None):
+        """把有修改的书卷写回磁盘，返回写回的书卷列表"""
+        if book_id is not None:
+            entries = [self._books[book_id]] if book_id in self._books else []
+        else:
+            entries = list(self._books.values())
+
+        if self.before_flush is not None and any(e.dirty for e in entries):
+            self.before_flush()
+
+        flushed = []
+        for entry in entries:
+            with entry.write_lock:
+                with entry.lock:
+                    if not entry.dirty:
+                        continue
+                    content = json.dumps(entry.data, ensure_ascii=False, indent=2)
+                    entry.dirty = False
+                try:
+                    atomic_write_text(entry.path, content)
+                except OSError:
+                    entry.dirty = True
+                    raise
+            flushed.append(entry.book_id)
+        return flushed
+
+    def _flush_loop(self):
+        """后台定时写回线程"""
+        while not self._stop.wait(self.flush_interval):
+            try:
+                books = self.flush()
+                if books:
+                    print(f"💾 已写回: {', '.join(books)}")
+            except OSError as e:
+                print(f"❌ 写回失败: {str(e)}")
+
+    def start(self):
+        """启动后台写回线程"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._flush_loop,
+                                            name='book-store-flush', daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """停止后台线程并写回所有修改"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.flush()
+
+
+def atomic_write_text(path, content):
+    """先写同目录临时文件再重命名，避免写到一半的文件被读到"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+增量构建清单
+Build manifest for incremental static-site generation
+
+记录每个输出文件的输入哈希（页面内容、上一页/下一页等渲染参数，再加上模板哈希）。
+输入没变且输出文件仍在时跳过渲染，只重新生成真正受影响的页面。
+
+用法:
+    manifest = BuildManifest('romans/.build_manifest.json', salt=file_hash(__file__))
+    if not manifest.is_current(path, inputs):
+        ...生成 path...
+        manifest.mark_built(path, inputs)
+    manifest.save()
+"""
+
+import hashlib
+import json
+import os
+
+from book_store import atomic_write_text
+
+MANIFEST_VERSION = 1
+
+
+def content_hash(data):
+    """JSON数据的稳定哈希"""
+    text = json.dumps(data, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def file_hash(path):
+    """文件内容的哈希，文件不存在时为 None"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class BuildManifest:
+    """输出文件 -> 输入哈希 的清单"""
+
+    def __init__(self, path, salt='', force=False):
+        """salt 通常是模板（生成脚本本身）的哈希，模板变化时所有页面都会重新生成"""
+        self.path = path
+        self.salt = salt
+        self.force = force
+        self.previous = {} if force else self._load()
+        self.entries = {}
+        self.built = 0
+        self.skipped = 0
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}
+        return manifest.get('files', {})
+
+    def key(self, inputs):
+        return content_hash([self.salt, inputs])
+
+    def is_current(self, output_path, inputs):
+        """输入与上次构建相同且输出文件存在时返回 True（并计为跳过）
+
+        同一次构建中重复写同一个文件时（后写的覆盖先写的）总是返回 False，保证最终内容正确。
+        """
+        output_path = str(output_path)
+        if output_path in self.entries:
+            return False
+        key = self.key(inputs)
+        if self.previous.get(output_path) == key and os.path.exists(output_path):
+            self.entries[output_path] = key
+            self.skipped += 1
+            return True
+        return False
+
+    def mark_built(self, output_path, inputs):
+        """记录刚生成的输出文件"""
+        self.entries[str(output_path)] = self.key(inputs)
+        self.built += 1
+
+    def save(self):
+        """保存清单（只保留本次构建涉及的输出文件）"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        content = json.dumps({'version': MANIFEST_VERSION, 'files': self.entries},
+                             ensure_ascii=False, indent=2, sort_keys=True)
+        atomic_write_text(self.path, content)
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+经文编辑日志 - 只追加的 JSON-lines 文件
+Append-only edit journal for verse edits
+
+每次保存经文追加一行记录（时间、书卷、章节、旧文本、新文本），
+取代过去每次编辑都新建一个 backup_original/data/{book}_{章}_{节}_edited.json 的做法。
+fsync 按批进行（满 batch_size 条或超过 fsync_interval 秒），
+支持回放、把书卷恢复到某一时间点，以及压缩日志。
+
+服务器运行期间持有日志旁的锁文件（{日志}.lock）。restore、compact、import-legacy
+会改写日志或书卷文件，运行前必须拿到同一把锁；服务器在运行时命令行工具直接拒绝，
+避免替换掉服务器正在追加的文件、或被服务器下一次写回覆盖。
+
+用法:
+    python3 edit_journal.py history luke [--verse 1:3]
+    python3 edit_journal.py restore luke 2026-10-17T12:00:00
+    python3 edit_journal.py compact [--before 2026-10-01T00:00:00]
+    python3 edit_journal.py import-legacy
+"""
+
+import argparse
+import glob
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from book_store import atomic_write_text
+
+DEFAULT_JOURNAL = 'backup_original/edit_journal.jsonl'
+
+
+def now_timestamp():
+    """当前时间戳（固定微秒精度，保证按字符串比较即按时间比较）"""
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+def normalize_timestamp(ts):
+    """把用户输入的时间统一成日志中的时间格式"""
+    return datetime.fromisoformat(ts).isoformat(timespec='microseconds')
+
+
+class JournalLockedError(RuntimeError):
+    """日志正被另一个进程（通常是运行中的服务器）独占"""
+
+
+class EditJournal:
+    """只追加的编辑日志"""
+
+    def __init__(self, path=DEFAULT_JOURNAL, batch_size=32, fsync_interval=1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._lock_file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    @property
+    def lock_path(self):
+        return self.path + '.lock'
+
+    def acquire_lock(self):
+        """独占日志（非阻塞），直到 close()；已被其他进程持有时抛出 JournalLockedError"""
+        if self._lock_file is not None:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        lock_file = open(self.lock_path, 'a+')
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            raise JournalLockedError(f"编辑日志正在被其他进程使用: {self.lock_path}")
+        self._lock_file = lock_file
+
+    def _release_lock(self):
+        if self._lock_file is None:
+            return
+        # 关闭文件即释放锁；锁文件本身保留，避免删除时与其他进程竞争
+        if fcntl is None:
+            self._lock_file.seek(0)
+            msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._lock_file.close()
+        self._lock_file = None
+
+    def _open(self):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return self._file
+
+    def append(self, book, chapter, verse, old_text, new_text, timestamp=None):
+        """追加一条编辑记录，返回写入的记录"""
+        record = {
+            'ts': timestamp or now_timestamp(),
+            'book': book,
+            'chapter': chapter,
+            'verse': verse,
+            'old_text': old_text,
+            'new_text': new_text
+        }
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            f = self._open()
+            f.write(line)
+            f.flush()
+            self._pending += 1
+            if (self._pending >= self.batch_size or
+                    time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync_locked()
+        return record
+
+    def _sync_locked(self):
+        if self._file is not None and self._pending:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """把尚未落盘的记录 fsync 到磁盘"""
+        with self._lock:
+            self._sync_locked()
+
+    def close(self):
+        """落盘并关闭日志文件，释放独占锁"""
+        with self._lock:
+            self._sync_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._release_lock()
+
+    def replay(self, book=None, since=None, until=None):
+        """按写入顺序回放记录，可按书卷和时间范围 [since, until] 过滤"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+        for record in self._read_all():
+            if book is not None and record['book'] != book:
+                continue
+            if since is not None and record['ts'] < since:
+                continue
+            if until is not None and record['ts'] > until:
+                continue
+            yield record
+
+    def restore(self, book, book_data, until):
+        """把书卷数据（当前状态）回退到 until 时刻，返回撤销的记录数
+
+        按时间倒序撤销 until 之后的编辑：恢复旧文本，
+        对当时新增的经文（old_text 为 None）则删除。
+        压缩过的时间段只能整体撤销。
+        恢复本身也作为编辑记入日志（当前文本 -> 恢复后的文本，被删除的经文 new_text 为 None），
+        日志始终是完整的历史，之后仍可恢复到恢复前的任一时刻。
+        """
+        later = [r for r in self.replay(book=book) if r['ts'] > until]
+        if not later:
+            return 0
+
+        verses = book_data.setdefault('verses', [])
+        index = {}
+        for verse_data in verses:
+            # 与 VerseIndex 一致：重复的章节使用第一条
+            index.setdefault((verse_data['chapter'], verse_data['verse']), verse_data)
+        touched = sorted({(r['chapter'], r['verse']) for r in later})
+        current = {key: index[key].get('zh', index[key].get('text')) if key in index else None
+                   for key in touched}
+
+        removed = set()
+        for record in reversed(later):
+            key = (record['chapter'], record['verse'])
+            if record['old_text'] is None:
+                index.pop(key, None)
+                removed.add(key)
+                continue
+            verse_data = index.get(key)
+            if verse_data is None:
+                verse_data = {'chapter': key[0], 'verse': key[1]}
+                verses.append(verse_data)
+                index[key] = verse_data
+                removed.discard(key)
+            verse_data['text'] = record['old_text']
+            verse_data['zh'] = record['old_text']
+        if removed:
+            book_data['verses'] = [v for v in verses
+                                   if (v['chapter'], v['verse']) not in removed]
+
+        restored_at = now_timestamp()
+        for key in touched:
+            restored = index[key]['zh'] if key in index else None
+            if restored != current[key]:
+                self.append(book, key[0], key[1], current[key], restored, timestamp=restored_at)
+        self.sync()
+        return len(later)
+
+    def compact(self, before=None):
+        """压缩日志：before 之前的记录对同一节只保留一条净变化（最早旧文本 -> 最新新文本）
+
+        返回 (压缩前条数, 压缩后条数)。日志文件会被替换，调用前应先 acquire_lock()。
+        """
+        with self._lock:
+            self._sync_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            records = list(self._read_all())
+            merged = {}
+            kept = []
+            for record in records:
+                if before is not None and record['ts'] >= before:
+                    kept.append(record)
+                    continue
+                key = (record['book'], record['chapter'], record['verse'])
+                if key in merged:
+                    first = merged[key]
+                    first['ts'] = record['ts']
+                    first['new_text'] = record['new_text']
+                else:
+                    merged[key] = dict(record)
+            # 净变化为“无变化”的记录直接丢弃
+            compacted = [r for r in merged.values() if r['old_text'] != r['new_text']]
+            compacted.sort(key=lambda r: r['ts'])
+            compacted.extend(kept)
+            content = ''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in compacted)
+            if records:
+                atomic_write_text(self.path, content)
+        return len(records), len(compacted)
+
+    def _read_all(self):
+        """读取全部记录；崩溃时可能留下的半行会被跳过"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+
+def import_legacy_backups(journal, backup_dir='backup_original/data', remove=False):
+    """把旧的 {book}_{章}_{节}_edited.json 单条备份导入日志，返回导入条数"""
+    legacy = []
+    for path in glob.glob(os.path.join(backup_dir, '*_edited.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            legacy.append((path, json.load(f)))
+    legacy.sort(key=lambda item: item[1].get('timestamp', ''))
+    for path, data in legacy:
+        ts = data.get('timestamp')
+        journal.append(data['book'], data['chapter'], data['verse'],
+                       data.get('old_text') or None, data['new_text'],
+                       timestamp=normalize_timestamp(ts) if ts else None)
+    journal.sync()
+    if remove:
+        for path, _ in legacy:
+            os.remove(path)
+    return len(legacy)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='经文编辑日志工具')
+    parser.add_argument('--journal', default=DEFAULT_JOURNAL, help='日志文件路径')
+    parser.add_argument('--data-dir', default='data', help='书卷JSON目录')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('history', help='查看编辑历史')
+    p.add_argument('book')
+    p.add_argument('--verse', help='只看某一节，如 3:16')
+
+    p = sub.add_parser('restore', help='把书卷恢复到某一时间点')
+    p.add_argument('book')
+    p.add_argument('until', help='ISO时间，如 2026-10-17T12:00:00')
+
+    p = sub.add_parser('compact', help='压缩日志')
+    p.add_argument('--before', help='只压缩该时间之前的记录')
+
+    p = sub.add_parser('import-legacy', help='导入旧的单条备份文件')
+    p.add_argument('--remove', action='store_true', help='导入后删除旧文件')
+
+    args = parser.parse_args()
+    journal = EditJournal(args.journal)
+
+    if args.command != 'history':
+        # 会改写日志或书卷文件：服务器运行时拒绝执行
+        try:
+            journal.acquire_lock()
+        except JournalLockedError as e:
+            print(f"❌ {e}")
+            print("   服务器运行期间不能执行此命令，请先停止服务器（bible_server.py）")
+            raise SystemExit(1)
+
+    if args.command == 'history':
+        chapter_verse = None
+        if args.verse:
+            c, v = args.verse.split(':')
+            chapter_verse = (int(c), int(v))
+        for r in journal.replay(book=args.book):
+            if chapter_verse and (r['chapter'], r['verse']) != chapter_verse:
+                continue
+            print(f"{r['ts']}  {r['book']} {r['chapter']}:{r['verse']}  "
+                  f"{(r['old_text'] or '')[:20]} -> {(r['new_text'] or '（删除）')[:20]}")
+
+    elif args.command == 'restore':
+        path = os.path.join(args.data_dir, f"{args.book}.json")
+        with open(path, 'r', encoding='utf-8') as f:
+            book_data = json.load(f)
+        count = journal.restore(args.book, book_data, normalize_timestamp(args.until))
+        if count:
+            atomic_write_text(path, json.dumps(book_data, ensure_ascii=False, indent=2))
+        print(f"✓ 已撤销 {count} 条编辑，{args.book} 恢复到 {args.until}（恢复已记入日志）")
+
+    elif args.command == 'compact':
+        before = normalize_timestamp(args.before) if args.before else None
+        old_count, new_count = journal.compact(before)
+        print(f"✓ 日志压缩完成: {old_count} 条 -> {new_count} 条")
+
+    elif args.command == 'import-legacy':
+        count = import_legacy_backups(journal, remove=args.remove)
+        print(f"✓ 已导入 {count} 条旧备份")
+
+    journal.close()
+
+
+if __name__ == "__main__":
+    main()
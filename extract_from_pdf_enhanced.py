@@ -4,32 +4,22 @@
 从PDF直接提取一对一课程内容，去除页码，生成JSON和HTML
 """
 
-import PyPDF2
 import re
 import json
 import os
 
+from pdf_page_cache import page_texts
+
 def extract_pdf_content(pdf_path):
     """从PDF提取文本内容"""
     print(f"正在读取PDF: {pdf_path}")
     
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
-        total_pages = len(pdf_reader.pages)
-        
-        print(f"总页数: {total_pages}")
-        
-        text_content = []
-        for page_num in range(total_pages):
-            page = pdf_reader.pages[page_num]
-            text = page.extract_text()
-            text_content.append(text)
-            
-            if (page_num + 1) % 10 == 0:
-                print(f"  已处理 {page_num + 1}/{total_pages} 页...")
-        
-        print("PDF读取完成！")
-        return '\n'.join(text_content)
+    # 逐页文本来自缓存，首次运行时才用 PyPDF2 解析
+    text_content = page_texts(pdf_path, backend='pypdf2')
+    print(f"总页数: {len(text_content)}")
+    
+    print("PDF读取完成！")
+    return '\n'.join(text or '' for text in text_content)
 
 def remove_page_numbers(text):
     """去除页码"""
@@ -8,11 +8,27 @@
 3. 7课一对一内容（第6页开始）
 """
 
-import pdfplumber
+import argparse
+import itertools
 import json
-import re
 import os
-from typing import Dict, List, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Any, Tuple
+
+import pdf_page_cache
+import scripture_scanner
+
+def extract_page_range(pdf_path: str, start: int, end: int) -> List[Dict[str, Any]]:
+    """提取 [start, end) 范围内的页面（在工作进程中运行，只有缓存未命中的页才打开PDF）"""
+    pages = []
+    for i, text in enumerate(pdf_page_cache.page_texts(pdf_path, start=start, end=end), start):
+        if text:
+            pages.append({
+                "page_num": i + 1,
+                "content": text.strip(),
+                "lines": [line.strip() for line in text.split('\n') if line.strip()]
+            })
+    return pages
 
 class One2OneCompleteExtractor:
     def __init__(self, pdf_path: str = "一对一（大字版）.pdf"):
@@ -23,29 +39,45 @@ class One2OneCompleteExtractor:
         # 确保目录存在
         os.makedirs(self.data_dir, exist_ok=True)
         
-        # 经文引用正则模式
-        self.verse_pattern = re.compile(r'([一二三约翰马太马可路加使徒行传罗马哥林多加拉太以弗所腓立比歌罗西帖撒罗尼迦提摩太提多腓利门希伯来雅各彼得犹大启示录创世记出埃及记利未记民数记申命记约书亚记士师记路得记撒母耳塞缪尔列王历代志以斯拉尼希米以斯帖约伯诗篇箴言传道书雅歌以赛亚耶利米哀歌以西结但以理何西阿约珥阿摩司俄巴底亚约拿弥迦那鸿哈巴谷西番雅哈该撒迦利亚玛拉基]+(?:福音|书|记|篇)*\\s*\\d+:\\d+(?:[-,]\\d+)*)', re.UNICODE)
-        
-    def extract_all_pages(self) -> List[Dict[str, Any]]:
-        """提取所有页面内容"""
-        print(f"🔍 开始提取PDF所有内容: {self.pdf_path}")
+        # 经文引用扫描器（书名自动机 + 章节状态机，单遍扫描）
+        self.scanner = scripture_scanner.default_scanner()
         
-        pages = []
+    def page_count(self) -> int:
+        """PDF总页数"""
+        return pdf_page_cache.page_count(self.pdf_path)
+    
+    def iter_pages(self, jobs: int = 1, chunk_size: int = 0) -> Iterator[Dict[str, Any]]:
+        """按页码顺序逐页产出页面内容
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for i, page in enumerate(pdf.pages):
-                text = page.extract_text()
-                if text:
-                    print(f"📄 提取第{i+1}页...")
-                    pages.append({
-                        "page_num": i + 1,
-                        "content": text.strip(),
-                        "lines": [line.strip() for line in text.split('\\n') if line.strip()]
-                    })
+        jobs > 1 时把页码范围分片交给进程池并行提取，结果仍按页码顺序产出，
+        调用方可以在后面的页还在提取时就开始处理前面的页。
+        """
+        print(f"🔍 开始提取PDF所有内容: {self.pdf_path}")
         
-        return pages
+        total = self.page_count()
+        if jobs <= 1:
+            for page in extract_page_range(self.pdf_path, 0, total):
+                print(f"📄 提取第{page['page_num']}页...")
+                yield page
+            return
+        
+        # 分片比进程数多几倍，使前面的页尽早可用、各进程负载均衡
+        if chunk_size <= 0:
+            chunk_size = max(1, -(-total // (jobs * 4)))
+        ranges = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(extract_page_range, self.pdf_path, start, end)
+                       for start, end in ranges]
+            for (start, end), future in zip(ranges, futures):
+                print(f"📄 提取第{start + 1}-{end}页...")
+                yield from future.result()
     
-    def extract_preface_story(self, pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def extract_all_pages(self, jobs: int = 1) -> List[Dict[str, Any]]:
+        """提取所有页面内容"""
+        return list(self.iter_pages(jobs))
+    
+    def extract_preface_story(self, pages: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
         """提取前言故事（第2-3页）"""
         print("📖 提取前言故事...")
         
@@ -53,6 +85,8 @@ class One2OneCompleteExtractor:
         
         # 从第2页开始，到第4页"开始作门徒"之前
         for page in pages:
+            if page["page_num"] > 3:
+                break  # 页面按顺序到达，后面的页不再需要
             if page["page_num"] >= 2 and page["page_num"] <= 3:
                 content = page["content"]
                 lines = page["lines"]
@@ -73,13 +107,13 @@ class One2OneCompleteExtractor:
         # 构建前言数据
         preface_data = {
             "title": "前言 - 一对一的故事",
-            "content": '\\n'.join(preface_content),
+            "content": '\n'.join(preface_content),
             "type": "preface"
         }
         
         return preface_data
     
-    def extract_five_steps(self, pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def extract_five_steps(self, pages: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
         """提取带门徒5个步骤（第4-5页）"""
         print("📚 提取带门徒5个步骤...")
         
@@ -87,6 +121,8 @@ class One2OneCompleteExtractor:
         
         # 从第4页"开始作门徒"开始，到第6页之前
         for page in pages:
+            if page["page_num"] > 5:
+                break  # 页面按顺序到达，后面的页不再需要
             if page["page_num"] >= 4 and page["page_num"] <= 5:
                 content = page["content"]
                 lines = page["lines"]
@@ -104,7 +140,7 @@ class One2OneCompleteExtractor:
                             steps_content.append(line)
         
         # 查找经文
-        content_text = '\\n'.join(steps_content)
+        content_text = '\n'.join(steps_content)
         verses = self.extract_verses_from_text(content_text)
         
         # 处理经文填空
@@ -129,7 +165,7 @@ class One2OneCompleteExtractor:
         
         return steps_data
     
-    def extract_seven_lessons(self, pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def extract_seven_lessons(self, pages: Iterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """提取7课一对一内容（第6页开始）"""
         print("📑 提取7课一对一内容...")
         
@@ -184,7 +220,7 @@ class One2OneCompleteExtractor:
     
     def process_lesson_content(self, chapter_info: Dict[str, Any], content_lines: List[str]) -> Dict[str, Any]:
         """处理单个课程内容"""
-        content_text = '\\n'.join(content_lines)
+        content_text = '\n'.join(content_lines)
         
         # 提取经文
         verses = self.extract_verses_from_text(content_text)
@@ -214,49 +250,40 @@ class One2OneCompleteExtractor:
         return lesson_data
     
     def extract_verses_from_text(self, text: str) -> List[Dict[str, str]]:
-        """从文本中提取经文引用"""
+        """从文本中提取经文引用（一次扫描得到所有引用及其上下文）"""
         verses = []
+        seen = set()
         
-        # 查找经文引用模式
-        verse_matches = self.verse_pattern.findall(text)
-        
-        for verse_ref in set(verse_matches):  # 去重
-            verse_context = self.find_verse_context(text, verse_ref)
+        for match in self.scanner.scan(text, context_lines=3):
+            if match.reference in seen:  # 去重，保留第一次出现
+                continue
+            seen.add(match.reference)
+            verse_context = self.find_verse_context(match)
             if verse_context and len(verse_context) > 15:
                 verses.append({
-                    "reference": verse_ref,
+                    "reference": match.reference,
                     "text": verse_context,
                     "original": verse_context
                 })
         
         return verses
     
-    def find_verse_context(self, text: str, verse_ref: str) -> str:
-        """找到经文引用的上下文内容"""
-        lines = text.split('\\n')
-        
-        for i, line in enumerate(lines):
-            if verse_ref in line:
-                # 查找经文内容
-                context_lines = []
-                
-                # 检查前后几行
-                start = max(0, i - 3)
-                end = min(len(lines), i + 4)
-                
-                for j in range(start, end):
-                    context_line = lines[j].strip()
-                    if (context_line and 
-                        not context_line.isdigit() and 
-                        len(context_line) > 10 and
-                        verse_ref not in context_line):  # 排除引用行本身
-                        context_lines.append(context_line)
-                
-                if context_lines:
-                    # 返回最长的合理经文
-                    longest = max(context_lines, key=len)
-                    if len(longest) > 20:
-                        return longest
+    def find_verse_context(self, match: scripture_scanner.ScriptureMatch) -> str:
+        """从引用前后几行中找出经文内容"""
+        context_lines = []
+        for context_line in match.context:
+            context_line = context_line.strip()
+            if (context_line and 
+                not context_line.isdigit() and 
+                len(context_line) > 10 and
+                match.reference not in context_line):  # 排除引用行本身
+                context_lines.append(context_line)
+        
+        if context_lines:
+            # 返回最长的合理经文
+            longest = max(context_lines, key=len)
+            if len(longest) > 20:
+                return longest
         
         return ""
     
@@ -451,6 +478,15 @@ class One2OneCompleteExtractor:
             </div>
             '''
         
+        # 经文练习区（没有经文时省略）
+        practice_html = f'''
+        <section class="content-section">
+            <h2 class="section-title">✏️ 经文练习</h2>
+            <p class="practice-intro">通过填空练习来加深对重要经文的理解。</p>
+            {verses_html}
+        </section>
+        ''' if verses_html else ''
+        
         html_content = f'''<!DOCTYPE html>
 <html lang="zh-CN">
 <head>
@@ -675,13 +711,7 @@ class One2OneCompleteExtractor:
             <div class="original-content">{formatted_content}</div>
         </section>
         
-        """ + (f'''
-        <section class="content-section">
-            <h2 class="section-title">✏️ 经文练习</h2>
-            <p class="practice-intro">通过填空练习来加深对重要经文的理解。</p>
-            {verses_html}
-        </section>
-        ''' if verses_html else '') + """
+        {practice_html}
         
         <div class="navigation">
             <a href="preface.html" class="nav-btn">⬅️ 前言</a>
@@ -812,6 +842,14 @@ class One2OneCompleteExtractor:
         prev_link = "steps.html" if chapter_num == 1 else f"one2one_C{chapter_num-1}.html"
         next_link = f"one2one_C{chapter_num+1}.html" if chapter_num < 7 else "index.html"
         
+        # 经文练习区（没有经文时省略）
+        practice_html = f'''
+        <section class="content-section">
+            <h2 class="section-title">✏️ 经文练习</h2>
+            {verses_html}
+        </section>
+        ''' if verses_html else ''
+        
         # 这里使用与steps_html类似的HTML模板，但调整导航和内容
         html_content = f'''<!DOCTYPE html>
 <html lang="zh-CN">
@@ -864,12 +902,7 @@ class One2OneCompleteExtractor:
             <div class="original-content">{formatted_content}</div>
         </section>
         
-        {f'''
-        <section class="content-section">
-            <h2 class="section-title">✏️ 经文练习</h2>
-            {verses_html}
-        </section>
-        ''' if verses_html else ''}
+        {practice_html}
         
         <div class="navigation">
             <a href="{prev_link}" class="nav-btn">⬅️ 上一课</a>
@@ -893,7 +926,7 @@ class One2OneCompleteExtractor:
     
     def format_content_html(self, content: str) -> str:
         """格式化内容为HTML"""
-        lines = content.split('\\n')
+        lines = content.split('\n')
         formatted_lines = []
         
         for line in lines:
@@ -901,18 +934,26 @@ class One2OneCompleteExtractor:
             if not line:
                 continue
             
-            # 突出显示经文引用
-            line = self.verse_pattern.sub(r'<strong style="color: #2b6cb0;">\\1</strong>', line)
-            
-            # 突出显示重要概念
-            important_words = ['耶稣', '基督', '神', '主', '拯救', '得救', '信心', '爱', '真理']
-            for word in important_words:
-                line = line.replace(word, f'<span style="color: #2d3748; font-weight: 600;">{word}</span>')
+            # 按扫描器给出的偏移切分：经文引用加粗，其余文字中突出显示重要概念
+            parts = []
+            pos = 0
+            for match in self.scanner.scan(line, context_lines=0):
+                parts.append(self.highlight_words(line[pos:match.start]))
+                parts.append(f'<strong style="color: #2b6cb0;">{line[match.start:match.end]}</strong>')
+                pos = match.end
+            parts.append(self.highlight_words(line[pos:]))
             
-            formatted_lines.append(line)
+            formatted_lines.append(''.join(parts))
         
         return '<br><br>'.join(formatted_lines)
     
+    def highlight_words(self, text: str) -> str:
+        """突出显示重要概念"""
+        important_words = ['耶稣', '基督', '神', '主', '拯救', '得救', '信心', '爱', '真理']
+        for word in important_words:
+            text = text.replace(word, f'<span style="color: #2d3748; font-weight: 600;">{word}</span>')
+        return text
+    
     def create_blanks_html(self, verse_data: Dict[str, Any], verse_id: str) -> str:
         """将经文文本转换为带填空的HTML"""
         text = verse_data["text"]
@@ -939,20 +980,26 @@ class One2OneCompleteExtractor:
 
 def main():
     """主函数"""
-    print("🚀 开始完整提取一对一PDF内容...")
+    parser = argparse.ArgumentParser(description='一对一门徒训练完整内容提取')
+    parser.add_argument('--pdf', default="一对一（大字版）.pdf", help='PDF文件路径')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='并行提取的进程数，1为串行（默认为CPU核数）')
+    args = parser.parse_args()
     
-    extractor = One2OneCompleteExtractor()
+    print("🚀 开始完整提取一对一PDF内容...")
     
-    # 提取所有页面
-    all_pages = extractor.extract_all_pages()
+    extractor = One2OneCompleteExtractor(args.pdf)
     
-    if not all_pages:
+    if extractor.page_count() == 0:
         print("❌ 无法提取PDF内容")
         return
     
+    # 按页流式提取，三个步骤各自消费同一页面流（前两步读到所需页后即停止）
+    preface_pages, steps_pages, lesson_pages = itertools.tee(extractor.iter_pages(args.jobs), 3)
+    
     # 1. 提取前言故事
-    print("\\n📖 1. 处理前言故事...")
-    preface_data = extractor.extract_preface_story(all_pages)
+    print("\n📖 1. 处理前言故事...")
+    preface_data = extractor.extract_preface_story(preface_pages)
     
     # 保存前言数据和HTML
     preface_json = os.path.join(extractor.data_dir, "preface.json")
@@ -967,8 +1014,8 @@ def main():
     print(f"✅ 前言页面生成完成: {preface_file}")
     
     # 2. 提取5个步骤
-    print("\\n📚 2. 处理带门徒5个步骤...")
-    steps_data = extractor.extract_five_steps(all_pages)
+    print("\n📚 2. 处理带门徒5个步骤...")
+    steps_data = extractor.extract_five_steps(steps_pages)
     
     # 保存步骤数据和HTML
     steps_json = os.path.join(extractor.data_dir, "steps.json")
@@ -984,8 +1031,8 @@ def main():
     print(f"   经文数量: {len(steps_data['key_verses'])} 个")
     
     # 3. 提取7课内容
-    print("\\n📑 3. 处理7课一对一内容...")
-    lessons = extractor.extract_seven_lessons(all_pages)
+    print("\n📑 3. 处理7课一对一内容...")
+    lessons = extractor.extract_seven_lessons(lesson_pages)
     
     print(f"📚 找到 {len(lessons)} 课内容")
     
@@ -1009,11 +1056,11 @@ def main():
         print(f"   经文数量: {len(lesson['key_verses'])} 个")
     
     # 4. 更新主页导航
-    print("\\n🔗 4. 更新主页导航...")
+    print("\n🔗 4. 更新主页导航...")
     update_main_index(lessons)
     
-    print("\\n🎉 一对一完整内容提取完成！")
-    print("\\n📋 生成的页面:")
+    print("\n🎉 一对一完整内容提取完成！")
+    print("\n📋 生成的页面:")
     print("   📖 前言故事: preface.html")  
     print("   📚 五个步骤: steps.html")
     print("   📑 七课内容: one2one_C1.html ~ one2one_C7.html")
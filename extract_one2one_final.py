@@ -7,7 +7,7 @@
 3. 七课一对一内容 (page 6+)
 """
 
-import pdfplumber
+from pdf_page_cache import open_pdf
 import os
 import re
 import json
@@ -40,7 +40,7 @@ def extract_pdf_content():
         'lessons': {}
     }
     
-    with pdfplumber.open(pdf_file) as pdf:
+    with open_pdf(pdf_file) as pdf:
         print(f"📖 开始处理PDF文件，共 {len(pdf.pages)} 页")
         
         # 前言 - 页面 2-3
@@ -4,7 +4,7 @@
 正确处理段落、圣经经文和页面布局
 """
 
-import pdfplumber
+from pdf_page_cache import open_pdf
 import os
 import re
 from pathlib import Path
@@ -52,7 +52,7 @@ def extract_pdf_content_structured():
         'lessons': {}
     }
     
-    with pdfplumber.open(pdf_file) as pdf:
+    with open_pdf(pdf_file) as pdf:
         print(f"📖 开始结构化处理PDF文件，共 {len(pdf.pages)} 页")
         
         # 提取前言部分（页面4-7）
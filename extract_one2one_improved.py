@@ -6,7 +6,7 @@
 只将经文部分转换为可填空的交互式测试
 """
 
-import pdfplumber
+from pdf_page_cache import open_pdf
 import json
 import re
 import os
@@ -30,7 +30,7 @@ class One2OneRealExtractor:
         
         all_text = []
         
-        with pdfplumber.open(self.pdf_path) as pdf:
+        with open_pdf(self.pdf_path) as pdf:
             for i, page in enumerate(pdf.pages):
                 text = page.extract_text()
                 if text:
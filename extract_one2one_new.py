@@ -4,7 +4,7 @@
 专门处理新的PDF格式，正确识别章节结构
 """
 
-import pdfplumber
+from pdf_page_cache import open_pdf
 import os
 import re
 import json
@@ -68,7 +68,7 @@ def extract_pdf_content():
         'lessons': {}
     }
     
-    with pdfplumber.open(pdf_file) as pdf:
+    with open_pdf(pdf_file) as pdf:
         print(f"📖 开始处理新PDF文件，共 {len(pdf.pages)} 页")
         
         all_text = ""
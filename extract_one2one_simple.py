@@ -5,7 +5,7 @@
 先提取基本内容，然后逐步生成HTML页面
 """
 
-import pdfplumber
+from pdf_page_cache import open_pdf
 import json
 import re
 import os
@@ -15,7 +15,7 @@ def extract_pdf_pages(pdf_path="一对一（大字版）.pdf"):
     print(f"🔍 开始提取PDF内容: {pdf_path}")
     
     pages = []
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         for i, page in enumerate(pdf.pages):
             text = page.extract_text()
             if text:
@@ -5,7 +5,7 @@
 从PDF中提取完整的课程内容，保持段落格式和结构
 """
 
-import pdfplumber
+from pdf_page_cache import open_pdf
 import re
 import json
 from pathlib import Path
@@ -28,7 +28,7 @@ def extract_pdf_text_with_structure():
     
     print("📖 开始解析一对一PDF文件...")
     
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         total_pages = len(pdf.pages)
         print(f"总页数: {total_pages}")
         
@@ -6,10 +6,33 @@
 2. 修复错误换行
 3. 统一经文标记格式
 4. 修复嵌套错误
+
+每个修复步骤都是逐行处理的生成器，四个步骤串成流水线，
+章节文件只读一遍、边处理边写出，内存占用与段落长度有关而与章节大小无关；
+处理结束后输出每个步骤的耗时和行数。
+各章互相独立，--jobs N 时用进程池并行处理，每章的备份和写入都是原子的。
+
+用法:
+    python3 fix_all_issues.py [--jobs 4]
 """
 
+import argparse
+import contextlib
+import filecmp
+import io
 import re
 import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+CJK_PUNCTUATION = '，。！？；：、'
+
+
+def is_cjk(ch):
+    return '\u4e00' <= ch <= '\u9fff'
+
 
 class RomansContentFixer:
     def __init__(self):
@@ -21,23 +44,66 @@ class RomansContentFixer:
             'scripture_marks': 0,
             'nested_errors': 0
         }
+        # 每个流水线步骤的累计耗时（含上游）与产出行数
+        self.stage_stats = {}
     
-    def backup_files(self):
-        """备份原始文件"""
-        import shutil
-        if not os.path.exists(self.backup_dir):
-            os.makedirs(self.backup_dir)
-            for i in range(1, 17):
-                src = os.path.join(self.chapters_dir, f"chapter_{i:02d}.txt")
-                dst = os.path.join(self.backup_dir, f"chapter_{i:02d}.txt")
-                if os.path.exists(src):
-                    shutil.copy2(src, dst)
-            print("✓ 已备份所有章节文件到", self.backup_dir)
+    def backup_chapter(self, chapter_num):
+        """备份一章原始文件（已有备份时保留最早的版本），先复制到临时文件再重命名"""
+        src = os.path.join(self.chapters_dir, f"chapter_{chapter_num:02d}.txt")
+        dst = os.path.join(self.backup_dir, f"chapter_{chapter_num:02d}.txt")
+        if not os.path.exists(src) or os.path.exists(dst):
+            return False
+        os.makedirs(self.backup_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.backup_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            shutil.copy2(src, tmp_path)
+            os.replace(tmp_path, dst)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        print(f"  ✓ 已备份到 {dst}")
+        return True
     
-    def fix_extra_spaces(self, text):
-        """修复多余空格"""
-        original = text
-        
+    def fix_extra_spaces(self, lines):
+        """修复多余空格
+
+        空格和换行的清理会跨行合并被PDF截断的句子，所以先把可能被合并的相邻行
+        （上一行以中文字或中文标点结尾）攒成一段，再对整段做正则替换。
+        """
+        changed = False
+        newlines = 0
+        paragraph = None
+        for line in lines:
+            if paragraph is None:
+                paragraph = line
+                continue
+            tail = paragraph.rstrip()
+            head = line.lstrip()
+            if tail and head and (tail[-1] in CJK_PUNCTUATION or
+                                  (is_cjk(tail[-1]) and is_cjk(head[0]))):
+                paragraph += '\n' + line
+                continue
+            if not head:
+                # 空行本身也可能被合并掉，留在段内
+                paragraph += '\n' + line
+                continue
+            fixed = self._fix_paragraph_spaces(paragraph)
+            changed = changed or fixed != paragraph
+            newlines += fixed.count('\n') + 1
+            yield from fixed.split('\n')
+            paragraph = line
+        if paragraph is not None:
+            fixed = self._fix_paragraph_spaces(paragraph)
+            changed = changed or fixed != paragraph
+            newlines += fixed.count('\n')
+            yield from fixed.split('\n')
+        
+        if changed:
+            self.fix_count['extra_spaces'] += newlines
+    
+    def _fix_paragraph_spaces(self, text):
+        """对一段文本做空格修复"""
         # 1. 移除中文字符间的多余空格(保留句子间的空格)
         # 匹配: 中文字符 + 空格 + 中文字符
         text = re.sub(r'([\u4e00-\u9fff])\s+([\u4e00-\u9fff])', r'\1\2', text)
@@ -60,45 +126,34 @@ class RomansContentFixer:
         text = '\n'.join(fixed_lines)
         
         # 5. 多个连续空格变为单个空格
-        text = re.sub(r'  +', ' ', text)
-        
-        if text != original:
-            self.fix_count['extra_spaces'] += text.count('\n')
-        
-        return text
+        return re.sub(r'  +', ' ', text)
     
-    def fix_line_breaks(self, text):
+    def fix_line_breaks(self, lines):
         """修复错误换行"""
-        original = text
-        lines = text.split('\n')
-        fixed_lines = []
-        i = 0
+        lines = iter(lines)
+        current = next(lines, None)
         
-        while i < len(lines):
-            line = lines[i].strip()
+        while current is not None:
+            line = current.strip()
+            following = next(lines, None)
             
             # 跳过空行
             if not line:
-                fixed_lines.append('')
-                i += 1
-                continue
-            
-            # 跳过标题行(数字开头)
-            if re.match(r'^\d+\.?\s+', line):
-                fixed_lines.append(lines[i])
-                i += 1
+                yield ''
+                current = following
                 continue
             
-            # 跳过经文标记行
-            if '{{scripture}}' in line or '{{/scripture}}' in line:
-                fixed_lines.append(lines[i])
-                i += 1
+            # 跳过标题行(数字开头)、经文标记行
+            if (re.match(r'^\d+\.?\s+', line) or
+                    '{{scripture}}' in line or '{{/scripture}}' in line):
+                yield current
+                current = following
                 continue
             
             # 检查是否是被错误截断的行
             # 如果行尾没有标点符号,且下一行不是标题/空行,则合并
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
+            if following is not None:
+                next_line = following.strip()
                 
                 # 如果当前行没有结束标点,且下一行不是新段落
                 if (not re.search(r'[。！？；：]$', line) and 
@@ -108,100 +163,113 @@ class RomansContentFixer:
                     len(line) > 20):  # 只合并较长的行
                     
                     # 合并行
-                    merged = line + next_line
-                    fixed_lines.append(merged)
-                    i += 2
+                    yield line + next_line
                     self.fix_count['line_breaks'] += 1
+                    current = next(lines, None)
                     continue
             
-            fixed_lines.append(lines[i])
-            i += 1
-        
-        return '\n'.join(fixed_lines)
+            yield current
+            current = following
+    
+    # 模式1: (书卷名 章:节)
+    SCRIPTURE_PATTERN = re.compile(r'\(([^)]*?书|[^)]*?音|约翰一书|约翰二书|约翰三书|犹大书)\s*\d+[:：]\d+[^)]*?\)')
     
-    def fix_scripture_marks(self, text):
+    def fix_scripture_marks(self, lines):
         """统一经文标记格式"""
-        original = text
-        
-        # 1. 修复 {{inline-scripture}} 标记
-        # 标准格式: "经文内容" {{inline-scripture}}(引用){{/inline-scripture}}
-        
-        # 先移除所有 inline-scripture 标记,重新识别
-        text = re.sub(r'\{\{inline-scripture\}\}', '', text)
-        text = re.sub(r'\{\{/inline-scripture\}\}', '', text)
-        
-        # 2. 识别经文引用模式并添加标记
-        # 模式1: (书卷名 章:节)
-        scripture_pattern = r'\(([^)]*?书|[^)]*?音|约翰一书|约翰二书|约翰三书|犹大书)\s*\d+[:：]\d+[^)]*?\)'
-        
-        def mark_scripture(match):
-            ref = match.group(0)
-            return f'{{{{scripture-ref}}}}{ref}{{{{/scripture-ref}}}}'
-        
-        text = re.sub(scripture_pattern, mark_scripture, text)
-        self.fix_count['scripture_marks'] += len(re.findall(scripture_pattern, original))
-        
-        # 3. 识别完整经文块
-        # 模式: 引号开始的长句 + 经文引用
-        lines = text.split('\n')
-        in_scripture_block = False
-        scripture_buffer = []
-        fixed_lines = []
-        
-        for line in lines:
-            stripped = line.strip()
+        for chunk in join_open_parentheses(lines):
+            original = chunk
             
-            # 检测经文块开始
-            if (stripped.startswith('"') or stripped.startswith('"')) and '{{scripture-ref}}' in line:
-                # 这是一个完整的经文块
-                # 格式: {{scripture}}"经文内容" (引用){{/scripture}}
-                # 提取引号中的内容和引用
-                quote_match = re.search(r'["""](.+?)["""](.+)', stripped)
-                if quote_match:
-                    verse_text = quote_match.group(1)
-                    reference = quote_match.group(2)
-                    fixed_line = f'{{{{scripture}}}}"{verse_text}" {reference}{{{{/scripture}}}}'
-                    fixed_lines.append(fixed_line)
-                else:
-                    fixed_lines.append(line)
-            else:
-                fixed_lines.append(line)
-        
-        return '\n'.join(fixed_lines)
+            # 1. 修复 {{inline-scripture}} 标记
+            # 标准格式: "经文内容" {{inline-scripture}}(引用){{/inline-scripture}}
+            
+            # 先移除所有 inline-scripture 标记,重新识别
+            chunk = chunk.replace('{{inline-scripture}}', '').replace('{{/inline-scripture}}', '')
+            
+            # 2. 识别经文引用模式并添加标记
+            chunk = self.SCRIPTURE_PATTERN.sub(
+                lambda match: f'{{{{scripture-ref}}}}{match.group(0)}{{{{/scripture-ref}}}}', chunk)
+            self.fix_count['scripture_marks'] += len(self.SCRIPTURE_PATTERN.findall(original))
+            
+            # 3. 识别完整经文块
+            # 模式: 引号开始的长句 + 经文引用
+            for line in chunk.split('\n'):
+                stripped = line.strip()
+                
+                # 检测经文块开始
+                if (stripped.startswith('"') or stripped.startswith('"')) and '{{scripture-ref}}' in line:
+                    # 这是一个完整的经文块
+                    # 格式: {{scripture}}"经文内容" (引用){{/scripture}}
+                    # 提取引号中的内容和引用
+                    quote_match = re.search(r'["""](.+?)["""](.+)', stripped)
+                    if quote_match:
+                        verse_text = quote_match.group(1)
+                        reference = quote_match.group(2)
+                        line = f'{{{{scripture}}}}"{verse_text}" {reference}{{{{/scripture}}}}'
+                
+                yield line
     
-    def fix_nested_errors(self, text):
+    def fix_nested_errors(self, lines):
         """修复嵌套错误"""
-        original = text
+        open_count = close_count = 0
+        open_ref_count = close_ref_count = 0
         
-        # 1. 移除错误的嵌套标记
-        # 检测: {{scripture}}...{{scripture}}...{{/scripture}}{{/scripture}}
-        
-        # 简单的修复策略: 移除内层重复的标记
-        text = re.sub(r'\{\{scripture\}\}(\s*)\{\{scripture\}\}', r'{{\1scripture}}', text)
-        text = re.sub(r'\{\{/scripture\}\}(\s*)\{\{/scripture\}\}', r'{{\1/scripture}}', text)
+        for line in lines:
+            # 1. 移除错误的嵌套标记
+            # 检测: {{scripture}}...{{scripture}}...{{/scripture}}{{/scripture}}
+            
+            # 简单的修复策略: 移除内层重复的标记
+            line = re.sub(r'\{\{scripture\}\}(\s*)\{\{scripture\}\}', r'{{\1scripture}}', line)
+            line = re.sub(r'\{\{/scripture\}\}(\s*)\{\{/scripture\}\}', r'{{\1/scripture}}', line)
+            
+            # 2. 统计开始和结束标记数量（整章读完后再检查）
+            open_count += line.count('{{scripture}}')
+            close_count += line.count('{{/scripture}}')
+            open_ref_count += line.count('{{scripture-ref}}')
+            close_ref_count += line.count('{{/scripture-ref}}')
+            
+            # 4. 移除直接写在文本中的标记文本
+            # 有时候标记本身被当作文本输出了
+            line = re.sub(r'(?<!\{)\{\{scripture\}\}(?!\{)', '', line)
+            line = re.sub(r'(?<!\})\{\{/scripture\}\}(?!\})', '', line)
+            
+            yield line
         
         # 2. 修复未闭合的标记
-        # 统计开始和结束标记数量
-        open_count = text.count('{{scripture}}')
-        close_count = text.count('{{/scripture}}')
-        
         if open_count != close_count:
             print(f"  ⚠️  警告: scripture标记不匹配 (开始:{open_count}, 结束:{close_count})")
             self.fix_count['nested_errors'] += abs(open_count - close_count)
         
         # 3. 修复 scripture-ref 嵌套
-        open_ref_count = text.count('{{scripture-ref}}')
-        close_ref_count = text.count('{{/scripture-ref}}')
-        
         if open_ref_count != close_ref_count:
             print(f"  ⚠️  警告: scripture-ref标记不匹配 (开始:{open_ref_count}, 结束:{close_ref_count})")
-        
-        # 4. 移除直接写在文本中的标记文本
-        # 有时候标记本身被当作文本输出了
-        text = re.sub(r'(?<!\{)\{\{scripture\}\}(?!\{)', '', text)
-        text = re.sub(r'(?<!\})\{\{/scripture\}\}(?!\})', '', text)
-        
-        return text
+    
+    # 流水线步骤: (fix_count 键名, 显示名称)
+    STAGES = [
+        ('extra_spaces', '修复多余空格'),
+        ('line_breaks', '修复错误换行'),
+        ('scripture_marks', '统一经文标记'),
+        ('nested_errors', '修复嵌套错误'),
+    ]
+    
+    def _measure(self, key, lines):
+        """记录从该步骤取每一行所花的时间（含上游步骤）和产出行数"""
+        stats = self.stage_stats.setdefault(key, {'seconds': 0.0, 'lines': 0})
+        lines = iter(lines)
+        while True:
+            start = time.perf_counter()
+            line = next(lines, None)
+            stats['seconds'] += time.perf_counter() - start
+            if line is None:
+                return
+            stats['lines'] += 1
+            yield line
+    
+    def pipeline(self, lines):
+        """把所有修复步骤串成一条逐行流水线"""
+        stream = self._measure('read', lines)
+        for key, _ in self.STAGES:
+            stream = self._measure(key, getattr(self, f'fix_{key}')(stream))
+        return stream
     
     def process_chapter(self, chapter_num):
         """处理单个章节"""
@@ -211,47 +279,64 @@ class RomansContentFixer:
             return
         
         print(f"\n处理章节 {chapter_num}: {chapter_file}")
-        
-        # 读取文件
-        with open(chapter_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # 应用所有修复
-        print("  → 修复多余空格...")
-        content = self.fix_extra_spaces(content)
-        
-        print("  → 修复错误换行...")
-        content = self.fix_line_breaks(content)
-        
-        print("  → 统一经文标记...")
-        content = self.fix_scripture_marks(content)
-        
-        print("  → 修复嵌套错误...")
-        content = self.fix_nested_errors(content)
-        
-        # 保存修复后的文件
-        if content != original_content:
-            with open(chapter_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print("  ✓ 已保存修复")
-        else:
-            print("  ✓ 无需修复")
+        self.backup_chapter(chapter_num)
+        
+        # 逐行读取、修复并写入临时文件
+        fd, tmp_path = tempfile.mkstemp(dir=self.chapters_dir, suffix='.tmp')
+        try:
+            with open(chapter_file, 'r', encoding='utf-8') as src, \
+                    os.fdopen(fd, 'w', encoding='utf-8') as dst:
+                for i, line in enumerate(self.pipeline(read_lines(src))):
+                    if i:
+                        dst.write('\n')
+                    dst.write(line)
+            
+            # 保存修复后的文件
+            if not filecmp.cmp(tmp_path, chapter_file, shallow=False):
+                os.replace(tmp_path, chapter_file)
+                print("  ✓ 已保存修复")
+            else:
+                print("  ✓ 无需修复")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def print_stage_stats(self):
+        """输出每个步骤的耗时（扣除上游步骤）和产出行数"""
+        print(f"⏱️  各步骤耗时:")
+        upstream = 0.0
+        for key, label in [('read', '读取文件')] + self.STAGES:
+            stats = self.stage_stats.get(key, {'seconds': 0.0, 'lines': 0})
+            own = stats['seconds'] - upstream
+            upstream = stats['seconds']
+            print(f"  - {label}: {own * 1000:.1f} ms, 输出 {stats['lines']} 行")
+    
+    def merge_stats(self, fix_count, stage_stats):
+        """合并工作进程返回的统计"""
+        for key, count in fix_count.items():
+            self.fix_count[key] += count
+        for key, stats in stage_stats.items():
+            total = self.stage_stats.setdefault(key, {'seconds': 0.0, 'lines': 0})
+            total['seconds'] += stats['seconds']
+            total['lines'] += stats['lines']
     
-    def fix_all_chapters(self):
-        """修复所有章节"""
+    def fix_all_chapters(self, jobs=1):
+        """修复所有章节（jobs > 1 时并行处理）"""
         print("=" * 60)
         print("开始修复罗马书16章内容")
         print("=" * 60)
         
-        # 备份
-        self.backup_files()
-        print()
-        
-        # 处理每章
-        for i in range(1, 17):
-            self.process_chapter(i)
+        # 处理每章（处理前先备份该章）
+        if jobs <= 1:
+            for i in range(1, 17):
+                self.process_chapter(i)
+        else:
+            print(f"⚡ 使用 {jobs} 个进程并行处理")
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                # 按章节顺序输出各章的日志
+                for output, fix_count, stage_stats in executor.map(fix_chapter, range(1, 17)):
+                    print(output, end='')
+                    self.merge_stats(fix_count, stage_stats)
         
         print()
         print("=" * 60)
@@ -263,9 +348,53 @@ class RomansContentFixer:
         print(f"  - 添加经文标记: {self.fix_count['scripture_marks']} 处")
         print(f"  - 修复嵌套错误: {self.fix_count['nested_errors']} 处")
         print()
+        self.print_stage_stats()
+        print()
         print(f"💾 备份位置: {self.backup_dir}/")
         print()
 
+
+def fix_chapter(chapter_num):
+    """在工作进程中修复一章，返回 (日志输出, fix_count, stage_stats)"""
+    fixer = RomansContentFixer()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        fixer.process_chapter(chapter_num)
+    return output.getvalue(), fixer.fix_count, fixer.stage_stats
+
+
+def join_open_parentheses(lines, max_lines=5):
+    """把括号未闭合的行与后续行合成一块（经文引用可能被换行拆开，如 "(罗马书\\n1:2)"）
+
+    一块最多 max_lines 行，避免多余的左括号让整章都积在内存里。
+    """
+    chunk = None
+    count = 0
+    for line in lines:
+        chunk = line if chunk is None else chunk + '\n' + line
+        count += 1
+        if chunk.rfind('(') <= chunk.rfind(')') or count >= max_lines:
+            yield chunk
+            chunk = None
+            count = 0
+    if chunk is not None:
+        yield chunk
+
+
+def read_lines(f):
+    """逐行读取文件（去掉换行符；以换行结尾的文件最后产出一个空行，与 split('\\n') 一致）"""
+    line = ''
+    for line in f:
+        yield line[:-1] if line.endswith('\n') else line
+    if line.endswith('\n') or not line:
+        yield ''
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='罗马书内容综合修复')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='并行处理的进程数（默认1，0表示使用全部CPU核心）')
+    args = parser.parse_args()
+    
     fixer = RomansContentFixer()
-    fixer.fix_all_chapters()
+    fixer.fix_all_chapters(jobs=args.jobs if args.jobs > 0 else os.cpu_count())
@@ -9,6 +9,8 @@ import json
 import os
 from datetime import datetime
 
+from verse_index import VerseIndex
+
 def create_backup(filename):
     """创建备份文件"""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -45,24 +47,21 @@ def save_luke_data(verses_data):
     with open('data/luke.json', 'w', encoding='utf-8') as f:
         json.dump(full_data, f, ensure_ascii=False, indent=2)
 
-def find_verse(data, chapter, verse):
+def find_verse(index, chapter, verse):
     """查找指定的经文"""
-    for item in data:
-        if item.get('chapter') == chapter and item.get('verse') == verse:
-            return item
-    return None
+    return index.get('luke', chapter, verse)
 
-def update_verse(data, chapter, verse, new_zh_text):
+def update_verse(index, chapter, verse, new_zh_text):
     """更新经文的中文文本"""
-    for item in data:
-        if item.get('chapter') == chapter and item.get('verse') == verse:
-            old_text = item.get('zh', '')
-            item['zh'] = new_zh_text
-            print(f"✏️  更新 路加福音 {chapter}:{verse}")
-            print(f"   原文: {old_text[:50]}...")
-            print(f"   新文: {new_zh_text[:50]}...")
-            return True
-    return False
+    item = find_verse(index, chapter, verse)
+    if item is None:
+        return False
+    old_text = item.get('zh', '')
+    item['zh'] = new_zh_text
+    print(f"✏️  更新 路加福音 {chapter}:{verse}")
+    print(f"   原文: {old_text[:50]}...")
+    print(f"   新文: {new_zh_text[:50]}...")
+    return True
 
 def main():
     """主修正流程"""
@@ -71,8 +70,11 @@ def main():
     # 创建备份
     create_backup('data/luke.json')
     
-    # 加载数据
+    # 加载数据并建立索引（索引引用原数据，更新会直接写入 data）
     data = load_luke_data()
+    index = VerseIndex()
+    if index.add_book('luke', data):
+        print(f"⚠️  路加福音有重复经文，只修正第一条: {index.duplicate_summary('luke')}")
     
     # 修正项目列表 - 按照中文和合本标准
     corrections = [
@@ -123,7 +125,7 @@ def main():
     # 执行修正
     total_corrections = 0
     for correction in corrections:
-        if update_verse(data, correction['chapter'], correction['verse'], correction['zh']):
+        if update_verse(index, correction['chapter'], correction['verse'], correction['zh']):
             total_corrections += 1
     
     # 保存数据
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+foundation 页面补丁引擎
+一次读入每个 foundation_L*_S*.html，按顺序应用已注册的补丁，只在内容变化时写回。
+
+各补丁脚本（更新JS提示.py、更新检查函数.py ...）只提供 内容 -> 新内容 的转换函数，
+并以 PATCH 注册；PATCH_MODULES 决定它们的应用顺序。
+已应用的补丁ID记录在 .page_patches.json（连同补丁后的页面哈希），
+再次运行时跳过已应用的补丁；页面被重新生成或手工修改后哈希不同，所有补丁重新检查。
+读取数据文件的补丁（如按答案数据更新页面）用 inputs 声明这些文件，清单同时记录它们的哈希，
+数据变化后（如 查看缺失经文.py 补全了答案）这些补丁重新检查。
+不同页面之间互相独立，--jobs N 时用进程池并行处理。
+
+用法:
+    python3 page_patcher.py [--jobs 4] [--only js-messages,placeholders] [--force]
+
+编写补丁:
+    PATCH = page_patcher.Patch('js-messages', '更新JS提示消息', update_js_messages, lessons(1, 3))
+    PATCH = page_patcher.Patch('placeholders', '...', update_placeholders, inputs=answer_file)
+"""
+
+import argparse
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+FOUNDATION_DIR = Path(__file__).resolve().parent
+PAGE_GLOB = 'foundation_L*_S*.html'
+MANIFEST_FILE = FOUNDATION_DIR / '.page_patches.json'
+
+# 补丁脚本，按应用顺序排列
+PATCH_MODULES = [
+    '更新检查函数',
+    '修复检查函数',
+    '修复成绩统计',
+    '更新成绩统计显示',
+    '更新占位符',
+    '更新JS提示',
+    '更新手机端样式',
+    '动态调整文本框v2',
+    '接入评分接口',
+    '添加导出进度',
+]
+
+Patch = namedtuple('Patch', ['patch_id', 'description', 'apply', 'pages', 'inputs'])
+Patch.__new__.__defaults__ = (None, None)
+Patch.__doc__ = ('页面补丁：ID、说明、apply(content, page) -> 新内容、'
+                 'pages(页面文件名) -> 是否处理（None 表示所有页面）、'
+                 'inputs(page) -> 补丁读取的数据文件列表（None 表示只依赖页面本身）')
+
+_PAGE_NAME_RE = re.compile(r'foundation_L(\d+)_S(\d+)\.html$')
+
+
+def page_lesson_section(name):
+    """从页面文件名取 (课, 节)，不是课程页面时返回 None"""
+    match = _PAGE_NAME_RE.match(name)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def lessons(first, last, exclude=()):
+    """页面筛选：只处理第 first-last 课（exclude 中的文件除外）"""
+    def matches(name):
+        lesson_section = page_lesson_section(name)
+        return (lesson_section is not None and first <= lesson_section[0] <= last
+                and name not in exclude)
+    return matches
+
+
+def only_pages(*names):
+    """页面筛选：只处理列出的文件"""
+    names = frozenset(names)
+    return lambda name: name in names
+
+
+def answer_file(page):
+    """补丁输入：页面对应的答案数据 data/answers/{页面}.json"""
+    return [FOUNDATION_DIR / 'data' / 'answers' / (Path(page).stem + '.json')]
+
+
+def load_patches(module_names=PATCH_MODULES):
+    """导入补丁脚本，按顺序返回它们的 PATCH"""
+    if str(FOUNDATION_DIR) not in sys.path:
+        sys.path.insert(0, str(FOUNDATION_DIR))
+    return [importlib.import_module(name).PATCH for name in module_names]
+
+
+def _content_hash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _inputs_hash(patch, page):
+    """补丁读取的数据文件的哈希（不存在的文件也计入），没有声明 inputs 时返回 None"""
+    if patch.inputs is None:
+        return None
+    digest = hashlib.sha256()
+    for path in patch.inputs(page):
+        digest.update(f"{Path(path).name}\n".encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except FileNotFoundError:
+            digest.update(b'missing')
+    return digest.hexdigest()
+
+
+def patch_page(task):
+    """对一个页面应用补丁（进程池的工作函数）
+
+    返回 (文件名, 日志, 本次改动页面的补丁ID, 新的清单记录)。
+    """
+    page, module_names, patch_ids, record = task
+    page = Path(page)
+    patches = [patch for patch in load_patches(module_names) if patch.patch_id in patch_ids]
+
+    with open(page, 'r', encoding='utf-8') as f:
+        original = f.read()
+    if record and record['hash'] == _content_hash(original):
+        applied = set(record['applied'])
+        inputs = dict(record.get('inputs', {}))
+    else:
+        applied, inputs = set(), {}
+
+    content = original
+    changed_by = []
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for patch in patches:
+            if patch.pages and not patch.pages(page.name):
+                continue
+            inputs_hash = _inputs_hash(patch, page)
+            if patch.patch_id in applied and inputs.get(patch.patch_id) == inputs_hash:
+                continue
+            applied.discard(patch.patch_id)
+            try:
+                new_content = patch.apply(content, page)
+            except Exception as e:
+                print(f"  ❌ {patch.patch_id} 出错: {e}")
+                continue
+            if new_content != content:
+                changed_by.append(patch.patch_id)
+                content = new_content
+            applied.add(patch.patch_id)
+            if inputs_hash is None:
+                inputs.pop(patch.patch_id, None)
+            else:
+                inputs[patch.patch_id] = inputs_hash
+
+    if content != original:
+        tmp_path = page.with_name(page.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, page)
+
+    return page.name, output.getvalue(), changed_by, {
+        'hash': _content_hash(content), 'applied': sorted(applied), 'inputs': inputs}
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest):
+    tmp_path = MANIFEST_FILE.with_name(MANIFEST_FILE.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_FILE)
+
+
+def run(module_names=PATCH_MODULES, only=None, jobs=1, force=False):
+    """对所有页面应用补丁；only 为要应用的补丁ID集合（None 表示全部），force 时忽略已应用记录"""
+    patches = load_patches(module_names)
+    patch_ids = tuple(patch.patch_id for patch in patches if not only or patch.patch_id in only)
+    manifest = {} if force else load_manifest()
+    pages = sorted(FOUNDATION_DIR.glob(PAGE_GLOB))
+
+    print(f"🔧 应用 {len(patch_ids)} 个补丁到 {len(pages)} 个页面")
+    for patch in patches:
+        if patch.patch_id in patch_ids:
+            print(f"   - {patch.patch_id}: {patch.description}")
+    print("=" * 60)
+
+    tasks = [(str(page), tuple(module_names), patch_ids, manifest.get(page.name)) for page in pages]
+    updated_count = 0
+    if jobs <= 1:
+        results = map(patch_page, tasks)
+    else:
+        print(f"⚡ 使用 {jobs} 个进程并行处理")
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        results = executor.map(patch_page, tasks)
+    try:
+        # 按页面顺序输出日志
+        for name, output, changed_by, record in results:
+            manifest[name] = record
+            if changed_by:
+                updated_count += 1
+                print(f"✅ {name}: {', '.join(changed_by)}")
+            else:
+                print(f"➡️  {name}: 无需更新")
+            if output:
+                print(output, end='')
+    finally:
+        if jobs > 1:
+            executor.shutdown()
+
+    save_manifest(manifest)
+    print("=" * 60)
+    print(f"完成！共更新了 {updated_count} 个HTML文件")
+    return updated_count
+
+
+def main(module_names=PATCH_MODULES):
+    parser = argparse.ArgumentParser(description='foundation 页面补丁引擎')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='并行处理的进程数（默认1，0表示使用全部CPU核心）')
+    parser.add_argument('--only', help='只应用这些补丁（逗号分隔的补丁ID）')
+    parser.add_argument('--force', action='store_true', help='忽略已应用记录，重新检查所有补丁')
+    args = parser.parse_args()
+    run(module_names,
+        only=set(args.only.split(',')) if args.only else None,
+        jobs=args.jobs if args.jobs > 0 else os.cpu_count(),
+        force=args.force)
+
+
+if __name__ == '__main__':
+    main()
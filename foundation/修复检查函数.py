@@ -4,19 +4,14 @@
 修复被损坏的checkAnswers函数
 """
 
-import os
 import re
 from pathlib import Path
 
-def restore_check_answers_function(html_file):
-    """恢复并修复HTML文件中的checkAnswers函数"""
-    
-    # 读取HTML文件
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 正确的checkAnswers函数
-    correct_function = '''        // 检查答案
+import page_patcher
+from 更新检查函数 import NEW_FUNCTION_MARKER
+
+# 正确的checkAnswers函数
+CORRECT_FUNCTION = '''        // 检查答案
         async function checkAnswers() {
             await loadStandardAnswers();
             
@@ -103,73 +98,52 @@ def restore_check_answers_function(html_file):
         }
 
         // 提交成绩'''
+
+# 更精确的匹配模式 - 找到损坏的函数并用正确的替换
+# 匹配从 "// 检查答案" 开始到下一个函数声明
+CHECK_ANSWERS_PATTERN = re.compile(
+    r'(\s+)// 检查答案[^}]*async function checkAnswers\(\)[^}]*\}[^}]*\}[^}]*\}[^/]*(?=\s*//\s*提交成绩)', re.DOTALL)
+# 如果找不到，尝试更宽松的模式
+LOOSE_PATTERN = re.compile(
+    r'(\s+)async function checkAnswers\(\)[^}]*\}[^}]*\}[^}]*\}.*?(?=\s*async function submitAnswers|//\s*提交成绩)', re.DOTALL)
+
+def restore_check_answers_function(content, page):
+    """恢复并修复HTML文件中的checkAnswers函数"""
+    # 函数完好时宽松模式也能匹配，再替换一次会重复插入 "// 提交成绩"
+    if NEW_FUNCTION_MARKER in content:
+        return content
     
-    # 更精确的匹配模式 - 找到损坏的函数并用正确的替换
-    # 匹配从 "// 检查答案" 开始到下一个函数声明
-    pattern = r'(\s+)// 检查答案[^}]*async function checkAnswers\(\)[^}]*\}[^}]*\}[^}]*\}[^/]*(?=\s*//\s*提交成绩)'
-    
-    match = re.search(pattern, content, re.DOTALL)
+    match = CHECK_ANSWERS_PATTERN.search(content)
     if match:
-        indent = match.group(1)
-        new_content = content[:match.start()] + correct_function + content[match.end():]
-    else:
-        # 如果找不到，尝试更宽松的模式
-        pattern2 = r'(\s+)async function checkAnswers\(\)[^}]*\}[^}]*\}[^}]*\}.*?(?=\s*async function submitAnswers|//\s*提交成绩)'
-        match = re.search(pattern2, content, re.DOTALL)
-        if match:
-            # 保留缩进，替换函数
-            lines = correct_function.split('\n')
-            indented_function = '\n'.join([match.group(1) + line.lstrip() if line.strip() else line for line in lines])
-            new_content = content[:match.start()] + indented_function + content[match.end():]
-        else:
-            print(f"  ⚠️  无法找到checkAnswers函数模式")
-            return False
+        return content[:match.start()] + CORRECT_FUNCTION + content[match.end():]
     
-    # 写回文件
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    match = LOOSE_PATTERN.search(content)
+    if match:
+        # 保留缩进，替换函数
+        lines = CORRECT_FUNCTION.split('\n')
+        indented_function = '\n'.join([match.group(1) + line.lstrip() if line.strip() else line for line in lines])
+        return content[:match.start()] + indented_function + content[match.end():]
     
-    return True
+    print(f"  ⚠️  无法找到checkAnswers函数模式")
+    return content
 
-def main():
-    """主函数"""
-    foundation_dir = Path(__file__).parent
-    
-    # 处理已更新的文件
-    problem_files = [
-        'foundation_L1_S1.html',
-        'foundation_L1_S2.html', 
-        'foundation_L1_S3.html',
-        'foundation_L1_S4.html',
-        'foundation_L1_S5.html',
-        'foundation_L2_S1.html',
-        'foundation_L2_S2.html',
-        'foundation_L2_S3.html',
-        'foundation_L2_S4.html',
-        'foundation_L3_S1.html',
-        'foundation_L3_S2.html',
-        'foundation_L3_S3.html',
-        'foundation_L3_S4.html'
-    ]
-    
-    print("开始修复被损坏的checkAnswers函数...")
-    print(f"需要修复 {len(problem_files)} 个文件\n")
-    
-    fixed_count = 0
-    for filename in problem_files:
-        html_file = foundation_dir / filename
-        if html_file.exists():
-            print(f"修复: {filename}")
-            if restore_check_answers_function(html_file):
-                print(f"  ✅ 已修复")
-                fixed_count += 1
-            else:
-                print(f"  ❌ 修复失败")
-            print()
-        else:
-            print(f"跳过: {filename} (文件不存在)")
-    
-    print(f"\n完成！共修复了 {fixed_count} 个HTML文件")
+# 被损坏的文件
+PATCH = page_patcher.Patch('check-answers-restore', '修复被损坏的checkAnswers函数',
+                           restore_check_answers_function,
+                           page_patcher.only_pages(
+                               'foundation_L1_S1.html',
+                               'foundation_L1_S2.html',
+                               'foundation_L1_S3.html',
+                               'foundation_L1_S4.html',
+                               'foundation_L1_S5.html',
+                               'foundation_L2_S1.html',
+                               'foundation_L2_S2.html',
+                               'foundation_L2_S3.html',
+                               'foundation_L2_S4.html',
+                               'foundation_L3_S1.html',
+                               'foundation_L3_S2.html',
+                               'foundation_L3_S3.html',
+                               'foundation_L3_S4.html'))
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    page_patcher.main([Path(__file__).stem])
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+让页面的检查答案和提交成绩使用服务器的评分接口
+checkAnswers/submitAnswers 先把本节所有答案一次提交到 /api/grade，取回每道题的相似度；
+静态托管（没有评分接口）或服务器没有某题的标准答案时，仍在本地计算。
+本地的 calculateSimilarity 改为只保留一行状态的LCS，不再分配整张 (n+1)×(m+1) 的表。
+"""
+
+import re
+from pathlib import Path
+
+import page_patcher
+
+# 注入的函数，{page_key} 为页面的存储键
+GRADE_FUNCTIONS = '''
+
+        // 评分接口：本节所有答案一次提交到服务器的 /api/grade，返回 答案键 -> 相似度；
+        // 静态托管（没有评分接口）时返回空对象，由 answerSimilarity 在本地计算
+        async function fetchServerGrades() {
+            const answers = [];
+            document.querySelectorAll('.answer-input').forEach(input => {
+                const ref = input.dataset.reference;
+                if (ref && input.dataset.hasAnswer === 'true') {
+                    answers.push({ key: `q${input.dataset.question}_${ref}`, answer: input.value.trim() });
+                }
+            });
+
+            const grades = {};
+            if (answers.length === 0) {
+                return grades;
+            }
+            try {
+                const response = await fetch('/api/grade', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ page: '{page_key}', answers: answers })
+                });
+                if (response.ok) {
+                    ((await response.json()).results || []).forEach(result => {
+                        if (result.key && typeof result.similarity === 'number') {
+                            grades[result.key] = result.similarity;
+                        }
+                    });
+                }
+            } catch (e) {
+                console.log('评分接口不可用，使用本地评分');
+            }
+            return grades;
+        }
+
+        // 一道题的相似度：优先使用服务器的评分，没有时在本地计算
+        function answerSimilarity(grades, answerKey, userAnswer, standardAnswer) {
+            if (answerKey in grades) {
+                return grades[answerKey];
+            }
+            return calculateSimilarity(userAnswer, standardAnswer);
+        }'''
+
+CALCULATE_SIMILARITY = '''function calculateSimilarity(text1, text2) {
+            const clean1 = text1.replace(/[\\s\\.,;:!?，。；：！？、""''（）【】《》]/g, '');
+            const clean2 = text2.replace(/[\\s\\.,;:!?，。；：！？、""''（）【】《》]/g, '');
+
+            if (!clean1 || !clean2) return 0;
+
+            const shorter = clean1.length < clean2.length ? clean1 : clean2;
+            const longer = clean1.length < clean2.length ? clean2 : clean1;
+
+            // 最长公共子序列：只保留一行状态（长度为较短文本+1）
+            const row = new Uint32Array(shorter.length + 1);
+            for (let j = 0; j < longer.length; j++) {
+                let diagonal = 0;  // 上一行的 row[i-1]
+                for (let i = 1; i <= shorter.length; i++) {
+                    const above = row[i];
+                    if (shorter[i-1] === longer[j]) {
+                        row[i] = diagonal + 1;
+                    } else if (row[i-1] > above) {
+                        row[i] = row[i-1];
+                    }
+                    diagonal = above;
+                }
+            }
+
+            return row[shorter.length] / longer.length;
+        }'''
+
+# 已接入评分接口的标记
+MARKER = 'async function fetchServerGrades()'
+
+LOAD_ANSWERS_PATTERN = re.compile(r'^([ \t]*)await loadStandardAnswers\(\);', re.MULTILINE)
+LOCAL_SIMILARITY_CALL = 'calculateSimilarity(userAnswer, standardAnswer)'
+SERVER_SIMILARITY_CALL = 'answerSimilarity(serverGrades, answerKey, userAnswer, standardAnswer)'
+
+
+def find_function(content, name):
+    """函数 name 的位置：(声明的开始, 函数体右花括号之后)，找不到时返回 None"""
+    match = re.search(rf'(?:async\s+)?function {name}\(', content)
+    if not match:
+        return None
+    depth = 0
+    for i in range(content.index('{', match.end()), len(content)):
+        if content[i] == '{':
+            depth += 1
+        elif content[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return match.start(), i + 1
+    return None
+
+
+def use_server_grades(function_code):
+    """在函数中先取服务器评分，再用它代替本地的相似度计算"""
+    function_code = LOAD_ANSWERS_PATTERN.sub(
+        lambda m: f"{m.group(0)}\n{m.group(1)}const serverGrades = await fetchServerGrades();",
+        function_code, count=1)
+    return function_code.replace(LOCAL_SIMILARITY_CALL, SERVER_SIMILARITY_CALL)
+
+
+def connect_grade_api(content, page):
+    """把 checkAnswers/submitAnswers 接到 /api/grade，并替换本地的 calculateSimilarity"""
+    if MARKER in content:
+        return content
+
+    span = find_function(content, 'calculateSimilarity')
+    if span is None:
+        # 没有答案检查功能的旧版页面
+        return content
+    content = (content[:span[0]] + CALCULATE_SIMILARITY
+               + GRADE_FUNCTIONS.replace('{page_key}', page.stem) + content[span[1]:])
+
+    for name in ('checkAnswers', 'submitAnswers'):
+        span = find_function(content, name)
+        if span is None:
+            continue
+        function_code = content[span[0]:span[1]]
+        if LOCAL_SIMILARITY_CALL not in function_code:
+            print(f"  ⚠️  {name} 中未找到相似度计算")
+            continue
+        content = content[:span[0]] + use_server_grades(function_code) + content[span[1]:]
+    return content
+
+
+PATCH = page_patcher.Patch('grade-api', '检查答案和提交成绩使用 /api/grade 评分（本地计算作为后备）',
+                           connect_grade_api)
+
+if __name__ == '__main__':
+    page_patcher.main([Path(__file__).stem])
@@ -4,19 +4,13 @@
 批量更新HTML文件中的checkAnswers函数
 """
 
-import os
 import re
 from pathlib import Path
 
-def update_check_answers_function(html_file):
-    """更新HTML文件中的checkAnswers函数"""
-    
-    # 读取HTML文件
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 新的checkAnswers函数
-    new_function = '''        // 检查答案
+import page_patcher
+
+# 新的checkAnswers函数
+NEW_FUNCTION = '''        // 检查答案
         async function checkAnswers() {
             await loadStandardAnswers();
             
@@ -101,49 +95,31 @@ def update_check_answers_function(html_file):
                 showToast(`✓ 检查完成 - ${correctCount}/${totalAnswerableQuestions} 正确`);
             }
         }'''
-    
-    # 查找现有的checkAnswers函数
-    pattern = r'(\s+)// 检查答案\s*\n\s*async function checkAnswers\(\) \{[^}]+\}(?:\s*\{[^}]*\})*[^}]*\}'
-    
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        # 替换现有函数
-        new_content = content[:match.start()] + new_function + content[match.end():]
-        
-        # 写回文件
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        
-        return True
-    
-    return False
 
-def main():
-    """主函数"""
-    foundation_dir = Path(__file__).parent
-    
-    # 处理第1-3课，排除已经更新的L1_S3
-    html_files = []
-    for i in range(1, 4):
-        files = list(foundation_dir.glob(f'foundation_L{i}_S*.html'))
-        html_files.extend([f for f in files if f.name != 'foundation_L1_S3.html'])
-    
-    html_files.sort()
-    
-    print("开始更新第1-3课的checkAnswers函数...")
-    print(f"找到 {len(html_files)} 个HTML文件需要处理\n")
+# 新函数特有的提示文字，已包含时不再替换（旧的匹配模式只能匹配到函数的前几个花括号，
+# 对已更新的函数再替换一次会留下半截旧函数）
+NEW_FUNCTION_MARKER = '已定位到第一个错误'
+
+# 查找现有的checkAnswers函数
+CHECK_ANSWERS_PATTERN = re.compile(
+    r'(\s+)// 检查答案\s*\n\s*async function checkAnswers\(\) \{[^}]+\}(?:\s*\{[^}]*\})*[^}]*\}', re.DOTALL)
+
+def update_check_answers_function(content, page):
+    """更新HTML文件中的checkAnswers函数"""
+    if NEW_FUNCTION_MARKER in content:
+        return content
     
-    updated_count = 0
-    for html_file in html_files:
-        print(f"处理: {html_file.name}")
-        if update_check_answers_function(html_file):
-            print(f"  ✅ 已更新checkAnswers函数")
-            updated_count += 1
-        else:
-            print(f"  ❌ 未找到checkAnswers函数")
-        print()
+    match = CHECK_ANSWERS_PATTERN.search(content)
+    if not match:
+        print(f"  ❌ 未找到checkAnswers函数")
+        return content
     
-    print(f"\n完成！共更新了 {updated_count} 个HTML文件")
+    # 替换现有函数
+    return content[:match.start()] + NEW_FUNCTION + content[match.end():]
+
+# 处理第1-3课，L1_S3 是手工更新的
+PATCH = page_patcher.Patch('check-answers', '更新checkAnswers函数', update_check_answers_function,
+                           page_patcher.lessons(1, 3, exclude={'foundation_L1_S3.html'}))
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    page_patcher.main([Path(__file__).stem])
@@ -1,74 +1,246 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-查看所有缺失答案的经文引用，用于扩充经文数据库
+查看并补全缺失答案的经文引用
+
+1. 扫描 data/answers/ 下所有答案文件，建立 经文引用 -> [(文件, 答案键)] 的索引；
+2. 每个不同的引用只在经文库（../verse_store.py）中查找一次；
+3. 找到的经文按文件分组批量写回（每个文件只读写一次，原子替换）；
+4. 报告仍然缺失的引用及缺少的节，用于扩充经文库（data/verses/）。
+
+--watch 模式下持续运行：只重新读取修改时间变化的答案文件；
+经文库的源文件变化（录入了新经文）时，重新尝试所有仍缺失的引用。
+
+用法:
+    python3 查看缺失经文.py [--dry-run]
+    python3 查看缺失经文.py --watch [--interval 2]
 """
 
+import argparse
 import json
 import os
-from pathlib import Path
+import sys
+import time
 from collections import Counter
+from pathlib import Path
 
-def collect_missing_references():
-    """收集所有缺失的经文引用"""
-    answers_dir = Path(__file__).parent / 'data' / 'answers'
-    json_files = list(answers_dir.glob('foundation_L*.json'))
-    
-    missing_refs = []
-    
-    for json_file in json_files:
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import verse_store
+from verse_store import VerseStore
+
+ANSWERS_DIR = Path(__file__).parent / 'data' / 'answers'
+
+
+class MissingIndex:
+    """答案文件中缺失的引用索引；按修改时间增量更新"""
+
+    def __init__(self, answers_dir=ANSWERS_DIR):
+        self.answers_dir = Path(answers_dir)
+        # 文件名 -> (修改时间, [(答案键, 引用), ...])
+        self.files = {}
+
+    def refresh(self):
+        """重新读取新增或修改过的文件，返回本次变化的文件名"""
+        changed = []
+        current = {}
+        for json_file in self.answers_dir.glob('foundation_L*.json'):
+            try:
+                current[json_file.name] = json_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        for name in list(self.files):
+            if name not in current:
+                del self.files[name]
+                changed.append(name)
+        for name, mtime in sorted(current.items()):
+            if name in self.files and self.files[name][0] == mtime:
+                continue
+            self.files[name] = (mtime, self._read_missing(self.answers_dir / name))
+            changed.append(name)
+        return changed
+
+    def _read_missing(self, json_file):
         try:
             with open(json_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            
-            for key, answer in data.get('answers', {}).items():
-                if not answer.get('has_data', False):
-                    ref = answer.get('reference', '').strip()
-                    if ref:
-                        missing_refs.append((ref, json_file.name))
         except Exception as e:
             print(f"读取失败 {json_file}: {e}")
-    
-    return missing_refs
+            return []
+        missing = []
+        for key, answer in data.get('answers', {}).items():
+            if not answer.get('has_data', False):
+                ref = answer.get('reference', '').strip()
+                if ref:
+                    missing.append((key, ref))
+        return missing
+
+    def references(self, names=None):
+        """引用 -> [(文件名, 答案键), ...]；names 为空时包括所有文件"""
+        index = {}
+        for name in sorted(self.files if names is None else names):
+            if name not in self.files:
+                continue
+            for key, ref in self.files[name][1]:
+                index.setdefault(ref, []).append((name, key))
+        return index
+
+    def write_back(self, resolved, index):
+        """把找到的经文按文件批量写回，返回写回的答案数
+
+        resolved 为 引用 -> 经文，index 为 references() 的结果。
+        写回后更新记录的修改时间，--watch 不会把自己的写入当作新的修改。
+        """
+        updates = {}
+        for ref, text in resolved.items():
+            for name, key in index.get(ref, []):
+                updates.setdefault(name, {})[key] = text
+
+        written = 0
+        for name, answers in sorted(updates.items()):
+            json_file = self.answers_dir / name
+            count = 0
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                for key, text in answers.items():
+                    answer = data['answers'].get(key)
+                    # 读取之后文件可能已被修改，只补全仍然缺失的答案
+                    if answer is not None and not answer.get('has_data', False):
+                        answer['text'] = text
+                        answer['has_data'] = True
+                        count += 1
+                tmp_path = json_file.with_name(json_file.name + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, json_file)
+            except Exception as e:
+                print(f"保存文件失败 {json_file}: {e}")
+                continue
+            self.files[name] = (json_file.stat().st_mtime_ns, self._read_missing(json_file))
+            written += count
+            print(f"  ✅ {name}: 补充了 {count} 个答案")
+        return written
+
+
+def collect_missing_references():
+    """收集所有缺失的经文引用，返回 [(引用, 文件名), ...]"""
+    missing_index = MissingIndex()
+    missing_index.refresh()
+    return [(ref, name) for ref, places in missing_index.references().items()
+            for name, _ in places]
+
+
+def resolve(index, store):
+    """在经文库中查找每个不同的引用，返回 引用 -> 经文（只包括找到的）"""
+    resolved = {}
+    for ref in index:
+        text = store.lookup(ref)
+        if text:
+            resolved[ref] = text
+    return resolved
+
+
+def report(index, store):
+    """报告仍然缺失的引用（按出现次数排序，并按书卷分组）"""
+    if not index:
+        print("🎉 没有缺失的经文答案")
+        return
+
+    ref_counter = Counter({ref: len(places) for ref, places in index.items()})
 
-def main():
-    """主函数"""
-    missing_refs = collect_missing_references()
-    
-    # 统计经文引用
-    ref_counter = Counter([ref for ref, _ in missing_refs])
-    
     print("缺失的经文引用统计:")
     print("=" * 80)
-    print(f"{'经文引用':<25} {'出现次数':<8} {'文件示例':<30}")
+    print(f"{'经文引用':<25} {'出现次数':<8} {'文件示例':<30} {'缺少的节'}")
     print("=" * 80)
-    
+
     # 按出现频率排序
     for ref, count in ref_counter.most_common():
-        files = [filename for r, filename in missing_refs if r == ref]
-        example_file = files[0] if files else ""
-        print(f"{ref:<25} {count:<8} {example_file:<30}")
-    
+        example_file = index[ref][0][0]
+        missing = store.missing(ref)
+        detail = '无法解析' if missing is None else ', '.join(f"{c}:{v}" for c, v in missing)
+        print(f"{ref:<25} {count:<8} {example_file:<30} {detail}")
+
     print("=" * 80)
-    print(f"总计: {len(ref_counter)} 个不同的经文引用，{len(missing_refs)} 个缺失答案")
-    
+    print(f"总计: {len(ref_counter)} 个不同的经文引用，{sum(ref_counter.values())} 个缺失答案")
+
     print("\n按圣经书卷分组:")
     print("=" * 50)
-    
+
     # 按书卷分组
     books = {}
-    for ref, _ in missing_refs:
+    for ref in index:
         # 提取书卷名
         book = ref.split()[0] if ref else "未知"
-        if book not in books:
-            books[book] = []
-        books[book].append(ref)
-    
+        books.setdefault(book, []).append(ref)
+
     for book, refs in sorted(books.items()):
-        unique_refs = list(set(refs))
-        print(f"{book}: {len(unique_refs)} 个经文")
-        for ref in sorted(unique_refs):
+        print(f"{book}: {len(refs)} 个经文")
+        for ref in sorted(refs):
             print(f"  - {ref}")
 
+
+def check(missing_index, store, names=None, dry_run=False):
+    """解析 names 中文件（为空时所有文件）的缺失引用并写回
+
+    返回经文库可以补全的引用集合（dry_run 时不写回）。
+    """
+    index = missing_index.references(names)
+    resolved = resolve(index, store)
+    if resolved:
+        print(f"🔍 {len(index)} 个缺失的引用中，经文库可以补全 {len(resolved)} 个")
+        if not dry_run:
+            written = missing_index.write_back(resolved, index)
+            print(f"💾 共写回 {written} 个答案")
+    return set(resolved)
+
+
+def watch(missing_index, interval=2.0, dry_run=False):
+    """持续监视答案文件和经文库的变化"""
+    store = VerseStore.open()
+    print(f"👀 监视 {missing_index.answers_dir}（每 {interval} 秒检查一次，Ctrl+C 退出）")
+    try:
+        while True:
+            time.sleep(interval)
+            names = missing_index.refresh()
+            if not verse_store.is_current(store.db_path, verse_store.DEFAULT_SOURCES):
+                # 录入了新经文：重新尝试所有仍缺失的引用
+                store.close()
+                store = VerseStore.open()
+                print(f"\n📖 经文库已更新（{len(store)} 节）")
+                names = None
+            elif names:
+                print(f"\n📝 {len(names)} 个答案文件有变化: {', '.join(names[:5])}"
+                      f"{' ...' if len(names) > 5 else ''}")
+            else:
+                continue
+            resolved = check(missing_index, store, names, dry_run)
+            remaining = {ref: places for ref, places in missing_index.references().items()
+                         if not (dry_run and ref in resolved)}
+            print(f"📊 仍缺失 {sum(len(places) for places in remaining.values())} 个答案"
+                  f"（{len(remaining)} 个不同的引用）")
+    except KeyboardInterrupt:
+        print("\n已停止监视")
+    finally:
+        store.close()
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='查看并补全缺失答案的经文引用')
+    parser.add_argument('--dry-run', action='store_true', help='只报告，不写回答案文件')
+    parser.add_argument('--watch', action='store_true', help='持续监视答案文件与经文库的变化')
+    parser.add_argument('--interval', type=float, default=2.0, help='监视模式的检查间隔秒数（默认2）')
+    args = parser.parse_args()
+
+    missing_index = MissingIndex()
+    missing_index.refresh()
+    with VerseStore.open() as store:
+        resolved = check(missing_index, store, dry_run=args.dry_run)
+        report({ref: places for ref, places in missing_index.references().items()
+                if ref not in resolved}, store)
+    if args.watch:
+        watch(missing_index, args.interval, args.dry_run)
+
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+在页面上添加“📤 导出进度”按钮
+把浏览器中保存的所有节的进度导出为一个JSON文件，交给老师用 grade_progress.py 批量评分。
+"""
+
+import re
+from pathlib import Path
+
+import page_patcher
+
+EXPORT_FUNCTION = '''        // 导出所有节的进度（交给老师用 grade_progress.py 批量评分）
+        function exportProgress() {
+            saveProgress();
+            const student = (prompt('请输入你的姓名：') || '').trim();
+            const progress = {};
+            for (let i = 0; i < localStorage.length; i++) {
+                const key = localStorage.key(i);
+                if (/^foundation_L\\d+_S\\d+$/.test(key)) {
+                    try {
+                        progress[key] = JSON.parse(localStorage.getItem(key));
+                    } catch (e) {
+                        console.error('跳过无法解析的进度:', key);
+                    }
+                }
+            }
+
+            const data = { student: student, exported_at: new Date().toISOString(), progress: progress };
+            const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
+            const link = document.createElement('a');
+            link.href = URL.createObjectURL(blob);
+            link.download = `foundation_progress${student ? '_' + student : ''}.json`;
+            document.body.appendChild(link);
+            link.click();
+            link.remove();
+            URL.revokeObjectURL(link.href);
+            showToast(`✓ 已导出 ${Object.keys(progress).length} 节的进度`);
+        }
+
+'''
+
+EXPORT_BUTTON = '<button class="btn btn-secondary" onclick="exportProgress()">📤 导出进度</button>'
+
+# 插在提交按钮之前（两种版本的页面：btn-submit 或 btn-primary）
+SUBMIT_BUTTON_PATTERN = re.compile(
+    r'^([ \t]*)<button class="btn btn-\w+" onclick="submitAnswers\(\)">', re.MULTILINE)
+SHOW_TOAST_PATTERN = re.compile(r'^[ \t]*function showToast\(', re.MULTILINE)
+
+
+def add_export_progress(content, page):
+    """添加导出按钮和 exportProgress 函数"""
+    if 'function exportProgress()' in content:
+        return content
+
+    button = SUBMIT_BUTTON_PATTERN.search(content)
+    show_toast = SHOW_TOAST_PATTERN.search(content)
+    if not button or not show_toast or 'function saveProgress()' not in content:
+        print(f"  ⚠️  未找到提交按钮或保存进度函数")
+        return content
+
+    # 先插入后面的函数，按钮的位置不受影响
+    content = content[:show_toast.start()] + EXPORT_FUNCTION + content[show_toast.start():]
+    return (content[:button.start()] + button.group(1) + EXPORT_BUTTON + '\n'
+            + content[button.start():])
+
+
+PATCH = page_patcher.Patch('export-progress', '添加“导出进度”按钮（供 grade_progress.py 批量评分）',
+                           add_export_progress)
+
+if __name__ == '__main__':
+    page_patcher.main([Path(__file__).stem])
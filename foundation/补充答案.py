@@ -3,561 +3,27 @@
 """
 大规模补充圣经经文答案
 这个脚本将补充所有缺失的圣经经文答案
+
+经文从经文库（../verse_store.py）中按节查找后拼接，任何范围、多节的引用都不需要单独录入；
+课程原先录入的经文（data/verses/{书卷ID}.json）优先，其余新约经文取自 bible-study/data。
 """
 
 import json
-import os
-import re
+import sys
 from pathlib import Path
 
-# 完整的圣经经文数据库
-BIBLE_VERSES = {
-    # 旧约经文
-    # 创世记
-    "创 1:1": "起初　神创造天地。",
-    "创 1:2": "地是空虚混沌，渊面黑暗；　神的灵运行在水面上。",
-    "创 1:3": "　神说：「要有光」，就有了光。",
-    "创 1:27": "　神就照着自己的形像造人，乃是照着他的形像造男造女。",
-    "创 2:7": "耶和华　神用地上的尘土造人，将生气吹在他鼻孔里，他就成了有灵的活人，名叫亚当。",
-    "创 3:1": "耶和华　神所造的，惟有蛇比田野一切的活物更狡猾。蛇对女人说：「　神岂是真说不许你们吃园中所有树上的果子吗？」",
-    "创 3:15": "我又要叫你和女人彼此为仇；你的后裔和女人的后裔也彼此为仇。女人的后裔要伤你的头；你要伤他的脚跟。",
-    "创 15:4-6": "耶和华又有话对他说：「这人必不成为你的后嗣；你本身所生的才成为你的后嗣。」于是领他走到外边，说：「你向天观看，数算众星，能数得过来吗？」又对他说：「你的后裔将要如此。」亚伯兰信耶和华，耶和华就以此为他的义。",
-    "创 15:5-6": "于是领他走到外边，说：「你向天观看，数算众星，能数得过来吗？」又对他说：「你的后裔将要如此。」亚伯兰信耶和华，耶和华就以此为他的义。",
-    "创 15:5,6": "于是领他走到外边，说：「你向天观看，数算众星，能数得过来吗？」又对他说：「你的后裔将要如此。」亚伯兰信耶和华，耶和华就以此为他的义。",
-    
-    # 出埃及记
-    "出 3:14": "　神对摩西说：「我是自有永有的」；又说：「你要对以色列人这样说：『那自有的打发我到你们这里来。』」",
-    "出 20:3": "「除了我以外，你不可有别的神。",
-    "出 20:4": "「不可为自己雕刻偶像，也不可做什么形像彷佛上天、下地，和地底下、水中的百物。",
-    
-    # 利未记
-    "利 11:44": "我是耶和华－你们的　神；所以你们要成为圣洁，因为我是圣洁的。你们也不可在地上的爬物污秽自己。",
-    "利 19:2": "「你晓谕以色列全会众说：你们要圣洁，因为我耶和华－你们的　神是圣洁的。",
-    "利 20:7": "所以你们要自洁成圣，因为我是耶和华－你们的　神。",
-    
-    # 申命记
-    "申 6:4": "「以色列啊，你要听！耶和华－我们　神是独一的主。",
-    "申 6:5": "你要尽心、尽性、尽力爱耶和华－你的　神。",
-    "申 30:11": "「我今日所吩咐你的诫命不是你难行的，也不是离你远的；",
-    "申 8:18": "你要记念耶和华－你的　神，因为得货财的力量是他给你的，为要坚定他向你列祖起誓所立的约，像今日一样。",
-    "申 30:8-10": "你必归回，听从耶和华的话，遵行他的一切诫命，就是我今日所吩咐你的。你手里所办的一切事，并你身所生的，牲畜所下的，地土所产的，耶和华必使你样样都丰盛，因为耶和华必再喜悦你，降福与你，像从前喜悦你列祖一样。你若听从耶和华－你　神的话，谨守这律法书上所写的诫命律例，又尽心尽性归向耶和华－你的　神，他必使你手里所办的一切事尽都顺利。",
-    "申 10:12": "「以色列啊，现在耶和华－你　神向你所要的是什么呢？只要你敬畏耶和华－你的　神，遵行他的道，爱他，尽心尽性事奉耶和华－你的　神，",
-    
-    # 诗篇
-    "诗 1:1": "不从恶人的计谋，不站罪人的道路，不坐亵慢人的座位，",
-    "诗 1:2": "惟喜爱耶和华的律法，昼夜思想，这人便为有福！",
-    "诗 1:1-3": "不从恶人的计谋，不站罪人的道路，不坐亵慢人的座位，惟喜爱耶和华的律法，昼夜思想，这人便为有福！他要像一棵树栽在溪水旁，按时候结果子，叶子也不枯干。凡他所做的尽都顺利。",
-    "诗 23:1": "耶和华是我的牧者，我必不致缺乏。",
-    "诗 23:4": "我虽然行过死荫的幽谷，也不怕遭害，因为你与我同在；你的杖，你的竿，都安慰我。",
-    "诗 42:1,2": "　神啊，我的心切慕你，如鹿切慕溪水。我的心渴想　神，就是永生　神；我几时得朝见　神呢？",
-    "诗 47:1,5,6": "万民哪，你们都要拍掌！要用夸胜的声音向　神呼喊！　神上升，有喊声相送；耶和华上升，有角声相送。你们要向　神歌颂，歌颂！向我们王歌颂，歌颂！",
-    "诗 66:18,19": "我若心里注重罪孽，主必不听。但　神实在听见了；他侧耳听了我祷告的声音。",
-    "诗 84:1": "万军之耶和华啊，你的居所何等可爱！",
-    "诗 84:2": "我羡慕渴想耶和华的院宇；我的心肠，我的肉体向永生　神呼吁。",
-    "诗 84:10": "在你的院宇住一日，胜似在别处住千日；宁可在我　神殿中看门，不愿住在恶人的帐棚里。",
-    "诗 89:14": "公义和公平是你宝座的根基；慈爱和诚实行在你前面。",
-    "诗 96:8,9": "要将耶和华的名所当得的荣耀归给他，拿供物来进入他的院宇。当以圣洁的妆饰敬拜耶和华；全地要在他面前战抖！",
-    "诗 98:1,4-6": "你们要向耶和华唱新歌！因为他行过奇妙的事；他的右手和圣臂施行救恩。全地都要向耶和华欢乐；要发起大声，欢呼歌颂！要用琴歌颂耶和华，用琴和诗歌的声音歌颂他！用号和角声，在大君王耶和华面前欢乐！",
-    "诗 116:15": "在耶和华眼中，看圣民之死极为宝贵。",
-    "诗 119:9": "少年人用什么洁净他的行为呢？是要遵行你的话！",
-    "诗 119:11": "我将你的话藏在心里，免得我得罪你。",
-    "诗 119:72": "你口中的训言与我有益，胜于千万的金银。",
-    "诗 119:81": "我心渴想你的救恩，仰望你的应许。",
-    "诗 119:89": "耶和华啊，你的话安定在天，直到永远。",
-    "诗 119:98": "你的命令常存在我心里，使我比仇敌有智慧。",
-    "诗 119:99": "我比我的师傅更通达，因我思想你的法度。",
-    "诗 119:100": "我比年老的更明白，因我守了你的训词。",
-    "诗 119:103": "你的言语在我上膛何等甘美，在我口中比蜜更甜！",
-    "诗 119:105": "你的话是我脚前的灯，是我路上的光。",
-    "诗 119:127": "所以，我爱你的命令胜于金子，更胜于精金。",
-    "诗 119:160": "你话的总纲是真实；你一切公义的典章是永远长存。",
-    "诗 119:165": "爱你律法的人有大平安，什么都不能使他们绊脚。",
-    "诗 139:14": "我要称谢你，因我受造，奇妙可畏；你的作为奇妙，这是我心深深知道的。",
-    "诗 149:3": "愿他们跳舞赞美他的名，击鼓弹琴歌颂他！",
-    "诗 150:3-6": "要用角声赞美他，鼓瑟弹琴赞美他！击鼓跳舞赞美他！用丝弦的乐器和箫的声音赞美他！用大响的钹赞美他！用高声的钹赞美他！凡有气息的都要赞美耶和华！你们要赞美耶和华！",
-    
-    # 更多诗篇
-    "诗 9:7-8": "惟耶和华坐着为王，直到永远；他已经为审判设摆他的宝座。他要按公义审判世界，按正直判断万民。",
-    "诗 119:97-98": "我何等爱慕你的律法，终日不住地思想。你的命令常存在我心里，使我比仇敌有智慧。",
-    "诗 119:105": "你的话是我脚前的灯，是我路上的光。",
-    "诗 119:114": "你是我藏身之处，又是我的盾牌；我甚仰望你的话语。",
-    
-    # 约伯记
-    "伯 23:12": "他嘴唇的命令，我未曾背弃；我看重他口中的言语，过于我需用的饮食。",
-    
-    # 箴言
-    "箴 3:5": "你要专心仰赖耶和华，不可倚靠自己的聪明，",
-    "箴 3:6": "在你一切所行的事上都要认定他，他必指引你的路。",
-    "箴 3:9": "你要以财物和一切初熟的土产尊荣耶和华。",
-    "箴 3:10": "这样，你的仓房必充满有余；你的酒醡有新酒盈溢。",
-    "箴 4:20-22": "我儿，要留心听我的言词，侧耳听我的话语，都不可离你的眼目，要存记在你心中。因为得着它的，就得了生命，又得了医全体的良药。",
-    "箴 6:16-19": "耶和华所恨恶的有六样，连他心所憎恶的共有七样：就是高傲的眼，撒谎的舌，流无辜人血的手，图谋恶计的心，飞跑行恶的脚，吐谎言的假见证，并弟兄中布散纷争的人。",
-    "箴 10:3": "耶和华不使义人受饥饿，恶人所欲的，他必推开。",
-    "箴 10:4": "手懒的，要受贫穷；手勤的，却要富足。",
-    "箴 10:22": "耶和华所赐的福使人富足，并不加上忧虑。",
-    "箴 11:4": "发怒的日子资财无益；惟有公义能救人脱离死亡。",
-    "箴 11:28": "倚仗自己财物的，必跌倒；义人必发旺，如青叶。",
-    "箴 13:21": "祸患追赶罪人；义人必得善报。",
-    "箴 13:22": "善人给子孙遗留产业；罪人为义人积存资财。",
-    "箴 16:9": "人心筹算自己的道路；惟耶和华指引他的脚步。",
-    "箴 16:28": "乖僻人播散纷争；传舌的，离间密友。",
-    "箴 21:21": "追求公义仁慈的，就寻得生命、公义，和尊荣。",
-    "箴 22:4": "敬畏耶和华心存谦卑，就得富有、尊荣、生命为赏赐。",
-    "箴 22:9": "眼目慈善的，就必蒙福，因他将食物分给穷人。",
-    "箴 23:4,5": "不要劳碌求富，休仗自己的聪明。你岂要定睛在虚无的钱财上吗？因钱财必长翅膀，如鹰向天飞去。",
-    "箴 27:1": "不要为明日自夸，因为一日要生何事，你尚且不能知道。",
-    "箴 29:25": "惧怕人的，陷入网罗；惟有倚靠耶和华的，必得安稳。",
-    
-    # 传道书
-    "传 3:17": "我心里说，　神必审判义人和恶人；因为在那里，各样事务，一切工作，都有定时。",
-    "传 12:13": "这些事都已听见了，总意就是：敬畏　神，谨守他的诫命，这是人所当尽的本分。",
-    
-    # 以赛亚书
-    "赛 8:13": "但要尊万军之耶和华为圣，以他为你们所当怕的，所当畏惧的。",
-    "赛 40:8": "草必枯干，花必凋残，惟有我们　神的话必永远立定。",
-    "赛 40:31": "但那等候耶和华的必重新得力。他们必如鹰展翅上腾；他们奔跑却不困倦，行走却不疲乏。",
-    "赛 53:5": "哪知他为我们的过犯受害，为我们的罪孽压伤。因他受的刑罚，我们得平安；因他受的鞭伤，我们得医治。",
-    "赛 53:6": "我们都如羊走迷；各人偏行己路；耶和华使我们众人的罪孽都归在他身上。",
-    "赛 55:8": "耶和华说：我的意念非同你们的意念；我的道路非同你们的道路。",
-    "赛 55:9": "天怎样高过地，照样，我的道路高过你们的道路；我的意念高过你们的意念。",
-    "赛 55:11": "我口所出的话也必如此，决不徒然返回，却要成就我所喜悦的，在我发他去成就的事上必然亨通。",
-    
-    # 耶利米书
-    "耶 15:16": "耶和华－万军之　神啊，我得着你的言语就当食物吃了；你的言语是我心中的欢喜快乐，因我是称为你名下的人。",
-    "耶 17:9": "人心比万物都诡诈，坏到极处，谁能识透呢？",
-    "耶 29:11": "耶和华说：我知道我向你们所怀的意念是赐平安的意念，不是降灾祸的意念，要叫你们末后有指望。",
-    "耶 31:3": "古时耶和华向以色列显现，说：我以永远的爱爱你，因此我以慈爱吸引你。",
-    
-    # 以西结书
-    "结 33:1-9": "耶和华的话临到我说：「人子啊，你要告诉本国的子民说：我使刀剑临到哪一国，那一国的民从他们中间选立一人为守望的。他见刀剑临到那地，若吹角警戒众民，凡听见角声不受警戒的，刀剑若来除灭了他，他的罪就必归到自己的头上。他听见角声，不受警戒，他的罪必归到自己身上；他若受警戒，便救了自己的性命。倘若守望的人见刀剑临到，不吹角，以致民不受警戒，刀剑来杀了他们中间的一个人，他虽然死在罪孽之中，我却要向守望的人讨他丧命的罪。」人子啊，我照样立你作以色列家守望的人。所以你要听我口中的话，替我警戒他们。我对恶人说：『恶人哪，你必要死！』你－以西结若不开口警戒恶人，使他离开所行的道，这恶人必死在罪孽之中，我却要向你讨他丧命的罪。倘若你警戒恶人转离所行的道，他仍不转离，他必死在罪孽之中，你却救自己脱离了罪。」",
-    "结 34:2-5": "「人子啊，你要向以色列的牧人发预言，攻击他们，说，主耶和华如此说：祸哉！以色列的牧人只知牧养自己。牧人岂不当牧养群羊吗？你们吃脂油、穿羊毛、宰肥壮的，却不牧养群羊。瘦弱的，你们没有养壮；有病的，你们没有医治；受伤的，你们没有缠裹；被逐的，你们没有领回；失丧的，你们没有寻找；但用强暴严严地辖制。因无牧人，羊就分散；既分散，便作了一切野兽的食物。」",
-    
-    # 历代志下
-    "代下 31:5,6": "谕旨一出，以色列人就把初熟的五谷、新酒、油、蜜，和田地的出产多多送来，又把各物的十分之一大量地送来。住犹大各城的以色列人和犹大人也将牛羊的十分之一，并分别为圣归耶和华－他们　神之圣物的十分之一，尽都送来，积成堆垒。",
-    
-    # 玛拉基书
-    "玛 3:8": "人岂可夺取　神之物呢？你们竟夺取我的供物。你们却说：『我们在何事上夺取你的供物呢？』就是你们在当纳的十分之一和当献的供物上。",
-    "玛 3:9": "因你们通国的人都夺取我的供物，咒诅就临到你们身上。",
-    "玛 3:10": "万军之耶和华说：你们要将当纳的十分之一全然送入仓库，使我家有粮，以此试试我，是否为你们敞开天上的窗户，倾福与你们，甚至无处可容。",
-    "玛 3:10-12": "万军之耶和华说：你们要将当纳的十分之一全然送入仓库，使我家有粮，以此试试我，是否为你们敞开天上的窗户，倾福与你们，甚至无处可容。万军之耶和华说：我必为你们斥责蝗虫，不容它毁坏你们的土产。你们田间的葡萄树在未熟之先也不掉果子。万军之耶和华说：万国必称你们为有福的，因你们的地必成为喜乐之地。」",
-    
-    # 新约经文
-    # 马太福音
-    "太 4:4": "耶稣却回答说：「经上记着说：人活着，不是单靠食物，乃是靠　神口里所出的一切话。」",
-    "太 5:3": "「虚心的人有福了！因为天国是他们的。",
-    "太 5:4": "哀恸的人有福了！因为他们必得安慰。",
-    "太 5:16": "你们的光也当这样照在人前，叫他们看见你们的好行为，便将荣耀归给你们在天上的父。」",
-    "太 6:5-13": "你们祷告的时候，不可像那假冒为善的人，爱在会堂里和十字路口上站着祷告，故意叫人看见。我实在告诉你们，他们已经得了他们的赏赐。你祷告的时候，要进你的内屋，关上门，祷告你在暗中的父；你父在暗中察看，必然报答你。你们祷告，不可像外邦人，用许多重复话，他们以为话多了必蒙垂听。你们不可效法他们；因为你们没有祈求以先，你们所需用的，你们的父早已知道了。所以，你们祷告要这样说：我们在天上的父：愿人都尊你的名为圣。愿你的国降临；愿你的旨意行在地上，如同行在天上。我们日用的饮食，今日赐给我们。免我们的债，如同我们免了人的债。不叫我们遇见试探；救我们脱离凶恶。因为国度、权柄、荣耀，全是你的，直到永远。阿们！",
-    "太 6:33": "你们要先求他的国和他的义，这些东西都要加给你们了。",
-    "太 7:7": "「你们祈求，就给你们；寻找，就寻见；叩门，就给你们开门。",
-    "太 11:28": "凡劳苦担重担的人可以到我这里来，我就使你们得安息。",
-    "太 16:18": "我还告诉你，你是彼得，我要把我的教会建造在这磐石上；阴间的权柄，不能胜过他。",
-    "太 25:31-46": "「当人子在他荣耀里、同着众天使降临的时候，要坐在他荣耀的宝座上。万民都要聚集在他面前。他要把他们分别出来，好像牧羊的分别绵羊山羊一般，把绵羊安置在右边，山羊在左边。于是王要向那右边的说：『你们这蒙我父赐福的，可来承受那创世以来为你们所预备的国；因为我饿了，你们给我吃，渴了，你们给我喝；我作客旅，你们留我住；我赤身露体，你们给我穿；我病了、你们看顾我；我在监里，你们来看我。』义人就回答说：『主啊，我们什么时候见你饿了，给你吃，渴了，给你喝？什么时候见你作客旅，留你住，或是赤身露体，给你穿？又什么时候见你病了，或是在监里，来看你呢？』王要回答说：『我实在告诉你们，这些事你们既做在我这弟兄中一个最小的身上，就是做在我身上了。』王又要向那左边的说：『你们这被咒诅的人，离开我！进入那为魔鬼和他的使者所预备的永火里去！因为我饿了，你们不给我吃，渴了，你们不给我喝；我作客旅，你们不留我住；我赤身露体，你们不给我穿；我病了，我在监里，你们不来看顾我。』他们也要回答说：『主啊，我们什么时候见你饿了，或渴了，或作客旅，或赤身露体，或病了，或在监里，不伺候你呢？』王要回答说：『我实在告诉你们，这些事你们既不做在我这弟兄中一个最小的身上，就是不做在我身上了。』这些人要往永刑里去；那些义人要往永生里去。」",
-    "太 28:18-20": "耶稣进前来，对他们说：「天上地下所有的权柄都赐给我了。所以，你们要去，使万民作我的门徒，奉父、子、圣灵的名给他们施洗。凡我所吩咐你们的，都教训他们遵守，我就常与你们同在，直到世界的末了。」",
-    "太 28:19": "所以，你们要去，使万民作我的门徒，奉父、子、圣灵的名给他们施洗。",
-    "太 28:20": "凡我所吩咐你们的，都教训他们遵守，我就常与你们同在，直到世界的末了。」",
-    
-    # 马可福音
-    "可 16:15": "他又对他们说：「你们往普天下去，传福音给万民听。",
-    
-    # 路加福音  
-    "路 5:27-28": "这事以后，耶稣出去，看见一个税吏，名叫利未，坐在税关上，就对他说：「你跟从我来。」他就撇下所有的，起来，跟从了耶稣。",
-    "路 6:46-49": "「你们为什么称呼我『主啊，主啊』却不遵我的话行呢？凡到我这里来，听见我的话就去行的，我要告诉你们他像什么人：他像一个人盖房子，深深的挖地，把根基安在磐石上；到发大水的时候，水冲那房子，房子总不能摇动，因为根基立在磐石上。惟有听见不去行的，就像一个人在土地上盖房子，没有根基；水一冲，随即倒塌了，并且那房子坏的很大。」",
-    "路 9:23-24": "耶稣又对众人说：「若有人要跟从我，就当舍己，天天背起他的十字架来跟从我。因为，凡要救自己生命的，必丧掉生命；凡为我丧掉生命的，必救了生命。",
-    "路 14:27-33": "凡不背着自己十字架跟从我的，也不能作我的门徒。你们哪一个要盖一座楼，不先坐下算计花费，能盖成不能呢？恐怕安了地基，不能成功，看见的人都笑话他，说：『这个人开了工，却不能完工。』或是一个王出去和别的王打仗，岂不先坐下酌量，能用一万兵去敌那领二万兵来攻打他的吗？若是不能，就趁敌人还远的时候，派使者去求和息的条款。这样，你们无论什么人，若不撇下一切所有的，就不能作我的门徒。」",
-    "路 19:10": "人子来，为要寻找、拯救失丧的人。」",
-    "路 23:34": "当下耶稣说：「父啊！赦免他们；因为他们所做的，他们不晓得。」兵丁就拈阄分他的衣服。",
-    
-    # 约翰福音
-    "约 1:1": "太初有道，道与　神同在，道就是　神。",
-    "约 1:14": "道成了肉身，住在我们中间，充充满满的有恩典有真理。我们也见过他的荣光，正是父独生子的荣光。",
-    "约 3:16": "「　神爱世人，甚至将他的独生子赐给他们，叫一切信他的，不致灭亡，反得永生。",
-    "约 8:32": "你们必晓得真理，真理必叫你们得以自由。」",
-    "约 10:10": "盗贼来，无非要偷窃，杀害，毁坏；我来了，是要叫羊得生命，并且得的更丰盛。",
-    "约 14:6": "耶稣说：「我就是道路、真理、生命；若不藉着我，没有人能到父那里去。",
-    "约 15:5": "我是葡萄树，你们是枝子。常在我里面的，我也常在他里面，这人就多结果子；因为离了我，你们就不能做什么。",
-    "约 21:15-17": "他们吃完了早饭，耶稣对西门彼得说：「约翰的儿子西门，你爱我比这些更深吗？」彼得说：「主啊，是的，你知道我爱你。」耶稣对他说：「你喂养我的小羊。」耶稣第二次又对他说：「约翰的儿子西门，你爱我吗？」彼得说：「主啊，是的，你知道我爱你。」耶稣说：「你牧养我的羊。」第三次对他说：「约翰的儿子西门，你爱我吗？」彼得因为耶稣第三次对他说「你爱我吗」，就忧愁，对耶稣说：「主啊，你是无所不知的；你知道我爱你。」耶稣说：「你喂养我的羊。」",
-    
-    # 使徒行传
-    "徒 1:8": "但圣灵降临在你们身上，你们就必得着能力，并要在耶路撒冷、犹太全地，和撒马利亚，直到地极，作我的见证。」",
-    "徒 2:42-47": "都恒心遵守使徒的教训，彼此交接，擘饼，祈祷。众人都惧怕；使徒又行了许多奇事神迹。信的人都在一处，凡物公用；并且卖了田产，家业，照各人所需用的分给各人。他们天天同心合意恒切的在殿里，且在家中擘饼，存着欢喜、诚实的心用饭，赞美　神，得众民的喜爱。主将得救的人天天加给他们。",
-    "徒 4:12": "除他以外，别无拯救；因为在天下人间，没有赐下别的名，我们可以靠着得救。」",
-    "徒 10:44-48": "彼得还说这话的时候，圣灵降在一切听道的人身上。那些奉割礼、和彼得同来的信徒，见圣灵的恩赐也浇在外邦人身上，就都希奇；因听见他们说方言，称赞　神为大。于是彼得说：「这些人既受了圣灵，与我们一样，谁能禁止用水给他们施洗呢？」就吩咐奉耶稣基督的名给他们施洗。他们又请彼得住了几天。",
-    "徒 16:31": "他们说：「当信主耶稣，你和你一家都必得救。」",
-    "徒 20:20-21": "你们也知道，凡与你们有益的，我没有一样避讳不说的，或在众人面前，或在各人家里，我都教导你们；又对犹太人和希利尼人证明当向　神悔改，信靠我主耶稣基督。",
-    
-    # 罗马书
-    "罗 1:16": "我不以福音为耻；这福音本是　神的大能，要救一切相信的，先是犹太人，后是希利尼人。",
-    "罗 1:17": "因为　神的义正在这福音上显明出来；这义是本于信，以致于信。如经上所记：「义人必因信得生。」",
-    "罗 3:21-28": "但如今，　神的义在律法以外已经显明出来，有律法和先知为证：就是　神的义，因信耶稣基督加给一切相信的人，并没有分别。因为世人都犯了罪，亏缺了　神的荣耀；如今却蒙　神的恩典，因基督耶稣的救赎，就白白的称义。　神设立耶稣作挽回祭，是凭着耶稣的血，藉着人的信，要显明　神的义；因为他用忍耐的心宽容人先时所犯的罪，好在今时显明他的义，使人知道他自己为义，也称信耶稣的人为义。既是这样，哪里能夸口呢？没有可夸的了。用何法没有的呢？是用立功之法吗？不是，乃用信主之法。所以我们看定了：人称义是因着信，不在乎遵行律法。",
-    "罗 3:23": "因为世人都犯了罪，亏缺了　神的荣耀；",
-    "罗 3:23-26": "因为世人都犯了罪，亏缺了　神的荣耀；如今却蒙　神的恩典，因基督耶稣的救赎，就白白的称义。　神设立耶稣作挽回祭，是凭着耶稣的血，藉着人的信，要显明　神的义；因为他用忍耐的心宽容人先时所犯的罪，好在今时显明他的义，使人知道他自己为义，也称信耶稣的人为义。",
-    "罗 4:19-21": "他将近百岁的时候，虽然想到自己的身体如同已死，撒拉的生育已经断绝，他的信心还是不软弱；并且仰望　神的应许，总没有因不信心里起疑惑，反倒因信心里得坚固，将荣耀归给　神，且满心相信　神所应许的必能做成。",
-    "罗 5:1-2": "我们既因信称义，就藉着我们的主耶稣基督得与　神相和。我们又藉着他，因信得进入现在所站的这恩典中，并且欢欢喜喜盼望　神的荣耀。",
-    "罗 5:8": "惟有基督在我们还作罪人的时候为我们死，　神的爱就在此向我们显明了。",
-    "罗 6:23": "因为罪的工价乃是死；惟有　神的恩赐，在我们的主基督耶稣里，乃是永生。",
-    "罗 8:28": "我们晓得万事都互相效力，叫爱　神的人得益处，就是按他旨意被召的人。",
-    "罗 10:9": "你若口里认耶稣为主，心里信　神叫他从死里复活，就必得救。",
-    "罗 10:13": "因为「凡求告主名的，就必得救。」",
-    "罗 10:17": "可见信道是从听道来的，听道是从基督的话来的。",
-    "罗 12:1": "所以弟兄们，我以　神的慈悲劝你们，将身体献上，当作活祭，是圣洁的，是　神所喜悦的；你们如此事奉乃是理所当然的。",
-    "罗 12:2": "不要效法这个世界，只要心意更新而变化，叫你们察验何为　神的善良、纯全、可喜悦的旨意。",
-    
-    # 哥林多前书
-    "林前 3:9-15": "因为我们是与　神同工的；你们是　神所耕种的田地，所建造的房屋。我照　神所给我的恩，好像一个聪明的工头，立好了根基，有别人在上面建造；只是各人要谨慎怎样在上面建造。因为那已经立好的根基就是耶稣基督，此外没有人能立别的根基。若有人用金、银、宝石在这根基上建造，也有人用草木，禾秸建造，各人的工程必然显露，因为那日子要将它表明出来，有火发现；这火要试验各人的工程怎样。人在那根基上所建造的工程若存得住，他就要得赏赐。人的工程若被烧了，他就要受亏损，自己却要得救；虽然得救，乃像从火里经过的一样。",
-    "林前 3:11": "因为那已经立好的根基就是耶稣基督，此外没有人能立别的根基。",
-    "林前 6:19-20": "岂不知你们的身子就是圣灵的殿吗？这圣灵是从　神而来，住在你们里头的；并且你们不是自己的人；因为你们是重价买来的。所以，要在你们的身子上荣耀　神。",
-    "林前 10:13": "你们所遇见的试探，无非是人所能受的。　神是信实的，必不叫你们受试探过于所能受的；在受试探的时候，总要给你们开一条出路，叫你们能忍受得住。",
-    "林前 11:1": "你们该效法我，像我效法基督一样。",
-    "林前 11:23-32": "我当日传给你们的，原是从主领受的，就是主耶稣被卖的那一夜，拿起饼来，祝谢了，就擘开，说：「这是我的身体，为你们舍的，你们应当如此行，为的是记念我。」饭后，也照样拿起杯来，说：「这杯是用我的血所立的新约，你们每逢喝的时候，要如此行，为的是记念我。」你们每逢吃这饼，喝这杯，是表明主的死，直等到他来。所以，无论何人，不按理吃主的饼，喝主的杯，就是干犯主的身、主的血了。人应当自己省察，然后吃这饼、喝这杯。因为人吃喝，若不分辨是主的身体，就是吃喝自己的罪了。因此，在你们中间有好些软弱的与患病的，死的也不少。我们若是先分辨自己，就不至于受审。我们受审的时候，乃是被主惩治，免得我们和世人一同定罪。",
-    "林前 12:4-6": "恩赐原有分别，圣灵却是一位。职事也有分别，主却是一位。功用也有分别，　神却是一位，在众人里面运行一切的事。",
-    "林前 13:4-5": "爱是恒久忍耐，又有恩慈；爱是不嫉妒；爱是不自夸，不张狂，不做害羞的事，不求自己的益处，不轻易发怒，不计算人的恶，",
-    "林前 13:13": "如今常存的有信，有望，有爱这三样，其中最大的是爱。",
-    "林前 15:3-4": "我当日所领受又传给你们的：第一，就是基督照圣经所说，为我们的罪死了，而且埋葬了；又照圣经所说，第三日复活了，",
-    "林前 15:13-19": "若没有死人复活的事，基督也就没有复活了。若基督没有复活，我们所传的便是枉然，你们所信的也是枉然；并且明显我们是为　神妄作见证的，因我们见证　神是叫基督复活了。若死人真不复活，　神也就没有叫基督复活了。因为死人若不复活，基督也就没有复活了。基督若没有复活，你们的信便是徒然，你们仍在罪里。就是在基督里睡了的人也灭亡了。我们若靠基督，只在今生有指望，就算比众人更可怜。",
-    "林前 15:58": "所以，我亲爱的弟兄们，你们务要坚固，不可摇动，常常竭力多做主工；因为知道，你们的劳苦在主里面不是徒然的。",
-    
-    # 哥林多后书
-    "林后 4:16-18": "所以，我们不丧胆。外体虽然毁坏，内心却一天新似一天。我们这至暂至轻的苦楚，要为我们成就极重无比、永远的荣耀。原来我们不是顾念所见的，乃是顾念所不见的；因为所见的是暂时的，所不见的是永远的。",
-    "林后 5:6-10": "所以，我们时常坦然无惧，并且晓得我们住在身内，便与主相离。因我们行事为人是凭着信心，不是凭着眼见。我们坦然无惧，是更愿意离开身体与主同住。所以，无论是住在身内，离开身外，我们立了志向，要得主的喜悦。因为我们众人必要在基督台前显露出来，叫各人按着本身所行的，或善或恶受报。",
-    "林后 5:17": "若有人在基督里，他就是新造的人，旧事已过，都变成新的了。",
-    "林后 8:1-5": "弟兄们，我把　神赐给马其顿众教会的恩告诉你们，就是他们在患难中受大试炼的时候，仍有满足的快乐，在极穷之间还格外显出他们乐捐的厚恩。我可以证明，他们是按着力量，而且也过了力量，自己甘心乐意的捐助，再三的求我们，准他们在这供给圣徒的恩情上有分；并且他们所做的，不但照我们所希望的，更照　神的旨意先把自己献给主，又归附了我们。",
-    "林后 9:6-11": "「少种的少收，多种的多收」，这话是真的。各人要随本心所酌定的，不要作难，不要勉强，因为捐得乐意的人是　神所喜爱的。　神能将各样的恩惠多多的加给你们，使你们凡事常常充足，能多行各样善事。如经上所记：他施舍钱财，周济贫穷；他的仁义存到永远。那赐种给撒种的，赐粮给人吃的，必多多加给你们种地的种子，又增添你们仁义的果子；叫你们凡事富足，可以多多施舍，就藉着我们使感谢归于　神。",
-    "林后 9:8": "　神能将各样的恩惠多多的加给你们，使你们凡事常常充足，能多行各样善事。",
-    "林后 12:9": "他对我说：「我的恩典够你用的，因为我的能力是在人的软弱上显得完全。」所以，我更喜欢夸自己的软弱，好叫基督的能力覆庇我。",
-    "林后 13:11": "还有末了的话：愿弟兄们都喜乐。要作完全人；要受安慰；要同心合意；要彼此和睦。如此，仁爱和平的　神必常与你们同在。",
-    
-    # 加拉太书
-    "加 2:20": "我已经与基督同钉十字架，现在活着的不再是我，乃是基督在我里面活着；并且我如今在肉身活着，是因信　神的儿子而活；他是爱我，为我舍己。",
-    "加 5:22": "圣灵所结的果子，就是仁爱、喜乐、和平、忍耐、恩慈、良善、信实、",
-    "加 5:23": "温柔、节制。这样的事没有律法禁止。",
-    
-    # 以弗所书
-    "弗 1:3": "愿颂赞归与我们主耶稣基督的父　神！他在基督里曾赐给我们天上各样属灵的福气：",
-    "弗 2:8-9": "你们得救是本乎恩，也因着信；这并不是出于自己，乃是　神所赐的；也不是出于行为，免得有人自夸。",
-    "弗 2:10": "我们原是他的工作，在基督耶稣里造成的，为要叫我们行善，就是　神所预备叫我们行的。",
-    "弗 3:20": "　神能照着运行在我们心里的大力充充足足的成就一切，超过我们所求所想的。",
-    "弗 4:15": "惟用爱心说诚实话，凡事长进，连于元首基督，",
-    "弗 4:32": "并要以恩慈相待，存怜悯的心，彼此饶恕，正如　神在基督里饶恕了你们一样。",
-    "弗 5:25-26": "你们作丈夫的，要爱你们的妻子，正如基督爱教会，为教会舍己。要用水藉着道把教会洗净，成为圣洁，",
-    "弗 6:10-11": "我还有末了的话：你们要靠着主，倚赖他的大能大力作刚强的人。要穿戴　神所赐的全副军装，就能抵挡魔鬼的诡计。",
-    
-    # 腓立比书
-    "腓 1:6": "我深信那在你们心里动了善工的，必成全这工，直到耶稣基督的日子。",
-    "腓 2:5-7": "你们当以基督耶稣的心为心：他本有　神的形像，不以自己与　神同等为强夺的；反倒虚己，取了奴仆的形像，成为人的样式；",
-    "腓 3:13-14": "弟兄们，我不是以为自己已经得着了；我只有一件事，就是忘记背后，努力面前的，向着标竿直跑，要得　神在基督耶稣里从上面召我来得的奖赏。",
-    "腓 4:6-7": "应当一无挂虑，只要凡事藉着祷告、祈求，和感谢，将你们所要的告诉　神。　神所赐、出人意外的平安必在基督耶稣里保守你们的心怀意念。",
-    "腓 4:13": "我靠着那加给我力量的，凡事都能做。",
-    "腓 4:19": "我的　神必照他荣耀的丰富，在基督耶稣里，使你们一切所需用的都充足。",
-    
-    # 歌罗西书
-    "西 3:16": "当用各样的智慧，把基督的道理丰丰富富的存在心里，用诗章、颂词、灵歌，彼此教导，互相劝戒，心被恩感，歌颂　神。",
-    "西 3:23": "无论做什么，都要从心里做，像是给主做的，不是给人做的，",
-    
-    # 帖撒罗尼迦前书
-    "帖前 5:16": "要常常喜乐，",
-    "帖前 5:17": "不住的祷告，",
-    "帖前 5:18": "凡事谢恩；因为这是　神在基督耶稣里向你们所定的旨意。",
-    
-    # 提摩太前书
-    "提前 2:5": "因为只有一位　神，在　神和人中间，只有一位中保，乃是降世为人的基督耶稣；",
-    "提前 6:6": "然而，敬虔加上知足的心便是大利了；",
-    "提前 6:10": "贪财是万恶之根。有人贪恋钱财，就被引诱离了真道，用许多愁苦把自己刺透了。",
-    
-    # 提摩太后书
-    "提后 2:2-6": "你在许多见证人面前听见我所教训的，也要交托那忠心能教导别人的人。你要和我同受苦难，好像基督耶稣的精兵。凡在军中当兵的，不将世务缠身，好叫那招他当兵的人喜悦。人若在场上比武，非按规矩，就不能得冠冕。劳力的农夫理当先得粮食。",
-    "提后 2:15": "你当竭力在　神面前得蒙喜悦，作无愧的工人，按着正意分解真理的道。",
-    "提后 3:16": "圣经都是　神所默示的，于教训、督责、使人归正、教导人学义都是有益的，",
-    "提后 3:17": "叫属　神的人得以完全，预备行各样的善事。",
-    
-    # 希伯来书
-    "来 2:14": "儿女既同有血肉之体，他也照样亲自成了血肉之体，特要藉着死败坏那掌死权的，就是魔鬼，",
-    "来 2:14-15": "儿女既同有血肉之体，他也照样亲自成了血肉之体，特要藉着死败坏那掌死权的，就是魔鬼，并要释放那些一生因怕死而为奴仆的人。",
-    "来 2:15": "并要释放那些一生因怕死而为奴仆的人。",
-    "来 4:12": "　神的道是活泼的，是有功效的，比一切两刃的剑更快，甚至魂与灵，骨节与骨髓，都能刺入、剖开，连心中的思念和主意都能辨明。",
-    "来 4:16": "所以，我们只管坦然无惧的来到施恩的宝座前，为要得怜恤，蒙恩惠，作随时的帮助。",
-    "来 6:1-2": "所以，我们应当离开基督道理的开端，竭力进到完全的地步，不必再立根基，就如那懊悔死行，信靠　神、各样洗礼、按手之礼、死人复活，以及永远审判各等教训。",
-    "来 6:19": "我们有这指望，如同灵魂的锚，又坚固又牢靠，且通入幔内。",
-    "来 9:27": "按着定命，人人都有一死，死后且有审判。",
-    "来 9:27-28": "按着定命，人人都有一死，死后且有审判。像这样，基督既然一次被献，担当了多人的罪，将来要向那等候他的人第二次显现，并与罪无关，乃是为拯救他们。",
-    "来 10:24-25": "又要彼此相顾，激发爱心，勉励行善。你们不可停止聚会，好像那些停止惯了的人，倒要彼此劝勉，既知道那日子临近，就更当如此。",
-    "来 10:26-27": "因为我们得知真道以后，若故意犯罪，赎罪的祭就再没有了；惟有战惧等候审判和那烧灭众敌人的烈火。",
-    "来 10:28-29": "人干犯摩西的律法，凭两三个见证人，尚且不得怜恤而死，何况人践踏　神的儿子，将那使他成圣之约的血当作平常，又亵慢施恩的圣灵，你们想，他要受的刑罚该怎样加重呢！",
-    "来 10:30-31": "因为我们知道谁说：「伸冤在我，我必报应」；又说：「主要审判他的百姓。」落在永生　神的手里，真是可怕的！",
-    "来 11:1": "信就是所望之事的实底，是未见之事的确据。",
-    "来 11:11": "因着信，连撒拉自己，虽然过了生育的岁数，还能怀孕，因她以为那应许她的是可信的。",
-    "来 11:4": "亚伯因着信，献祭与　神，比该隐所献的更美，因此便得了称义的见证，就是　神指他礼物作的见证。他虽然死了，却因这信，仍旧说话。",
-    "来 11:6": "人非有信，就不能得　神的喜悦；因为到　神面前来的人必须信有　神，且信他赏赐那寻求他的人。",
-    "来 11:8": "亚伯拉罕因着信，蒙召的时候就遵命出去，往将来要得为业的地方去；出去的时候，还不知往哪里去。",
-    "来 11:17": "亚伯拉罕因着信，被试验的时候，就把以撒献上；这便是那欢喜领受应许的，将自己独生的儿子献上。",
-    "来 11:24-25": "摩西因着信，长大了就不肯称为法老女儿之子。他宁可和　神的百姓同受苦害，也不愿暂时享受罪中之乐。",
-    "来 11:27-28": "他因着信，就离开埃及，不怕王怒；因为他恒心忍耐，如同看见那不能看见的主。他因着信，就守（或译：立）逾越节，行洒血的礼，免得那灭长子的临近以色列人。",
-    "来 11:29": "他们因着信，过红海如行干地；埃及人试着要过去，就被吞灭了。",
-    "来 11:30": "以色列人因着信，围绕耶利哥城七日，城墙就倒塌了。",
-    "来 11:37-39": "被石头打死，被锯锯死，受试探，被刀杀，披着绵羊山羊的皮各处奔跑，受穷乏、患难、苦害，在旷野、山岭、山洞、地穴，飘流无定，本是世界不配有的人。这些人都是因信得了美好的证据，却仍未得着所应许的；",
-    "来 12:1": "我们既有这许多的见证人，如同云彩围着我们，就当放下各样的重担，脱去容易缠累我们的罪，存心忍耐，奔那摆在我们前头的路程，",
-    "来 12:2": "仰望为我们信心创始成终的耶稣。他因那摆在前面的喜乐，就轻看羞辱，忍受了十字架的苦难，便坐在　神宝座的右边。",
-    "来 12:8": "管教原是众子所共受的，你们若不受管教，就是私子，不是儿子了。",
-    "来 12:10": "生身的父都是暂随己意管教我们；惟有万灵的父管教我们，是要我们得益处，使我们在他的圣洁上有分。",
-    "来 12:11": "凡管教的事，当时不觉得快乐，反觉得愁苦；后来却为那经练过的人结出平安的果子，就是义。",
-    "来 12:28-29": "所以我们既得了不能震动的国，就当感恩，照　神所喜悦的，用虔诚、敬畏的心事奉　神。因为我们的　神乃是烈火。",
-    "来 13:5": "你们存心不可贪爱钱财，要以自己所有的为足；因为主曾说：「我总不撇下你，也不丢弃你。」",
-    "来 13:7": "从前引导你们、传　神之道给你们的人，你们要想念他们，效法他们的信心，留心看他们为人的结局。",
-    "来 13:8": "耶稣基督昨日、今日、一直到永远，是一样的。",
-    "来 13:17": "你们要依从那些引导你们的，且要顺服；因他们为你们的灵魂时刻警醒，好像那将来交账的人。你们要使他们交的时候有快乐，不至忧愁；若忧愁就与你们无益了。",
-    
-    # 雅各书
-    "雅 1:2-3": "我的弟兄们，你们落在百般试炼中，都要以为大喜乐；因为知道你们的信心经过试验，就生忍耐。",
-    "雅 1:4": "但忍耐也当成功，使你们成全、完备，毫无缺欠。",
-    "雅 1:5": "你们中间若有缺少智慧的，应当求那厚赐与众人、也不斥责人的　神，主就必赐给他。",
-    "雅 1:6-8": "只要凭着信心求，一点不疑惑；因为那疑惑的人，就像海中的波浪，被风吹动翻腾。这样的人不要想从主那里得什么。心怀二意的人，在他一切所行的路上都没有定见。",
-    "雅 1:12": "忍受试探的人是有福的，因为他经过试验以后，必得生命的冠冕，这是主应许给那些爱他之人的。",
-    "雅 1:17": "各样美善的恩赐和各样全备的赏赐都是从上头来的，从众光之父那里降下来的；在他并没有改变，也没有转动的影儿。",
-    "雅 1:22": "只是你们要行道，不要单单听道，自己欺哄自己。",
-    "雅 1:23-24": "因为听道而不行道的，就像人对着镜子看自己本来的面目，看见，走后，随即忘了他的相貌如何。",
-    "雅 1:25": "惟有详细察看那全备、使人自由之律法的，并且时常如此，这人既不是听了就忘，乃是实在行出来，就在他所行的事上必然得福。",
-    "雅 2:10": "因为凡遵守全律法的，只在一条上跌倒，他就是犯了众条。",
-    "雅 2:12": "你们既然要按使人自由的律法受审判，就该照这律法说话行事。",
-    "雅 2:17": "这样，信心若没有行为就是死的。",
-    "雅 2:19-20": "你信　神只有一位，你信的不错；鬼魔也信，却是战惊。虚浮的人哪，你愿意知道没有行为的信心是死的吗？",
-    "雅 3:1": "我的弟兄们，不要多人作师傅，因为晓得我们要受更重的判断。",
-    "雅 4:3": "你们求也得不着，是因为你们妄求，要浪费在你们的宴乐中。",
-    "雅 4:7-8": "故此，你们要顺服　神。务要抵挡魔鬼，魔鬼就必离开你们逃跑了。你们亲近　神，　神就必亲近你们。有罪的人哪，要洁净你们的手！心怀二意的人哪，要清洁你们的心！",
-    "雅 5:14-15": "你们中间有病了的呢，他就该请教会的长老来；他们可以奉主的名用油抹他，为他祷告。出于信心的祈祷要救那病人，主必叫他起来；他若犯了罪，也必蒙赦免。",
-    "雅 5:16": "所以你们要彼此认罪，互相代求，使你们可以得医治。义人祈祷所发的力量是大有功效的。",
-    "雅 5:17-18": "以利亚与我们是一样性情的人，他恳切祷告，求不要下雨，雨就三年零六个月不下在地上。他又祷告，天就降下雨来，地也生出土产。",
-    
-    # 彼得前书  
-    "彼前 1:3": "愿颂赞归与我们主耶稣基督的父　神！他曾照自己的大怜悯，藉耶稣基督从死里复活，重生了我们，叫我们有活泼的盼望，",
-    "彼前 2:9": "惟有你们是被拣选的族类，是有君尊的祭司，是圣洁的国度，是属　神的子民，要叫你们宣扬那召你们出黑暗入奇妙光明者的美德。",
-    "彼前 3:7": "你们作丈夫的也要按情理和妻子同住；因她比你软弱，与你一同承受生命之恩的，所以要敬重她。这样，便叫你们的祷告没有阻碍。",
-    "彼前 3:15": "只要心里尊主基督为圣。有人问你们心中盼望的缘由，就要常作准备，以温柔、敬畏的心回答各人；",
-    "彼前 4:10": "各人要照所得的恩赐彼此服事，作　神百般恩赐的好管家。",
-    "彼前 5:7": "你们要将一切的忧虑卸给　神，因为他顾念你们。",
-    
-    # 彼得后书
-    "彼后 1:3": "　神的神能已将一切关乎生命和虔敬的事赐给我们，皆因我们认识那用自己荣耀和美德召我们的主。",
-    "彼后 1:20-21": "第一要紧的，该知道经上所有的预言没有可随私意解说的；因为预言从来没有出于人意的，乃是人被圣灵感动，说出　神的话来。",
-    "彼后 3:5": "他们故意忘记，从太古，凭　神的命有了天，并从水而出、藉水而成的地。",
-    "彼后 3:9": "主所应许的尚未成就，有人以为他是耽延，其实不是耽延，乃是宽容你们，不愿有一人沉沦，乃愿人人都悔改。",
-    
-    # 约翰一书
-    "约一 1:6": "我们若说是与　神相交，却仍在黑暗里行，就是说谎话，不行真理了。",
-    "约一 1:7": "我们若在光明中行，如同　神在光明中，就彼此相交，他儿子耶稣的血也洗净我们一切的罪。",
-    "约一 1:8": "我们若说自己无罪，便是自欺，真理不在我们心里了。",
-    "约一 1:9": "我们若认自己的罪，　神是信实的，是公义的，必要赦免我们的罪，洗净我们一切的不义。",
-    "约一 2:1": "我小子们哪，我将这些话写给你们，是要叫你们不犯罪。若有人犯罪，在父那里我们有一位中保，就是那义者耶稣基督。",
-    "约一 3:2": "亲爱的弟兄啊，我们现在是　神的儿女，将来如何，还未显明；但我们知道，主若显现，我们必要像他，因为必得见他的真体。",
-    "约一 3:2-3": "亲爱的弟兄啊，我们现在是　神的儿女，将来如何，还未显明；但我们知道，主若显现，我们必要像他，因为必得见他的真体。凡向他有这指望的，就洁净自己，像他洁净一样。",
-    "约一 3:3": "凡向他有这指望的，就洁净自己，像他洁净一样。",
-    "约一 3:8": "犯罪的是属魔鬼，因为魔鬼从起初就犯罪。　神的儿子显现出来，为要除灭魔鬼的作为。",
-    "约一 3:16": "主为我们舍命，我们从此就知道何为爱；我们也当为弟兄舍命。",
-    "约一 4:8": "没有爱心的，就不认识　神，因为　神就是爱。",
-    "约一 4:19": "我们爱，因为　神先爱我们。",
-    "约一 5:1-5": "凡信耶稣是基督的，都是从　神而生，凡爱生他之　神的，也必爱从　神生的。我们若爱　神，又遵守他的诫命，从此就知道我们爱　神的儿女。我们遵守　神的诫命，这就是爱他了，并且他的诫命不是难守的。因为凡从　神生的，就胜过世界；使我们胜了世界的，就是我们的信心。胜过世界的是谁呢？不是那信耶稣是　神儿子的吗？",
-    "约一 5:3": "我们遵守　神的诫命，这就是爱他了，并且他的诫命不是难守的。",
-    "约一 5:4": "因为凡从　神生的，就胜过世界；使我们胜了世界的，就是我们的信心。",
-    "约一 5:5": "胜过世界的是谁呢？不是那信耶稣是　神儿子的吗？",
-    "约一 5:13": "我将这些话写给你们信奉　神儿子之名的人，要叫你们知道自己有永生。",
-    "约一 5:14-15": "我们若照他的旨意求什么，他就听我们，这是我们向他所存坦然无惧的心。既然知道他听我们一切所求的，就知道我们所求于他的，无不得着。",
-    
-    # 启示录
-    "启 1:8": "主　神说：「我是阿拉法，我是俄梅戛，是昔在、今在、以后永在的全能者。」",
-    "启 2:10": "你将要受的苦你不用怕。魔鬼要把你们中间几个人下在监里，叫你们被试炼，你们必受患难十日。你务要至死忠心，我就赐给你生命的冠冕。",
-    "启 3:20": "看哪，我站在门外叩门，若有听见我声音就开门的，我要进到他那里去，我与他，他与我一同坐席。",
-    "启 4:9-10": "每逢四活物将荣耀、尊贵、感谢归给那坐在宝座上、活到永永远远者的时候，那二十四位长老就俯伏在坐宝座的面前敬拜那活到永永远远的，又把他们的冠冕放在宝座前，",
-    "启 4:11": "我们的主，我们的　神，你是配得荣耀、尊贵、权柄的；因为你创造了万物，并且万物是因你的旨意被创造而有的。」",
-    "启 5:9": "他们唱新歌，说：「你配拿书卷，配揭开七印；因为你曾被杀，用自己的血从各族、各方、各民、各国中买了人来，叫他们归于　神，",
-    "启 14:13": "我听见从天上有声音说：「你要写下：从今以后，在主里面而死的人有福了！」圣灵说：「是的，他们息了自己的劳苦，作工的果效也随着他们。」",
-    "启 20:15": "若有人名字没记在生命册上，他就被扔在火湖里。",
-    "启 21:4": "　神要擦去他们一切的眼泪；不再有死亡，也不再有悲哀、哭号、疼痛，因为以前的事都过去了。」",
-    "启 21:8": "惟有胆怯的、不信的、可憎的、杀人的、淫乱的、行邪术的、拜偶像的，和一切说谎话的，他们的分就在烧着硫磺的火湖里；这是第二次的死。",
-    "启 22:13": "我是阿拉法，我是俄梅戛；我是首先的，我是末后的；我是初，我是终。」",
-    
-    # 诗篇（L4补充）
-    "诗篇 119:97,98,105,114": "我何等爱慕你的律法，终日不住地思想。你的命令常存在我心里，使我比仇敌有智慧。你的话是我脚前的灯，是我路上的光。你是我藏身之处，又是我的盾牌；我甚仰望你的话语。",
-    
-    # 马太福音（L4补充）
-    "马太福音 4:4": "耶稣却回答说：经上记着说，人活着，不是单靠食物，乃是靠神口里所出的一切话。",
-    
-    # 彼得后书（L5_S1补充）
-    "彼后 1:20,21": "第一要紧的，该知道经上所有的预言没有可随私意解说的；因为预言从来没有出于人意的，乃是人被圣灵感动，说出神的话来。",
-    
-    # 雅各书（L5_S4补充）
-    "雅 1:23,24": "因为听道而不行道的，就像人对着镜子看自己本来的面目，看见，走后，随即忘了他的相貌如何。",
-    
-    # 路加福音（L5_S4补充）
-    "请阅读路加福音 6:46-49": "你们为什么称呼我'主啊，主啊'，却不遵我的话行呢？凡到我这里来，听见我的话就去行的，我要告诉你们他像什么人：他像一个人盖房子，深深地挖地，把根基安在磐石上；到发大水的时候，水冲那房子，房子总不能摇动，因为根基立在磐石上。惟有听见不去行的，就像一个人在土地上盖房子，没有根基；水一冲，随即倒塌了，并且那房子坏得很大。",
-    "路加福音 5:27,28": "这事以后，耶稣出去，看见一个税吏，名叫利未，坐在税关上，就对他说：你跟从我来。他就撇下所有的，起来，跟从了耶稣。",
-    "路加福音 9:23,24": "耶稣又对众人说：若有人要跟从我，就当舍己，天天背起他的十字架来跟从我。因为，凡要救自己生命的，必丧掉生命；凡为我丧掉生命的，必救了生命。",
-    
-    # 哥林多前书（L5_S4补充）
-    "哥林多前书 11:1": "你们该效法我，像我效法基督一样。",
-    
-    # 提摩太后书（L6_S1补充）
-    "请阅读提摩太后书 2:2-6": "你在许多见证人面前听见我所教训的，也要交托那忠心能教导别人的人。你要和我同受苦难，好像基督耶稣的精兵。凡在军中当兵的，不将世务缠身，好叫那招他当兵的人喜悦。人若在场上比武，非按规矩，就不能得冠冕。劳力的农夫理当先得粮食。",
-    
-    # 路加福音（L6_S2补充）
-    "请阅读路加福音 14:27-33": "凡不背着自己十字架跟从我的，也不能作我的门徒。你们哪一个要盖一座楼，不先坐下算计花费，能盖成不能呢？恐怕安了地基，不能成功，看见的人都笑话他，说：这个人开了工，却不能完工。或是一个王出去和别的王打仗，岂不先坐下酌量，能用一万兵去敌那领二万兵来攻打他的吗？若是不能，就趁敌人还远的时候，派使者去求和息争的条款。这样，你们无论什么人，若不撇下一切所有的，就不能作我的门徒。",
-    
-    # 彼得后书（L6_S4补充）
-    "彼后 1:3-4": "神的神能已将一切关乎生命和虔敬的事赐给我们，皆因我们认识那用自己荣耀和美德召我们的主。因此，他已将又宝贵又极大的应许赐给我们，叫我们既脱离世上从情欲来的败坏，就得与神的性情有分。",
-    "彼后 1:4": "因此，他已将又宝贵又极大的应许赐给我们，叫我们既脱离世上从情欲来的败坏，就得与神的性情有分。",
-    "彼后 1:5-7": "正因这缘故，你们要分外的殷勤；有了信心，又要加上德行；有了德行，又要加上知识；有了知识，又要加上节制；有了节制，又要加上忍耐；有了忍耐，又要加上虔敬；有了虔敬，又要加上爱弟兄的心；有了爱弟兄的心，又要加上爱众人的心。",
-    "彼后 1:8": "你们若充充足足的有这几样，就必使你们在认识我们的主耶稣基督上不至于闲懒不结果子了。",
-    "彼后 1:9": "人若没有这几样，就是眼瞎，只看见近处的，忘了他旧日的罪已经得了洁净。",
-    "彼后 1:10,11": "所以弟兄们，应当更加殷勤，使你们所蒙的恩召和拣选坚定不移。你们若行这几样，就永不失脚。这样，必叫你们丰丰富富的得以进入我们主救主耶稣基督永远的国。",
-    
-    # 雅各书（L6_S4补充）
-    "雅 1:2,3": "我的弟兄们，你们落在百般试炼中，都要以为大喜乐；因为知道你们的信心经过试验，就生忍耐。",
-    
-    # 马太福音（L6_S5补充）
-    "请阅读马太福音 28:18-20": "耶稣进前来，对他们说：天上地下所有的权柄都赐给我了。所以，你们要去，使万民作我的门徒，奉父、子、圣灵的名给他们施洗。凡我所吩咐你们的，都教训他们遵守，我就常与你们同在，直到世界的末了。",
-    "马太福音 16:18": "我还告诉你，你是彼得，我要把我的教会建造在这磐石上；阴间的权柄，不能胜过他。",
-    
-    # 使徒行传（L6_S5补充）
-    "使徒行传 2:42-47": "都恒心遵守使徒的教训，彼此交接，掰饼，祈祷。众人都惧怕；使徒又行了许多奇事神迹。信的人都在一处，凡物公用；并且卖了田产，家业，照各人所需用的分给各人。他们天天同心合意恒切的在殿里，且在家中掰饼，存着欢喜、诚实的心用饭，赞美神，得众民的喜爱。主将得救的人天天加给他们。",
-    
-    # 以弗所书（L6_S5补充）
-    "以弗所书 4:4-6": "身体只有一个，圣灵只有一个，正如你们蒙召同有一个指望。一主，一信，一洗，一神，就是众人的父，超乎众人之上，贯乎众人之中，也住在众人之内。",
-    
-    # 使徒行传（L7_S1补充）
-    "请阅读使徒行传 2:42-47": "都恒心遵守使徒的教训，彼此交接，掰饼，祈祷。众人都惧怕；使徒又行了许多奇事神迹。信的人都在一处，凡物公用；并且卖了田产，家业，照各人所需用的分给各人。他们天天同心合意恒切的在殿里，且在家中掰饼，存着欢喜、诚实的心用饭，赞美神，得众民的喜爱。主将得救的人天天加给他们。",
-    
-    # 彼得前书（L7_S3补充）
-    "彼前 5:1-4": "我这作长老、作基督受苦的见证、同享后来所要显现之荣耀的，劝你们中间与我同作长老的人：务要牧养在你们中间神的群羊，按着神旨意照管他们；不是出于勉强，乃是出于甘心；也不是因为贪财，乃是出于乐意；也不是辖制所托付你们的，乃是作群羊的榜样。到了牧长显现的时候，你们必得那永不衰残的荣耀冠冕。",
-    
-    # 希伯来书（L7_S4补充）
-    "请阅读希伯来书 12:8-11": "管教原是众子所共受的，你们若不受管教，就是私子，不是儿子了。再者，我们曾有生身的父管教我们，我们尚且敬重他，何况万灵的父，我们岂不更当顺服他得生吗？生身的父都是暂随己意管教我们；惟有万灵的父管教我们，是要我们得益处，使我们在他的圣洁上有分。凡管教的事，当时不觉得快乐，反觉得愁苦；后来却为那经练过的人结出平安的果子，就是义。",
-    
-    # 哥林多前书（L7_S5补充）
-    "请阅读哥林多前书 11:23-32": "我当日传给你们的，原是从主领受的，就是主耶稣被卖的那一夜，拿起饼来，祝谢了，就掰开，说：这是我的身体，为你们舍的，你们应当如此行，为的是记念我。饭后，也照样拿起杯来，说：这杯是用我的血所立的新约，你们每逢喝的时候，要如此行，为的是记念我。你们每逢吃这饼，喝这杯，是表明主的死，直等到他来。所以，无论何人，不按理吃主的饼，喝主的杯，就是干犯主的身主的血了。人应当自己省察，然后吃这饼，喝这杯。因为人吃喝，若不分辨是主的身体，就是吃喝自己的罪了。因此，在你们中间有好些软弱的与患病的，死的也不少。我们若是先省察自己，就不至于受审。我们受审的时候，乃是被主惩治，免得我们和世人一同定罪。",
-    
-    # 腓立比书（L7_S5补充）
-    "腓立比书 4:4-6": "你们要靠主常常喜乐。我再说，你们要喜乐。当叫众人知道你们谦让的心。主已经近了。应当一无挂虑，只要凡事藉着祷告、祈求，和感谢，将你们所要的告诉神。",
-    
-    # 提摩太前书（L7_S5补充）
-    "提摩太前书 2:8": "我愿男人无忿怒，无争论，举起圣洁的手，随处祷告。",
-    
-    # 雅各书（L7_S5补充）
-    "雅各书 5:16": "所以你们要彼此认罪，互相代求，使你们可以得医治。义人祈祷所发的力量是大有功效的。",
-    
-    # 马太福音（L8_S1补充）
-    "请阅读马太福音 6:5-13": "你们祷告的时候，不可像那假冒为善的人，爱站在会堂里和十字路口上祷告，故意叫人看见。我实在告诉你们，他们已经得了他们的赏赐。你祷告的时候，要进你的内屋，关上门，祷告你在暗中的父；你父在暗中察看，必然报答你。你们祷告，不可像外邦人，用许多重复话，他们以为话多了必蒙垂听。你们不可效法他们；因为你们没有祈求以先，你们所需用的，你们的父早已知道了。所以，你们祷告要这样说：我们在天上的父：愿人都尊你的名为圣。愿你的国降临；愿你的旨意行在地上，如同行在天上。我们日用的饮食，今日赐给我们。免我们的债，如同我们免了人的债。不叫我们遇见试探；救我们脱离凶恶。因为国度、权柄、荣耀，全是你的，直到永远。阿们！",
-    
-    # 约翰一书（L8_S2补充）
-    "约壹 5:14,15": "我们若照他的旨意求什么，他就听我们，这是我们向他所存坦然无惧的心。既然知道他听我们一切所求的，就知道我们所求于他的，无不得着。",
-    
-    # 雅各书（L8_S2补充）
-    "雅 5:17,18": "以利亚与我们是一样性情的人，他恳切祷告，求不要下雨，雨就三年零六个月不下在地上。他又祷告，天就降下雨来，地也生出土产。",
-    
-    # 希伯来书（L8_S5补充）
-    "来 10:24,25": "又要彼此相顾，激发爱心，勉励行善。你们不可停止聚会，好像那些停止惯了的人，倒要彼此劝勉，既知道那日子临近，就更当如此。",
-    "来 12:28,29": "所以我们既得了不能震动的国，就当感恩，照神所喜悦的，用虔诚、敬畏的心事奉神。因为我们的神乃是烈火。",
-    "希伯来书 11:1": "信就是所望之事的实底，是未见之事的确据。",
-    
-    # 创世记（L8_S5补充）
-    "创世记 15:5,6": "于是领他走到外边，说：你向天观看，数算众星，能数得过来吗？又对他说：你的后裔将要如此。亚伯兰信耶和华，耶和华就以此为他的义。",
-    
-    # 罗马书（L8_S5补充）
-    "罗马书 1:17": "因为神的义正在这福音上显明出来；这义是本于信，以至于信。如经上所记：义人必因信得生。",
-    
-    # 希伯来书（L9_S1补充）
-    "来 6:1,2": "所以，我们应当离开基督道理的开端，竭力进到完全的地步，不必再立根基，就如那懊悔死行，信靠神，各样洗礼、按手之礼、死人复活，以及永远审判各等教训。",
-    
-    # 罗马书（L9_S2补充）
-    "请阅读罗马书 5:1-2": "我们既因信称义，就藉着我们的主耶稣基督得与神相和。我们又藉着他，因信得进入现在所站的这恩典中，并且欢欢喜喜盼望神的荣耀。",
-    "请阅读罗马书 3:21-28": "但如今，神的义在律法以外已经显明出来，有律法和先知为证：就是神的义，因信耶稣基督加给一切相信的人，并没有分别。因为世人都犯了罪，亏缺了神的荣耀；如今却蒙神的恩典，因基督耶稣的救赎，就白白地称义。神设立耶稣作挽回祭，是凭着耶稣的血，藉着人的信，要显明神的义；因为他用忍耐的心宽容人先时所犯的罪，好在今时显明他的义，使人知道他自己为义，也称信耶稣的人为义。既是这样，哪里能夸口呢？没有可夸的了。用何法没有的呢？是用立功之法吗？不是，乃用信主之法。所以（有古卷：因为）我们看定了：人称义是因着信，不在乎遵行律法。",
-    
-    # 雅各书（L9_S3补充）
-    "雅 2:19,20": "你信神只有一位，你信的不错；鬼魔也信，却是战惊。虚浮的人哪，你愿意知道没有行为的信心是死的吗？",
-    
-    # 希伯来书（L9_S3补充）
-    "请阅读希伯来书 11:24-30": "摩西因着信，长大了就不肯称为法老女儿之子。他宁可和神的百姓同受苦害，也不愿暂时享受罪中之乐。他看为基督受的凌辱比埃及的财物更宝贵，因他想望所要得的赏赐。他因着信，就离开埃及，不怕王怒；因为他恒心忍耐，如同看见那不能看见的主。他因着信，就守（或译：立）逾越节，行洒血的礼，免得那灭长子的临近以色列人。他们因着信，过红海如行干地；埃及人试着要过去，就被吞灭了。以色列人因着信，围绕耶利哥城七日，城墙就倒塌了。",
-    "来 11:27,28": "他因着信，就离开埃及，不怕王怒；因为他恒心忍耐，如同看见那不能看见的主。他因着信，就守逾越节，行洒血的礼，免得那灭长子的临近以色列人。",
-    
-    # 约翰一书（L9_S3补充）
-    "请阅读约翰壹书 5:1-5": "凡信耶稣是基督的，都是从神而生，凡爱生他之神的，也必爱从神生的。我们若爱神，又遵守他的诫命，从此就知道我们爱神的儿女。我们遵守神的诫命，这就是爱他了，并且他的诫命不是难守的。因为凡从神生的，就胜过世界；使我们胜了世界的，就是我们的信心。胜过世界的是谁呢？不是那信耶稣是神儿子的吗？",
-    "约壹 5:3": "我们遵守神的诫命，这就是爱他了，并且他的诫命不是难守的。",
-    "约壹 5:4": "因为凡从神生的，就胜过世界；使我们胜了世界的，就是我们的信心。",
-    "约壹 5:5": "胜过世界的是谁呢？不是那信耶稣是神儿子的吗？",
-    
-    # 罗马书（L9_S4补充）
-    "请阅读罗马书 4:19-21": "他将近百岁的时候，虽然想到自己的身体如同已死，撒拉的生育已经断绝，他的信心还是不软弱；并且仰望神的应许，总没有因不信心里起疑惑，反倒因信心里得坚固，将荣耀归给神，且满心相信神所应许的必能做成。",
-    
-    # 约翰一书（L9_S5补充）
-    "请阅读约翰壹书 3:2-3": "亲爱的弟兄啊，我们现在是神的儿女，将来如何，还未显明；但我们知道，主若显现，我们必要像他，因为必得见他的真体。凡向他有这指望的，就洁净自己，像他洁净一样。",
-    "约壹 3:2": "亲爱的弟兄啊，我们现在是神的儿女，将来如何，还未显明；但我们知道，主若显现，我们必要像他，因为必得见他的真体。",
-    "约壹 3:3": "凡向他有这指望的，就洁净自己，像他洁净一样。",
-    
-    # 哥林多后书（L9_S5补充）
-    "哥林多后书 9:6-8,11": "少种的少收，多种的多收，这话是真的。各人要随本心所酌定的，不要作难，不要勉强，因为捐得乐意的人是神所喜爱的。神能将各样的恩惠多多的加给你们，使你们凡事常常充足，能多行各样善事。凡事富足，可以多多施舍，就藉着我们使感谢归于神。",
-    
-    # 哥林多后书（L10_S2补充）
-    "请阅读哥林多后书 9:6-11": "少种的少收，多种的多收，这话是真的。各人要随本心所酌定的，不要作难，不要勉强，因为捐得乐意的人是神所喜爱的。神能将各样的恩惠多多的加给你们，使你们凡事常常充足，能多行各样善事。如经上所记：他施舍钱财，周济贫穷；他的仁义存到永远。那赐种给撒种的，赐粮给人吃的，必多多加给你们种地的种子，又增添你们仁义的果子；叫你们凡事富足，可以多多施舍，就藉着我们使感谢归于神。",
-    
-    # 玛拉基书（L10_S3补充）
-    "请阅读玛拉基书 3:8-12": "人岂可夺取神之物呢？你们竟夺取我的供物。你们却说：'我们在何事上夺取你的供物呢？'就是你们在当纳的十分之一和当献的供物上。因你们通国的人都夺取我的供物，咒诅就临到你们身上。万军之耶和华说：你们要将当纳的十分之一全然送入仓库，使我家有粮，以此试试我，是否为你们敞开天上的窗户，倾福与你们，甚至无处可容。万军之耶和华说：我必为你们斥责蝗虫（原文是吞噬者），不容他毁坏你们的土产。你们田间的葡萄树在未熟之先也不掉果子。万军之耶和华说：万国必称你们为有福的，因你们的地必成为喜乐之地。",
-    
-    # 哥林多后书（L10_S4补充）
-    "请阅读哥林多后书 8:1-5": "弟兄们，我把神赐给马其顿众教会的恩告诉你们，就是他们在患难中受大试炼的时候，仍有满足的快乐，在极深的贫穷之中，还格外显出他们乐捐的厚恩。我可以证明，他们是按着力量，而且也过了力量，自己甘心乐捐的，再三的求我们，准他们在这供给圣徒的恩情上有分；并且他们所做的，不但照我们所希望的，更照神的旨意先把自己献给主，又归附了我们。",
-    
-    # 马太福音（L10_S4补充）
-    "马太福音 28:18-20": "耶稣进前来，对他们说：天上地下所有的权柄都赐给我了。所以，你们要去，使万民作我的门徒，奉父、子、圣灵的名给他们施洗。凡我所吩咐你们的，都教训他们遵守，我就常与你们同在，直到世界的末了。",
-    
-    # 使徒行传（L11_S1补充）
-    "请阅读使徒行传 20:20-21": "你们也知道，凡与你们有益的，我没有一样避讳不说的，或在众人面前，或在各人家里，我都教导你们；又对犹太人和希腊人证明当向神悔改，信靠我主耶稣基督。",
-    
-    # 约翰一书（L11_S3补充）
-    "约壹 3:8": "犯罪的是属魔鬼，因为魔鬼从起初就犯罪。神的儿子显现出来，为要除灭魔鬼的作为。",
-    
-    # 雅各书（L11_S4补充）
-    "雅 5:14,15": "你们中间有病了的呢，他就该请教会的长老来；他们可以奉主的名用油抹他，为他祷告。出于信心的祈祷要救那病人，主必叫他起来；他若犯了罪，也必蒙赦免。",
-    
-    # 诗篇（L11_S5补充）
-    "诗篇 9:7,8": "惟耶和华坐着为王，直到永远；他已经为审判设摆他的宝座。他要按公义审判世界，按正直判断万民。",
-    
-    # 传道书（L11_S5补充）
-    "传道书 3:17": "我心里说，神必审判义人和恶人；因为在那里，各样事务，一切工作，都有定时。",
-    
-    # 希伯来书（L11_S5补充）
-    "希伯来书 9:27,28": "按着定命，人人都有一死，死后且有审判。像这样，基督既然一次被献，担当了多人的罪，将来要向那等候他的人第二次显现，并与罪无关，乃是为拯救他们。",
-    
-    # 哥林多前书（L12_S1补充）
-    "请阅读哥林多前书 15:13-19": "若没有死人复活的事，基督也就没有复活了。若基督没有复活，我们所传的便是枉然，你们所信的也是枉然。并且明显我们是为神妄作见证的，因我们见证神是叫基督复活了。若死人真不复活，神也就没有叫基督复活了。因为若死人不复活，基督也就没有复活了。若基督没有复活，你们的信便是徒然，你们仍在罪里。就是在基督里睡了的人也灭亡了。我们若靠基督只在今生有指望，就算比众人更可怜。",
-    
-    # 哥林多后书（L12_S1补充）
-    "请阅读哥林多后书 5:6-10": "所以，我们时常坦然无惧，并且晓得我们住在身内，便与主相离。因我们行事为人是凭着信心，不是凭着眼见。我们坦然无惧，是更愿意离开身体与主同住。所以，无论是住在身内，离开身外，我们立了志向，要得主的喜悦。因为我们众人必要在基督台前显露出来，叫各人按着本身所行的，或善或恶受报。",
-    
-    # 希伯来书（L12_S1补充）
-    "请阅读希伯来书 2:14-15": "儿女既同有血肉之体，他也照样亲自成了血肉之体，特要藉着死败坏那掌死权的，就是魔鬼，并要释放那些一生因怕死而为奴仆的人。",
-    "来 2:14,15": "儿女既同有血肉之体，他也照样亲自成了血肉之体，特要藉着死败坏那掌死权的，就是魔鬼，并要释放那些一生因怕死而为奴仆的人。",
-    
-    # 约翰一书（L12_S2补充）
-    "约壹 1:6": "我们若说是与神相交，却仍在黑暗里行，就是说谎话，不行真理了。",
-    "约壹 1:8": "我们若说自己无罪，便是自欺，真理不在我们心里了。",
-    
-    # 希伯来书（L12_S2补充）
-    "请阅读希伯来书 10:26-31": "因为我们得知真道以后，若故意犯罪，赎罪的祭就再没有了；惟有战惧等候审判和那烧灭众敌人的烈火。人干犯摩西的律法，凭两三个见证人，尚且不得怜恤而死，何况人践踏神的儿子，将那使他成圣之约的血当作平常，又亵慢施恩的圣灵，你们想，他要受的刑罚该怎样加重呢！因为我们知道谁说：伸冤在我，我必报应；又说：主要审判他的百姓。落在永生神的手里，真是可怕的！",
-    "来 10:26,27": "因为我们得知真道以后，若故意犯罪，赎罪的祭就再没有了；惟有战惧等候审判和那烧灭众敌人的烈火。",
-    "来 10:28,29": "人干犯摩西的律法，凭两三个见证人，尚且不得怜恤而死，何况人践踏神的儿子，将那使他成圣之约的血当作平常，又亵慢施恩的圣灵，你们想，他要受的刑罚该怎样加重呢！",
-    "来 10:30,31": "因为我们知道谁说：伸冤在我，我必报应；又说：主要审判他的百姓。落在永生神的手里，真是可怕的！",
-    
-    # 罗马书（L12_S2补充）
-    "请阅读罗马书 3:23-26": "因为世人都犯了罪，亏缺了神的荣耀；如今却蒙神的恩典，因基督耶稣的救赎，就白白地称义。神设立耶稣作挽回祭，是凭着耶稣的血，藉着人的信，要显明神的义；因为他用忍耐的心宽容人先时所犯的罪，好在今时显明他的义，使人知道他自己为义，也称信耶稣的人为义。",
-    
-    # 马太福音（L12_S3补充）
-    "阅读马太福音 25:31-46": "当人子在他荣耀里，同着众天使降临的时候，要坐在他荣耀的宝座上。万民都要聚集在他面前。他要把他们分别出来，好像牧羊的分别绵羊山羊一般，把绵羊安置在右边，山羊在左边。于是王要向那右边的说：你们这蒙我父赐福的，可来承受那创世以来为你们所预备的国；因为我饿了，你们给我吃，渴了，你们给我喝；我作客旅，你们留我住；我赤身露体，你们给我穿；我病了、你们看顾我；我在监里，你们来看我。义人就回答说：主啊，我们什么时候见你饿了，给你吃，渴了，给你喝？什么时候见你作客旅，留你住，或是赤身露体，给你穿？又什么时候见你病了，或是在监里，来看你呢？王要回答说：我实在告诉你们，这些事你们既做在我这弟兄中一个最小的身上，就是做在我身上了。王又要向那左边的说：你们这被咒诅的人，离开我！进入那为魔鬼和他的使者所预备的永火里去！因为我饿了，你们不给我吃，渴了，你们不给我喝；我作客旅，你们不留我住；我赤身露体，你们不给我穿；我病了，我在监里，你们不来看顾我。他们也要回答说：主啊，我们什么时候见你饿了，或渴了，或作客旅，或赤身露体，或病了，或在监里，不伺候你呢？王要回答说：我实在告诉你们，这些事你们既不做在我这弟兄中一个最小的身上，就是不做在我身上了。这些人要往永刑里去；那些义人要往永生里去。",
-    
-    # 哥林多前书（L12_S4补充）
-    "请阅读哥林多前书 3:9-15": "因为我们是与神同工的；你们是神所耕种的田地，所建造的房屋。我照神所给我的恩，好像一个聪明的工头，立好了根基，有别人在上面建造；只是各人要谨慎怎样在上面建造。因为那已经立好的根基就是耶稣基督，此外没有人能立别的根基。若有人用金、银、宝石、草木、禾秸在这根基上建造，各人的工程必然显露，因为那日子要将它表明出来，有火发现；这火要试验各人的工程怎样。人在那根基上所建造的工程若存得住，他就要得赏赐。人的工程若被烧了，他就要受亏损，自己却要得救；虽然得救，乃像从火里经过的一样。",
-    
-    # 彼得后书（L12_S4补充）
-    "彼后 3:11,12": "这日子既然都要如此销化，你们为人该当怎样圣洁，怎样敬虔，切切仰望神的日子来到。在那日，天被火烧就销化了，有形质的都要被烈火镕化。",
-    
-    # 启示录（L12_S4补充）
-    "启 4:9,10": "每逢四活物将荣耀、尊贵、感谢归给那坐在宝座上、活到永永远远者的时候，那二十四位长老就俯伏在坐宝座的面前敬拜那活到永永远远的，又把他们的冠冕放在宝座前，说："
-}
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from verse_store import VerseStore
+
+# 经文库（第一次使用时打开，源文件变化时自动重建）
+_store = None
+
+def get_store():
+    """打开经文库"""
+    global _store
+    if _store is None:
+        _store = VerseStore.open()
+    return _store
 
 def find_missing_answers(json_file):
     """找到缺失答案的经文引用"""
@@ -584,21 +50,8 @@ def supplement_answers(json_file, max_supplements=5):
     supplemented = 0
     
     for key, reference in missing[:max_supplements]:
-        # 清理引用格式，去除多余空格和标点
-        clean_ref = reference.strip().replace('，', ',').replace('：', ':')
-        
-        # 尝试在经文数据库中查找
-        found_text = None
-        
-        # 直接匹配
-        if clean_ref in BIBLE_VERSES:
-            found_text = BIBLE_VERSES[clean_ref]
-        else:
-            # 尝试模糊匹配
-            for verse_ref, verse_text in BIBLE_VERSES.items():
-                if verse_ref.replace(' ', '') == clean_ref.replace(' ', ''):
-                    found_text = verse_text
-                    break
+        # 在经文库中按节查找并拼接（引用中的全角符号、空格由解析器统一处理）
+        found_text = get_store().lookup(reference)
         
         if found_text:
             data['answers'][key]['text'] = found_text
@@ -4,104 +4,162 @@
 为建立根基课程生成标准答案数据文件
 """
 
+import argparse
+import hashlib
 import json
 import os
 
-# 书卷映射（仅新约）
-BOOK_MAPPING = {
-    '太': 'matthew',
-    '可': 'mark',
-    '路': 'luke',
-    '约': 'john',
-    '徒': 'acts',
-    '罗': 'romans',
-    '林前': '1corinthians',
-    '林后': '2corinthians',
-    '加': 'galatians',
-    '弗': 'ephesians',
-    '腓': 'philippians',
-    '西': 'colossians',
-    '帖前': '1thessalonians',
-    '帖后': '2thessalonians',
-    '提前': '1timothy',
-    '提后': '2timothy',
-    '多': 'titus',
-    '门': 'philemon'
-}
-
-# 加载所有书卷数据
-books_data = {}
+import scripture_reference
+from verse_index import VerseIndex
+
+# 书卷映射（全部66卷的全名、简称和别名 -> 书卷ID）
+BOOK_MAPPING = scripture_reference.BOOK_IDS
+
+# 所有书卷的经文索引（以 (书卷ID, 章, 节) 为键）
+verse_index = VerseIndex()
+books_loaded = False
+
+# 增量生成清单：记录每个答案文件依赖的课程小节与书卷的内容哈希
+MANIFEST_FILE = 'data/answers/.manifest.json'
+# 生成逻辑变化时递增，使所有答案文件重新生成
+GENERATOR_VERSION = 2
 
 def load_all_books():
     """加载所有可用的书卷数据"""
-    for book_name, book_id in BOOK_MAPPING.items():
-        try:
-            with open(f'data/{book_id}.json', 'r', encoding='utf-8') as f:
-                book_data = json.load(f)
-                books_data[book_name] = {}
-                for verse in book_data['verses']:
-                    key = f"{verse['chapter']}:{verse['verse']}"
-                    books_data[book_name][key] = verse['zh']
-                print(f"✓ 已加载 {book_name} ({book_id})")
-        except FileNotFoundError:
-            print(f"✗ 未找到 {book_name} 数据")
+    global verse_index, books_loaded
+    verse_index = VerseIndex.open('data')
+    books_loaded = True
+    loaded = set(verse_index.books())
+    missing = []
+    for book_id, name, abbr, _ in scripture_reference.BOOKS:
+        if book_id in loaded:
+            print(f"✓ 已加载 {abbr} ({book_id})")
+        else:
+            missing.append(abbr)
+    print(f"✗ 未找到 {len(missing)} 卷书的数据: {' '.join(missing)}")
+    for book_id in verse_index.duplicates:
+        print(f"⚠️  {book_id} 有重复经文，只使用第一条: {verse_index.duplicate_summary(book_id)}")
 
 def parse_reference(ref):
-    """解析经文引用，支持范围和多节"""
-    import re
-    
-    # 例如: "创 1:10", "创 1:1-3", "赛 59:1,2", "罗 3:9-20,23"
-    match = re.match(r'^([\u4e00-\u9fa5]+)\s*(\d+):(.*)', ref)
-    if not match:
+    """解析经文引用，支持范围、多节和跨章范围"""
+    # 例如: "创 1:10", "创 1:1-3", "赛 59:1,2", "罗 3:9-20,23", "罗 7:24-8:2"
+    parsed = scripture_reference.parse(ref)
+    if parsed is None:
         return []
     
-    book_name = match.group(1)
-    chapter = int(match.group(2))
-    verse_part = match.group(3)
-    
-    verses = []
-    
-    # 处理逗号分隔的多个部分
-    parts = [p.strip() for p in verse_part.split(',')]
-    
-    for part in parts:
-        if '-' in part:
-            # 范围: "9-20"
-            start, end = part.split('-')
-            start = int(start.strip())
-            end = int(end.strip())
-            for v in range(start, end + 1):
-                verses.append({'book': book_name, 'chapter': chapter, 'verse': v})
-        else:
-            # 单节: "23"
-            verses.append({'book': book_name, 'chapter': chapter, 'verse': int(part)})
-    
-    return verses
+    return [{'book': parsed.book_name, 'chapter': chapter, 'verse': verse}
+            for chapter, verse in scripture_reference.expand(
+                parsed.ranges, verse_index, parsed.book_id)]
 
 def get_verse_text(book_name, chapter, verse):
     """获取经文文本"""
-    if book_name not in books_data:
+    book_id = BOOK_MAPPING.get(book_name)
+    if book_id is None:
         return None
     
-    key = f"{chapter}:{verse}"
-    return books_data[book_name].get(key)
+    return verse_index.text(book_id, chapter, verse)
 
 def get_reference_text(ref):
     """获取引用的完整经文文本"""
-    verses = parse_reference(ref)
-    if not verses:
+    parsed = scripture_reference.parse(ref)
+    if parsed is None or parsed.book_id is None:
         return None
     
     texts = []
-    for v in verses:
-        text = get_verse_text(v['book'], v['chapter'], v['verse'])
-        if text:
-            texts.append(text)
+    for verse_range in parsed.ranges:
+        for v in verse_index.range(parsed.book_id, verse_range.start, verse_range.end):
+            if v.get('zh'):
+                texts.append(v['zh'])
     
     return ' '.join(texts) if texts else None
 
-def generate_answer_files():
-    """为每一节生成答案数据文件"""
+def content_hash(data):
+    """JSON数据的稳定哈希"""
+    text = json.dumps(data, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+_book_hashes = {}
+
+def book_hash(book_id):
+    """书卷文件的内容哈希（同一次运行中只计算一次），文件不存在时为 None"""
+    if book_id not in _book_hashes:
+        path = f'data/{book_id}.json'
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                _book_hashes[book_id] = hashlib.sha256(f.read()).hexdigest()
+        else:
+            _book_hashes[book_id] = None
+    return _book_hashes[book_id]
+
+def section_dependencies(section):
+    """小节引用到的书卷ID（排序后）"""
+    book_ids = set()
+    for q in section['questions']:
+        for ref in q.get('references', []):
+            parsed = scripture_reference.parse(ref)
+            if parsed is not None and parsed.book_id is not None:
+                book_ids.add(parsed.book_id)
+    return sorted(book_ids)
+
+def load_manifest():
+    """读取增量生成清单"""
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if manifest.get('version') != GENERATOR_VERSION:
+        return {}
+    return manifest.get('files', {})
+
+def save_manifest(files):
+    """保存增量生成清单"""
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'version': GENERATOR_VERSION, 'files': files},
+                  f, ensure_ascii=False, indent=2, sort_keys=True)
+
+def build_section_answers(lesson_id, lesson_title, section_num, section):
+    """生成一个小节的答案数据"""
+    answer_data = {
+        'lesson_id': lesson_id,
+        'lesson_title': lesson_title,
+        'section_num': section_num,
+        'section_title': section['title'],
+        'answers': {}
+    }
+    
+    # 为每个问题生成答案
+    for q in section['questions']:
+        question_id = q['id']
+        references = q.get('references', [])
+        
+        if references:
+            for ref in references:
+                verse_text = get_reference_text(ref)
+                key = f"q{question_id}_{ref}"
+                
+                if verse_text:
+                    answer_data['answers'][key] = {
+                        'reference': ref,
+                        'text': verse_text,
+                        'has_data': True
+                    }
+                else:
+                    answer_data['answers'][key] = {
+                        'reference': ref,
+                        'text': '',
+                        'has_data': False,
+                        'note': '暂无此经文数据'
+                    }
+    
+    return answer_data
+
+def generate_answer_files(force=False):
+    """为每一节生成答案数据文件
+    
+    只重新生成课程小节或所引用书卷发生变化的文件；内容未变的文件不重写。
+    force 为 True 时全部重新生成。
+    """
     
     # 读取课程数据
     with open('data/foundation_course.json', 'r', encoding='utf-8') as f:
@@ -125,6 +183,10 @@ def generate_answer_files():
     print(f"共 {len(lessons)} 课\n")
     
     total_files = 0
+    skipped = 0
+    unchanged = 0
+    manifest = load_manifest()
+    new_manifest = {}
     
     for lesson in lessons:
         lesson_id = lesson['id']
@@ -134,52 +196,51 @@ def generate_answer_files():
         
         for section_idx, section in enumerate(lesson['sections']):
             section_num = section_idx + 1
-            answer_data = {
-                'lesson_id': lesson_id,
-                'lesson_title': lesson_title,
-                'section_num': section_num,
-                'section_title': section['title'],
-                'answers': {}
+            filename = f"data/answers/foundation_L{lesson_id}_S{section_num}.json"
+            
+            # 依赖：小节内容 + 引用到的书卷内容
+            dependencies = {
+                'section': content_hash([lesson_id, lesson_title, section_num, section]),
+                'books': {b: book_hash(b) for b in section_dependencies(section)}
             }
+            previous = manifest.get(filename)
+            if (not force and previous is not None and os.path.exists(filename)
+                    and previous['section'] == dependencies['section']
+                    and previous['books'] == dependencies['books']):
+                new_manifest[filename] = previous
+                skipped += 1
+                continue
             
-            # 为每个问题生成答案
-            for q in section['questions']:
-                question_id = q['id']
-                references = q.get('references', [])
-                
-                if references:
-                    for ref in references:
-                        verse_text = get_reference_text(ref)
-                        key = f"q{question_id}_{ref}"
-                        
-                        if verse_text:
-                            answer_data['answers'][key] = {
-                                'reference': ref,
-                                'text': verse_text,
-                                'has_data': True
-                            }
-                        else:
-                            answer_data['answers'][key] = {
-                                'reference': ref,
-                                'text': '',
-                                'has_data': False,
-                                'note': '暂无此书卷数据（仅支持新约）'
-                            }
+            if not books_loaded:
+                print("正在加载圣经数据...")
+                load_all_books()
+            answer_data = build_section_answers(lesson_id, lesson_title, section_num, section)
+            content = json.dumps(answer_data, ensure_ascii=False, indent=2)
+            new_manifest[filename] = dependencies
+            
+            # 内容未变时不重写文件，保持修改时间不变
+            if os.path.exists(filename):
+                with open(filename, 'r', encoding='utf-8') as f:
+                    if f.read() == content:
+                        unchanged += 1
+                        continue
             
             # 保存答案文件
-            filename = f"data/answers/foundation_L{lesson_id}_S{section_num}.json"
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(answer_data, f, ensure_ascii=False, indent=2)
+                f.write(content)
             
             total_files += 1
             answer_count = sum(1 for a in answer_data['answers'].values() if a.get('has_data'))
             print(f"  ✓ 第{section_num}节: {answer_count} 个标准答案")
     
-    print(f"\n✓ 共生成 {total_files} 个答案数据文件")
+    save_manifest(new_manifest)
+    print(f"\n跳过未变化的小节 {skipped} 个，重新生成但内容未变 {unchanged} 个")
+    print(f"✓ 共写入 {total_files} 个答案数据文件")
 
 if __name__ == "__main__":
-    print("正在加载圣经数据...")
-    load_all_books()
-    print("\n" + "="*50)
-    generate_answer_files()
+    parser = argparse.ArgumentParser(description='生成建立根基课程的标准答案数据文件')
+    parser.add_argument('--force', action='store_true', help='忽略清单，全部重新生成')
+    args = parser.parse_args()
+    
+    generate_answer_files(force=args.force)
     print("\n✓ 所有答案数据文件生成完成！")
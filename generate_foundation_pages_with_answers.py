@@ -3,18 +3,32 @@
 """
 生成建立根基课程的学习页面（带预填标准答案）
 为每一节生成一个独立的HTML页面，并预填标准答案
+页面模板在 templates/foundation_section.html，样式和脚本发布到 assets/ 供所有页面共享
 """
 
 import json
 import os
 
+import page_templates
+
+SECTION_TEMPLATE = page_templates.load_template('foundation_section.html')
+
 def count_lines_needed(text):
-    """计算需要的行数"""
+    """根据答案长度计算文本框行数（与 foundation/动态调整文本框v2.py 的规则一致）"""
     if not text:
-        return 1
-    # 每50个字符需要一行，最少2行，最多10行
-    lines = max(2, min(10, len(text) // 50 + 1))
-    return lines
+        return 3  # 默认3行
+
+    text_length = len(text.strip())
+    if text_length <= 50:  # 短文本
+        return 2
+    elif text_length <= 120:  # 中等文本
+        return 3
+    elif text_length <= 200:  # 较长文本
+        return 4
+    elif text_length <= 300:  # 长文本
+        return 5
+    else:  # 很长文本
+        return 6
 
 def generate_section_pages():
     """为每一节生成独立的学习页面"""
@@ -142,21 +156,29 @@ def generate_section_html(filename, lesson_id, lesson_title, section_num, sectio
                 has_data = answer_info.get('has_data', False)
                 
                 # 计算需要的行数
-                rows = count_lines_needed(standard_text) if standard_text else 3
+                rows = count_lines_needed(standard_text)
                 
                 # 预填答案
                 prefilled_value = standard_text if has_data else ''
                 
                 refs_and_blanks_html += f'''
                 <div class="reference-with-blank">
-                    <span class="reference-text">{ref}</span>
+                    <div class="reference-header">
+                        <span class="reference-text">{ref}</span>
+                        <div class="hint-buttons">
+                            <button class="btn-hint-partial" onclick="showPartialHint('{question_id}', '{ref}')" title="渐进提示">💡 提示</button>
+                            <button class="btn-hint-full" onclick="showFullHint('{question_id}', '{ref}')" title="显示完整答案">👁️ 答案</button>
+                        </div>
+                    </div>
                     <textarea class="answer-input" 
                            rows="{rows}"
                            data-question="{question_id}" 
                            data-reference="{ref}"
                            data-has-answer="{str(has_data).lower()}"
-                           placeholder="{'请填写经文内容...' if has_data else '暂无标准答案（仅支持新约）'}">{prefilled_value}</textarea>
-                    <span class="answer-feedback" data-ref="{ref}"></span>
+                           data-hint-progress="0"
+                           placeholder="{'请填写经文内容...' if has_data else '暂无标准答案'}">{prefilled_value}</textarea>
+                    <div class="answer-feedback" data-ref="{ref}"></div>
+                    <div class="standard-answer" data-ref="{ref}"></div>
                 </div>
                 '''
         else:
@@ -208,7 +230,7 @@ def generate_section_html(filename, lesson_id, lesson_title, section_num, sectio
         '''
     
     nav_buttons += f'''
-        <a href="foundation_course.html" class="nav-btn home-btn">
+        <a href="index.html" class="nav-btn home-btn">
             返回目录
         </a>
     '''
@@ -221,790 +243,20 @@ def generate_section_html(filename, lesson_id, lesson_title, section_num, sectio
             </a>
         '''
     
-    html_content = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{lesson_title} - 第{section_num}节 | 建立根基</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'PingFang SC', 'Hiragino Sans GB', 'Microsoft YaHei', sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-        }}
-
-        header {{
-            background: white;
-            border-radius: 15px 15px 0 0;
-            padding: 30px;
-            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
-        }}
-
-        .breadcrumb {{
-            color: #888;
-            font-size: 0.9em;
-            margin-bottom: 10px;
-        }}
-
-        .breadcrumb a {{
-            color: #667eea;
-            text-decoration: none;
-        }}
-
-        .breadcrumb a:hover {{
-            text-decoration: underline;
-        }}
-
-        h1 {{
-            color: #333;
-            margin-bottom: 15px;
-            font-size: 2em;
-        }}
-
-        .section-title-box {{
-            display: inline-flex;
-            align-items: center;
-            gap: 15px;
-            margin-top: 15px;
-        }}
-
-        .section-label {{
-            display: inline-block;
-            border: 2px solid #333;
-            padding: 8px 20px;
-            font-size: 1.1em;
-            font-weight: 500;
-            color: #333;
-        }}
-
-        .section-name {{
-            font-size: 1.3em;
-            color: #333;
-            font-weight: 500;
-        }}
-
-        .content {{
-            background: white;
-            padding: 40px;
-            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
-        }}
-
-        .question-block {{
-            margin-bottom: 30px;
-            padding: 0;
-            background: transparent;
-            border: none;
-        }}
-
-        .question-header {{
-            margin-bottom: 15px;
-            display: flex;
-            align-items: flex-start;
-        }}
-
-        .question-number {{
-            flex-shrink: 0;
-            margin-right: 10px;
-            color: #333;
-            font-size: 1em;
-        }}
-
-        .question-text {{
-            font-size: 1em;
-            color: #333;
-            font-weight: normal;
-            line-height: 1.6;
-        }}
-
-        .answers-area {{
-            margin-left: 30px;
-        }}
-
-        .reference-with-blank {{
-            margin-bottom: 20px;
-            position: relative;
-        }}
-
-        .reference-text {{
-            display: block;
-            color: #667eea;
-            font-size: 0.95em;
-            font-weight: 500;
-            margin-bottom: 8px;
-        }}
-
-        .answer-input {{
-            width: 100%;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            padding: 10px;
-            font-size: 1em;
-            font-family: inherit;
-            resize: vertical;
-            outline: none;
-            transition: all 0.3s;
-            line-height: 1.6;
-        }}
-
-        .answer-input:focus {{
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }}
-
-        .answer-input.correct {{
-            border-color: #27ae60;
-            background: linear-gradient(to right, rgba(39, 174, 96, 0.05) 0%, transparent 100%);
-        }}
-
-        .answer-input.incorrect {{
-            border-color: #e74c3c;
-            background: linear-gradient(to right, rgba(231, 76, 60, 0.05) 0%, transparent 100%);
-        }}
-
-        .answer-input.partial {{
-            border-color: #f39c12;
-            background: linear-gradient(to right, rgba(243, 156, 18, 0.05) 0%, transparent 100%);
-        }}
-
-        .answer-feedback {{
-            position: absolute;
-            top: 0;
-            right: 0;
-            font-size: 1.2em;
-            font-weight: bold;
-        }}
-
-        .answer-feedback.correct {{
-            color: #27ae60;
-        }}
-
-        .answer-feedback.incorrect {{
-            color: #e74c3c;
-        }}
-
-        .answer-feedback.partial {{
-            color: #f39c12;
-        }}
-
-        .standard-answer {{
-            display: none;
-            margin-top: 10px;
-            padding: 12px;
-            background: #f8f9fa;
-            border-left: 3px solid #667eea;
-            font-size: 0.95em;
-            color: #555;
-            line-height: 1.6;
-            border-radius: 0 5px 5px 0;
-        }}
-
-        .standard-answer.show {{
-            display: block;
-        }}
-
-        .standard-answer strong {{
-            color: #667eea;
-            display: block;
-            margin-bottom: 5px;
-        }}
-
-        .application-section {{
-            margin-top: 40px;
-            padding: 25px;
-            background: #f8f9fa;
-            border-radius: 5px;
-        }}
-
-        .application-section h3 {{
-            color: #333;
-            margin-bottom: 10px;
-            font-size: 1.1em;
-            font-weight: 600;
-        }}
-
-        .application-prompt {{
-            color: #666;
-            margin-bottom: 15px;
-            line-height: 1.6;
-            font-size: 0.95em;
-        }}
-
-        .application-input {{
-            width: 100%;
-            padding: 12px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            font-size: 1em;
-            font-family: inherit;
-            resize: vertical;
-            min-height: 120px;
-        }}
-
-        .application-input:focus {{
-            outline: none;
-            border-color: #667eea;
-        }}
-
-        .action-bar {{
-            background: white;
-            padding: 25px 40px;
-            border-radius: 0 0 15px 15px;
-            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 15px;
-        }}
-
-        .score-display {{
-            font-size: 1.2em;
-            color: #333;
-            font-weight: bold;
-        }}
-
-        .score-number {{
-            color: #667eea;
-            font-size: 1.5em;
-        }}
-
-        .btn {{
-            padding: 12px 25px;
-            border: none;
-            border-radius: 8px;
-            font-size: 1em;
-            cursor: pointer;
-            transition: all 0.3s;
-            text-decoration: none;
-            display: inline-block;
-            font-weight: 500;
-        }}
-
-        .btn-primary {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }}
-
-        .btn-primary:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-        }}
-
-        .btn-secondary {{
-            background: #f5f5f5;
-            color: #333;
-        }}
-
-        .btn-secondary:hover {{
-            background: #e0e0e0;
-        }}
-
-        .btn-success {{
-            background: linear-gradient(135deg, #27ae60 0%, #229954 100%);
-            color: white;
-        }}
-
-        .btn-success:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(39, 174, 96, 0.4);
-        }}
-
-        .btn-warning {{
-            background: linear-gradient(135deg, #f39c12 0%, #e67e22 100%);
-            color: white;
-        }}
-
-        .btn-warning:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(243, 156, 18, 0.4);
-        }}
-
-        .navigation {{
-            background: white;
-            padding: 20px 40px;
-            margin-top: 20px;
-            border-radius: 15px;
-            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
-            display: flex;
-            justify-content: space-between;
-            gap: 15px;
-        }}
-
-        .nav-btn {{
-            padding: 12px 25px;
-            border-radius: 8px;
-            text-decoration: none;
-            transition: all 0.3s;
-            font-weight: 500;
-        }}
-
-        .prev-btn, .next-btn {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }}
-
-        .prev-btn:hover, .next-btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-        }}
-
-        .home-btn {{
-            background: #f5f5f5;
-            color: #333;
-        }}
-
-        .home-btn:hover {{
-            background: #e0e0e0;
-        }}
-
-        @media (max-width: 768px) {{
-            body {{
-                padding: 10px;
-            }}
-
-            header, .content, .action-bar {{
-                padding: 20px;
-            }}
-
-            h1 {{
-                font-size: 1.5em;
-            }}
-
-            .navigation {{
-                flex-direction: column;
-                padding: 15px;
-            }}
-
-            .nav-btn {{
-                width: 100%;
-                text-align: center;
-            }}
-
-            .action-bar {{
-                flex-direction: column;
-                text-align: center;
-            }}
-        }}
-
-        .toast {{
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            background: white;
-            padding: 15px 25px;
-            border-radius: 8px;
-            box-shadow: 0 5px 20px rgba(0,0,0,0.2);
-            display: none;
-            z-index: 1000;
-            max-width: 300px;
-        }}
-
-        .toast.show {{
-            display: block;
-            animation: slideIn 0.3s ease;
-        }}
-
-        @keyframes slideIn {{
-            from {{
-                transform: translateX(400px);
-            }}
-            to {{
-                transform: translateX(0);
-            }}
-        }}
-
-        .loading-overlay {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: rgba(0,0,0,0.7);
-            display: none;
-            align-items: center;
-            justify-content: center;
-            z-index: 2000;
-        }}
-
-        .loading-overlay.show {{
-            display: flex;
-        }}
-
-        .loading-spinner {{
-            background: white;
-            padding: 30px 40px;
-            border-radius: 10px;
-            text-align: center;
-        }}
-
-        .spinner {{
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #667eea;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-            margin: 0 auto 15px;
-        }}
-
-        @keyframes spin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <div class="breadcrumb">
-                <a href="foundation_course.html">建立根基</a> / 
-                第{lesson_id}课: {lesson_title}
-            </div>
-            <h1>{lesson_title}</h1>
-            <div class="section-title-box">
-                <span class="section-label">第{section_num}节</span>
-                <span class="section-name">{section_title}</span>
-            </div>
-        </header>
-
-        <div class="content">
-            {questions_html}
-            {application_html}
-        </div>
-
-        <div class="action-bar">
-            <div class="score-display">
-                得分: <span class="score-number" id="scoreDisplay">-</span> | 
-                完成度: <span class="score-number" id="progressDisplay">100%</span>
-            </div>
-            <div>
-                <button class="btn btn-warning" onclick="clearAnswers()">🗑️ 清空答案</button>
-                <button class="btn btn-secondary" onclick="saveProgress()">💾 保存进度</button>
-                <button class="btn btn-success" onclick="checkAnswers()" id="checkBtn">✓ 检查答案</button>
-                <button class="btn btn-primary" onclick="submitAnswers()">📝 提交</button>
-            </div>
-        </div>
-
-        <div class="navigation">
-            {nav_buttons}
-        </div>
-    </div>
-
-    <div class="toast" id="toast"></div>
-    
-    <div class="loading-overlay" id="loadingOverlay">
-        <div class="loading-spinner">
-            <div class="spinner"></div>
-            <div>正在检查答案...</div>
-        </div>
-    </div>
-
-    <script>
-        // 存储标准答案
-        let standardAnswers = {{}};
-        
-        // 加载保存的进度
-        window.addEventListener('load', () => {{
-            // 不自动加载进度，因为答案已预填
-            updateProgress();
-            loadStandardAnswers();
-        }});
-
-        // 自动保存
-        document.querySelectorAll('.answer-input, .application-input').forEach(input => {{
-            input.addEventListener('change', () => {{
-                updateProgress();
-            }});
-        }});
-
-        // 加载标准答案
-        async function loadStandardAnswers() {{
-            try {{
-                const response = await fetch('data/answers/foundation_L{lesson_id}_S{section_num}.json');
-                if (!response.ok) {{
-                    console.warn('未找到答案数据文件');
-                    return;
-                }}
-                
-                const answerData = await response.json();
-                standardAnswers = answerData.answers || {{}};
-                console.log('标准答案已加载:', Object.keys(standardAnswers).length, '个');
-            }} catch (e) {{
-                console.error('加载标准答案失败:', e);
-            }}
-        }}
-
-        // 清空所有答案
-        function clearAnswers() {{
-            if (!confirm('确定要清空所有答案吗？此操作不可恢复。')) {{
-                return;
-            }}
-            
-            document.querySelectorAll('.answer-input').forEach(input => {{
-                input.value = '';
-                input.classList.remove('correct', 'incorrect', 'partial');
-            }});
-            
-            document.querySelector('.application-input').value = '';
-            
-            document.querySelectorAll('.answer-feedback').forEach(feedback => {{
-                feedback.textContent = '';
-                feedback.className = 'answer-feedback';
-            }});
-            
-            document.querySelectorAll('.standard-answer').forEach(div => {{
-                div.classList.remove('show');
-            }});
-            
-            document.getElementById('scoreDisplay').textContent = '-';
-            updateProgress();
-            showToast('✓ 答案已清空');
-        }}
-
-        // 检查答案
-        async function checkAnswers() {{
-            const loadingOverlay = document.getElementById('loadingOverlay');
-            loadingOverlay.classList.add('show');
-            
-            // 确保标准答案已加载
-            await loadStandardAnswers();
-            
-            setTimeout(() => {{
-                let totalQuestions = 0;
-                let correctCount = 0;
-                
-                document.querySelectorAll('.answer-input').forEach(input => {{
-                    const ref = input.dataset.reference;
-                    const hasAnswer = input.dataset.hasAnswer === 'true';
-                    
-                    if (!ref || !hasAnswer) {{
-                        // 没有标准答案的题目不计分
-                        return;
-                    }}
-                    
-                    const questionId = input.dataset.question;
-                    const answerKey = `q${{questionId}}_${{ref}}`;
-                    const answerInfo = standardAnswers[answerKey];
-                    
-                    if (!answerInfo || !answerInfo.has_data) {{
-                        return;
-                    }}
-                    
-                    totalQuestions++;
-                    
-                    const userAnswer = input.value.trim();
-                    const standardAnswer = answerInfo.text || '';
-                    
-                    // 清除之前的标记
-                    input.classList.remove('correct', 'incorrect', 'partial');
-                    
-                    const feedbackSpan = input.parentElement.querySelector('.answer-feedback');
-                    let standardAnswerDiv = input.parentElement.querySelector('.standard-answer');
-                    
-                    // 如果标准答案div不存在，创建它
-                    if (!standardAnswerDiv) {{
-                        standardAnswerDiv = document.createElement('div');
-                        standardAnswerDiv.className = 'standard-answer';
-                        input.parentElement.appendChild(standardAnswerDiv);
-                    }}
-                    
-                    // 相似度检查
-                    const similarity = calculateSimilarity(userAnswer, standardAnswer);
-                    
-                    if (similarity >= 0.85) {{
-                        // 85%以上相似度认为正确
-                        input.classList.add('correct');
-                        feedbackSpan.textContent = '✓';
-                        feedbackSpan.className = 'answer-feedback correct';
-                        correctCount++;
-                        standardAnswerDiv.classList.remove('show');
-                    }} else if (similarity >= 0.6) {{
-                        // 60-85%相似度认为部分正确
-                        input.classList.add('partial');
-                        feedbackSpan.textContent = '△';
-                        feedbackSpan.className = 'answer-feedback partial';
-                        correctCount += 0.6;
-                        standardAnswerDiv.innerHTML = `<strong>标准答案:</strong> ${{standardAnswer}}`;
-                        standardAnswerDiv.classList.add('show');
-                    }} else {{
-                        // 低于60%认为错误
-                        input.classList.add('incorrect');
-                        feedbackSpan.textContent = '✗';
-                        feedbackSpan.className = 'answer-feedback incorrect';
-                        standardAnswerDiv.innerHTML = `<strong>标准答案:</strong> ${{standardAnswer}}`;
-                        standardAnswerDiv.classList.add('show');
-                    }}
-                }});
-                
-                // 计算得分
-                const score = totalQuestions > 0 ? Math.round((correctCount / totalQuestions) * 100) : 0;
-                document.getElementById('scoreDisplay').textContent = score + '分';
-                
-                // 显示反馈
-                let message = '';
-                if (totalQuestions === 0) {{
-                    message = 'ℹ️ 本节暂无可检查的题目（仅支持新约经文）';
-                }} else if (score >= 90) {{
-                    message = '🎉 优秀！你掌握得非常好！';
-                }} else if (score >= 75) {{
-                    message = '👍 良好！继续加油！';
-                }} else if (score >= 60) {{
-                    message = '📚 及格！建议再复习一下';
-                }} else {{
-                    message = '💪 继续努力！多读几遍经文吧';
-                }}
-                
-                showToast(message);
-                loadingOverlay.classList.remove('show');
-            }}, 300);
-        }}
-
-        // 计算文本相似度
-        function calculateSimilarity(text1, text2) {{
-            // 移除标点符号和空格
-            const clean1 = text1.replace(/[\\s\\.,;:!?，。；：！？、""''（）【】《》]/g, '');
-            const clean2 = text2.replace(/[\\s\\.,;:!?，。；：！？、""''（）【】《》]/g, '');
-            
-            if (!clean1 || !clean2) return 0;
-            
-            // 计算共同字符数
-            let matches = 0;
-            const shorter = clean1.length < clean2.length ? clean1 : clean2;
-            const longer = clean1.length < clean2.length ? clean2 : clean1;
-            
-            // 使用动态规划计算最长公共子序列
-            const dp = Array(shorter.length + 1).fill(null).map(() => 
-                Array(longer.length + 1).fill(0)
-            );
-            
-            for (let i = 1; i <= shorter.length; i++) {{
-                for (let j = 1; j <= longer.length; j++) {{
-                    if (shorter[i-1] === longer[j-1]) {{
-                        dp[i][j] = dp[i-1][j-1] + 1;
-                    }} else {{
-                        dp[i][j] = Math.max(dp[i-1][j], dp[i][j-1]);
-                    }}
-                }}
-            }}
-            
-            matches = dp[shorter.length][longer.length];
-            
-            // 相似度 = 公共字符数 / 较长文本的长度
-            return matches / longer.length;
-        }}
-
-        function loadProgress() {{
-            const key = 'foundation_L{lesson_id}_S{section_num}';
-            const saved = localStorage.getItem(key);
-            if (saved) {{
-                try {{
-                    const data = JSON.parse(saved);
-                    // 恢复答案
-                    document.querySelectorAll('.answer-input').forEach(input => {{
-                        const q = input.dataset.question;
-                        const ref = input.dataset.reference || 'main';
-                        const savedAnswer = data.answers?.[`q${{q}}_${{ref}}`];
-                        if (savedAnswer) {{
-                            input.value = savedAnswer;
-                        }}
-                    }});
-                    // 恢复个人应用
-                    const appInput = document.querySelector('.application-input');
-                    if (appInput && data.application) {{
-                        appInput.value = data.application;
-                    }}
-                    // 恢复得分
-                    if (data.score !== undefined) {{
-                        document.getElementById('scoreDisplay').textContent = data.score + '分';
-                    }}
-                }} catch (e) {{
-                    console.error('加载进度失败:', e);
-                }}
-            }}
-        }}
-
-        function saveProgress() {{
-            const key = 'foundation_L{lesson_id}_S{section_num}';
-            const data = {{
-                answers: {{}},
-                application: '',
-                score: document.getElementById('scoreDisplay').textContent.replace('分', '').replace('-', ''),
-                timestamp: new Date().toISOString()
-            }};
-            
-            // 保存所有答案
-            document.querySelectorAll('.answer-input').forEach(input => {{
-                const q = input.dataset.question;
-                const ref = input.dataset.reference || 'main';
-                data.answers[`q${{q}}_${{ref}}`] = input.value;
-            }});
-            
-            // 保存个人应用
-            const appInput = document.querySelector('.application-input');
-            if (appInput) {{
-                data.application = appInput.value;
-            }}
-            
-            localStorage.setItem(key, JSON.stringify(data));
-            showToast('✓ 进度已保存');
-        }}
-
-        function submitAnswers() {{
-            saveProgress();
-            updateProgress();
-            showToast('✓ 答案已提交！继续下一节吧');
-        }}
-
-        function updateProgress() {{
-            let totalFields = 0;
-            let filledFields = 0;
-            
-            // 统计答案输入框
-            document.querySelectorAll('.answer-input').forEach(input => {{
-                totalFields++;
-                if (input.value.trim()) {{
-                    filledFields++;
-                }}
-            }});
-            
-            // 统计个人应用
-            const appInput = document.querySelector('.application-input');
-            if (appInput) {{
-                totalFields++;
-                if (appInput.value.trim()) {{
-                    filledFields++;
-                }}
-            }}
-            
-            const percentage = totalFields > 0 ? Math.round((filledFields / totalFields) * 100) : 0;
-            document.getElementById('progressDisplay').textContent = percentage + '%';
-        }}
-
-        function showToast(message) {{
-            const toast = document.getElementById('toast');
-            toast.textContent = message;
-            toast.classList.add('show');
-            setTimeout(() => {{
-                toast.classList.remove('show');
-            }}, 3000);
-        }}
-    </script>
-</body>
-</html>
-'''
+    # 页面外壳来自预编译模板，共享的 CSS/JS 以带内容哈希的外部文件引用
+    output_dir = os.path.dirname(filename) or '.'
+    html_content = SECTION_TEMPLATE.render(
+        css_url=page_templates.publish_asset('foundation_section.css', output_dir),
+        js_url=page_templates.publish_asset('foundation_section.js', output_dir),
+        page_key=f"foundation_L{lesson_id}_S{section_num}",
+        lesson_id=lesson_id,
+        lesson_title=lesson_title,
+        section_num=section_num,
+        section_title=section_title,
+        questions_html=questions_html,
+        application_html=application_html,
+        nav_buttons=nav_buttons
+    )
     
     # 写入文件
     with open(filename, 'w', encoding='utf-8') as f:
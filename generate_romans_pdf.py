@@ -3,10 +3,21 @@
 """
 罗马书天书八部 - PDF生成器
 将16个章节生成为精美的PDF文档
+
+每章单独排版为中间PDF，缓存在 .pdf_cache/romans_chapters/（文件名带内容哈希），
+最后与封面、目录合并。只改了一处错字时只重新排版那一章。
+中文字体由 pdf_fonts 在系统字体目录中查找（也可用 PDF_CJK_FONT 指定），并裁剪为本书用到的字符。
+
+用法:
+    python3 generate_romans_pdf.py [--jobs 4] [--force]
 """
 
+import argparse
+import contextlib
+import io
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -14,15 +25,18 @@ from reportlab.lib.units import cm
 from reportlab.lib.colors import HexColor
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.platypus import Table, TableStyle, Image
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
-import re
+from PyPDF2 import PdfMerger
+
+import pdf_fonts
+import romans_ast
+from build_manifest import content_hash, file_hash
 
 class RomansPDFGenerator:
-    def __init__(self):
+    def __init__(self, font_files=None):
         self.chapters_dir = "BooksofRoman/chapters"
         self.output_file = "罗马书天书八部_16章完整版.pdf"
+        self.cache_dir = os.path.join(".pdf_cache", "romans_chapters")
         
         # 16个章节标题
         self.chapter_titles = [
@@ -44,33 +58,34 @@ class RomansPDFGenerator:
             "16. 基督徒的盼望"
         ]
         
-        # 注册中文字体(使用系统字体)
-        self.setup_fonts()
+        # 注册中文字体(使用系统字体；font_files 为主进程已发现的字体)
+        self.setup_fonts(font_files)
         
         # 创建样式
         self.styles = self.create_styles()
     
-    def setup_fonts(self):
-        """注册中文字体"""
-        try:
-            # macOS系统字体
-            pdfmetrics.registerFont(TTFont('SimSun', '/System/Library/Fonts/STHeiti Light.ttc', subfontIndex=0))
-            pdfmetrics.registerFont(TTFont('SimSun-Bold', '/System/Library/Fonts/STHeiti Medium.ttc', subfontIndex=0))
-            self.font_name = 'SimSun'
-            self.font_name_bold = 'SimSun-Bold'
-            print("✓ 使用系统字体: STHeiti")
-        except:
-            try:
-                # 尝试其他常见字体
-                pdfmetrics.registerFont(TTFont('SimSun', '/System/Library/Fonts/PingFang.ttc', subfontIndex=0))
-                self.font_name = 'SimSun'
-                self.font_name_bold = 'SimSun'
-                print("✓ 使用系统字体: PingFang")
-            except:
-                # 使用Helvetica作为后备
-                self.font_name = 'Helvetica'
-                self.font_name_bold = 'Helvetica-Bold'
-                print("⚠️  使用默认字体: Helvetica (中文可能显示异常)")
+    def setup_fonts(self, font_files=None):
+        """注册中文字体(自动发现系统字体,裁剪为本书用到的字符)"""
+        fonts = pdf_fonts.register_cjk_fonts(self.document_text(), font_files=font_files)
+        self.font_files = fonts.files
+        self.font_name = fonts.regular
+        self.font_name_bold = fonts.bold
+        self.font_key = fonts.key
+        if fonts is pdf_fonts.FALLBACK_FONTS:
+            print("⚠️  使用默认字体: Helvetica (中文可能显示异常)")
+        else:
+            print(f"✓ 使用系统字体: {fonts.description}")
+    
+    def document_text(self):
+        """PDF中可能出现的全部文字: 各章内容 + 本脚本里的标题、封面、目录文字"""
+        with open(__file__, 'r', encoding='utf-8') as f:
+            texts = [f.read()]
+        for chapter_num in range(1, 17):
+            chapter_file = os.path.join(self.chapters_dir, f"chapter_{chapter_num:02d}.txt")
+            if os.path.exists(chapter_file):
+                with open(chapter_file, 'r', encoding='utf-8') as f:
+                    texts.append(f.read())
+        return ''.join(texts)
     
     def create_styles(self):
         """创建文档样式"""
@@ -153,118 +168,52 @@ class RomansPDFGenerator:
         return styles
     
     def extract_topics_from_chapter(self, chapter_content):
-        """从章节内容中提取主题"""
-        topics = []
-        lines = chapter_content.strip().split('\n')
-        current_topic = None
-        current_content = []
-        
-        # 主题编号模式
-        topic_pattern = re.compile(r'^(\d+)\.\s+(.+)$')
-        
-        for line in lines:
-            match = topic_pattern.match(line.strip())
-            
-            if match:
-                # 保存上一个主题
-                if current_topic:
-                    topics.append({
-                        'number': current_topic['number'],
-                        'title': current_topic['title'],
-                        'content': '\n'.join(current_content).strip()
-                    })
-                
-                # 开始新主题
-                topic_num = match.group(1)
-                topic_title = match.group(2).strip()
-                current_topic = {
-                    'number': topic_num,
-                    'title': topic_title
-                }
-                current_content = []
-            else:
-                # 累积内容
-                if line.strip():
-                    current_content.append(line)
-        
-        # 保存最后一个主题
-        if current_topic:
-            topics.append({
-                'number': current_topic['number'],
-                'title': current_topic['title'],
-                'content': '\n'.join(current_content).strip()
-            })
-        
-        return topics
+        """从章节内容中提取主题(单章文件没有章节标题行,主题标题不限长度)"""
+        document = romans_ast.parse(chapter_content.splitlines(), chapters=False, topic_max_len=None)
+        return [{
+            'number': topic.number,
+            'title': topic.title,
+            'content': topic.blocks
+        } for topic in document.topics]
     
-    def clean_text(self, text):
+    def clean_text(self, block):
         """清理文本,移除标记"""
-        # 移除经文标记
-        text = re.sub(r'\{\{scripture\}\}', '', text)
-        text = re.sub(r'\{\{/scripture\}\}', '', text)
-        text = re.sub(r'\{\{inline-scripture\}\}', '<font color="#7b1fa2" backColor="#f3e5f5">', text)
-        text = re.sub(r'\{\{/inline-scripture\}\}', '</font>', text)
-        return text
+        # 移除经文标记,段内经文改为高亮
+        text = romans_ast.render_spans(block.spans, '<font color="#7b1fa2" backColor="#f3e5f5">', '</font>')
+        return text.replace('{{scripture}}', '').replace('{{/scripture}}', '')
     
-    def is_scripture_line(self, line):
-        """判断是否为经文行"""
-        patterns = [
-            r'^\{\{scripture\}\}',
-            r'《.+?》\d+[:：]\d+',
-            r'\(.+?书\s*\d+[:：]\d+.*?\)',
-            r'^"[^"]{30,}"\s*$'
-        ]
-        for pattern in patterns:
-            if re.search(pattern, line):
-                return True
-        return False
+    def is_scripture_block(self, block):
+        """判断是否为经文段(独立经文和整段引用)"""
+        return block.kind in (romans_ast.SCRIPTURE, romans_ast.QUOTE)
     
-    def process_content(self, content):
-        """处理内容,转换为PDF段落"""
-        content = self.clean_text(content)
-        lines = content.split('\n')
+    def process_content(self, blocks):
+        """处理内容节点,转换为PDF段落(相邻的经文段合并为一个经文块)"""
         paragraphs = []
         scripture_buffer = []
-        in_scripture = False
         
-        for line in lines:
-            stripped = line.strip()
+        for block in blocks:
+            text = self.clean_text(block)
             
-            if not stripped:
-                if in_scripture and scripture_buffer:
-                    # 输出经文块
-                    scripture_text = ' '.join(scripture_buffer)
-                    p = Paragraph(scripture_text, self.styles['ScriptureBlock'])
-                    paragraphs.append(p)
-                    paragraphs.append(Spacer(1, 0.3*cm))
-                    scripture_buffer = []
-                    in_scripture = False
+            # 检测经文
+            if self.is_scripture_block(block):
+                scripture_buffer.append(text)
                 continue
             
-            # 检测经文
-            if self.is_scripture_line(stripped):
-                if not in_scripture:
-                    in_scripture = True
-                scripture_buffer.append(stripped)
-            else:
-                # 先输出缓存的经文
-                if in_scripture and scripture_buffer:
-                    scripture_text = ' '.join(scripture_buffer)
-                    p = Paragraph(scripture_text, self.styles['ScriptureBlock'])
-                    paragraphs.append(p)
-                    paragraphs.append(Spacer(1, 0.3*cm))
-                    scripture_buffer = []
-                    in_scripture = False
-                
-                # 输出普通段落
-                p = Paragraph(stripped, self.styles['ChineseBody'])
+            # 先输出缓存的经文
+            if scripture_buffer:
+                p = Paragraph(' '.join(scripture_buffer), self.styles['ScriptureBlock'])
                 paragraphs.append(p)
-                paragraphs.append(Spacer(1, 0.2*cm))
+                paragraphs.append(Spacer(1, 0.3*cm))
+                scripture_buffer = []
+            
+            # 输出普通段落
+            p = Paragraph(text, self.styles['ChineseBody'])
+            paragraphs.append(p)
+            paragraphs.append(Spacer(1, 0.2*cm))
         
         # 处理最后的经文块
         if scripture_buffer:
-            scripture_text = ' '.join(scripture_buffer)
-            p = Paragraph(scripture_text, self.styles['ScriptureBlock'])
+            p = Paragraph(' '.join(scripture_buffer), self.styles['ScriptureBlock'])
             paragraphs.append(p)
         
         return paragraphs
@@ -344,24 +293,84 @@ class RomansPDFGenerator:
         
         return story
     
-    def generate_pdf(self):
-        """生成PDF文档"""
-        print("=" * 60)
-        print("开始生成PDF文档")
-        print("=" * 60)
-        print()
-        
-        # 创建PDF文档
-        doc = SimpleDocTemplate(
-            self.output_file,
+    def new_document(self, output_file):
+        """创建A4文档模板"""
+        return SimpleDocTemplate(
+            output_file,
             pagesize=A4,
             leftMargin=2*cm,
             rightMargin=2*cm,
             topMargin=2*cm,
             bottomMargin=2*cm
         )
-        
+    
+    def build_story_pdf(self, story, output_file):
+        """把一段内容排版为PDF（先写临时文件再替换，中断时不会留下半个缓存文件）"""
+        tmp_file = output_file + '.tmp'
+        self.new_document(tmp_file).build(story)
+        os.replace(tmp_file, output_file)
+    
+    def create_chapter_story(self, chapter_num, data):
+        """一章的内容: 章节标题 + 各主题"""
         story = []
+        
+        # 章节标题
+        ch_title = Paragraph(f"第{chapter_num}章: {data['title']}", self.styles['ChapterTitle'])
+        story.append(ch_title)
+        story.append(Spacer(1, 0.5*cm))
+        
+        # 处理每个主题
+        for topic in data['topics']:
+            # 主题标题
+            topic_title = Paragraph(f"{topic['number']}. {topic['title']}", self.styles['TopicTitle'])
+            story.append(topic_title)
+            story.append(Spacer(1, 0.3*cm))
+            
+            # 主题内容
+            content_paras = self.process_content(topic['content'])
+            story.extend(content_paras)
+            
+            story.append(Spacer(1, 0.5*cm))
+        
+        # 每章是单独的PDF，合并后自然从新的一页开始，不需要 PageBreak
+        return story
+    
+    def chapter_cache_path(self, chapter_num, data):
+        """章节PDF的缓存路径，文件名带 (章节内容, 排版代码, 源字体) 的哈希"""
+        key = content_hash([chapter_num, data['title'], data['content'], self.font_key,
+                            file_hash(__file__), file_hash(romans_ast.__file__)])
+        return os.path.join(self.cache_dir, f"chapter_{chapter_num:02d}.{key[:16]}.pdf")
+    
+    def merge_pdfs(self, pdf_files):
+        """按顺序合并各部分PDF为最终文档"""
+        merger = PdfMerger()
+        for pdf_file in pdf_files:
+            merger.append(pdf_file)
+        tmp_file = self.output_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            merger.write(f)
+        merger.close()
+        os.replace(tmp_file, self.output_file)
+    
+    def remove_stale_cache(self, keep):
+        """删除已不再对应任何章节内容的缓存PDF"""
+        for filename in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, filename)
+            if filename.startswith('chapter_') and path not in keep:
+                os.remove(path)
+    
+    def generate_pdf(self, jobs=1, force=False):
+        """生成PDF文档
+        
+        每章单独排版为中间PDF并按内容哈希缓存，只有内容变化的章节需要重新排版
+        （jobs > 1 时在进程池中并行），最后与封面、目录合并。force=True 时忽略缓存。
+        """
+        print("=" * 60)
+        print("开始生成PDF文档")
+        print("=" * 60)
+        print()
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
         chapter_data = {}
         
         # 首先收集所有章节数据
@@ -388,51 +397,41 @@ class RomansPDFGenerator:
         print()
         print("📝 生成PDF页面...")
         
-        # 创建封面
+        # 封面（含生成日期）和目录每次重新排版，只有两页
         print("  ✓ 封面页")
-        story.extend(self.create_cover_page())
-        
-        # 创建目录
         print("  ✓ 目录页")
-        story.extend(self.create_table_of_contents(chapter_data))
-        
-        # 处理每个章节
-        for chapter_num in range(1, 17):
-            if chapter_num not in chapter_data:
-                continue
-            
-            data = chapter_data[chapter_num]
-            chapter_title = data['title']
-            topics = data['topics']
-            
-            print(f"  ✓ 章节 {chapter_num}: {chapter_title}")
-            
-            # 章节标题
-            ch_title = Paragraph(f"第{chapter_num}章: {chapter_title}", self.styles['ChapterTitle'])
-            story.append(ch_title)
-            story.append(Spacer(1, 0.5*cm))
-            
-            # 处理每个主题
-            for topic in topics:
-                # 主题标题
-                topic_title = Paragraph(f"{topic['number']}. {topic['title']}", self.styles['TopicTitle'])
-                story.append(topic_title)
-                story.append(Spacer(1, 0.3*cm))
-                
-                # 主题内容
-                content_paras = self.process_content(topic['content'])
-                story.extend(content_paras)
-                
-                story.append(Spacer(1, 0.5*cm))
-            
-            # 章节结束,换页
-            story.append(PageBreak())
+        front_file = os.path.join(self.cache_dir, 'front_matter.pdf')
+        self.build_story_pdf(self.create_cover_page() + self.create_table_of_contents(chapter_data),
+                             front_file)
+        
+        # 找出需要重新排版的章节
+        chapter_files = {}
+        tasks = []
+        for chapter_num, data in chapter_data.items():
+            chapter_files[chapter_num] = self.chapter_cache_path(chapter_num, data)
+            if force or not os.path.exists(chapter_files[chapter_num]):
+                tasks.append((chapter_num, data, chapter_files[chapter_num]))
+        
+        if jobs <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                render_chapter(task, self)
+        else:
+            print(f"  ⚡ 使用 {jobs} 个进程并行排版 {len(tasks)} 个章节")
+            # 工作进程直接使用本进程发现的字体，不再各自扫描字体目录
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                     initargs=(self.font_files,)) as executor:
+                list(executor.map(render_chapter, tasks))
+        
+        rendered = {task[0] for task in tasks}
+        for chapter_num, data in chapter_data.items():
+            status = "重新排版" if chapter_num in rendered else "使用缓存"
+            print(f"  ✓ 章节 {chapter_num}: {data['title']} ({status})")
         
         print()
-        print("💾 正在生成PDF文件...")
+        print("💾 正在合并PDF文件...")
         
-        # 构建PDF
-        doc.build(story)
+        self.merge_pdfs([front_file] + [chapter_files[n] for n in sorted(chapter_files)])
+        self.remove_stale_cache(set(chapter_files.values()))
         
         # 获取文件大小
         file_size = os.path.getsize(self.output_file) / (1024 * 1024)
@@ -443,11 +442,36 @@ class RomansPDFGenerator:
         print("=" * 60)
         print(f"📄 文件名: {self.output_file}")
         print(f"📊 文件大小: {file_size:.2f} MB")
-        print(f"📖 章节数: 16")
+        print(f"📖 章节数: 16（重新排版 {len(tasks)} 章，复用缓存 {len(chapter_data) - len(tasks)} 章）")
         print(f"📝 主题总数: {sum(len(d['topics']) for d in chapter_data.values())}")
         print(f"📅 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print()
 
+
+# 工作进程中的生成器（每个进程只创建一次，字体只注册一次）
+_worker_generator = None
+
+
+def _init_worker(font_files):
+    global _worker_generator
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_generator = RomansPDFGenerator(font_files)
+
+
+def render_chapter(task, generator=None):
+    """把一章排版为单独的PDF（进程池的工作函数）"""
+    chapter_num, data, output_file = task
+    generator = generator or _worker_generator
+    generator.build_story_pdf(generator.create_chapter_story(chapter_num, data), output_file)
+    return chapter_num
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='罗马书天书八部 PDF生成器')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='并行排版的进程数（默认1，0表示使用全部CPU核心）')
+    parser.add_argument('--force', action='store_true', help='忽略章节缓存，重新排版所有章节')
+    args = parser.parse_args()
+    
     generator = RomansPDFGenerator()
-    generator.generate_pdf()
+    generator.generate_pdf(jobs=args.jobs if args.jobs > 0 else os.cpu_count(), force=args.force)
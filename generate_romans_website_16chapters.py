@@ -3,13 +3,26 @@
 """
 罗马书天书八部网站生成器 - 16章完整版
 生成多级结构: 主页 → 16个章节索引 → 各章节主题页面
+
+增量构建: 每个页面记录其输入（主题内容、上一页/下一页、模板）的哈希，
+只重新生成输入有变化的页面；--force 强制全部重新生成。
+样式在 templates/romans16_*.css，发布为 romans_16chapters/assets/ 下带内容哈希的共享文件。
 """
 
+import argparse
 import os
 import re
 import json
 from datetime import datetime
 
+from build_manifest import BuildManifest, file_hash
+from page_templates import TEMPLATES_DIR, publish_asset
+
+# 各类页面的共享样式（templates/ 下）
+TOPIC_CSS = 'romans16_topic.css'
+CHAPTER_INDEX_CSS = 'romans16_chapter_index.css'
+MAIN_INDEX_CSS = 'romans16_index.css'
+
 class RomansWebsiteGenerator:
     def __init__(self):
         self.chapters_dir = "BooksofRoman/chapters_final"
@@ -218,6 +231,8 @@ class RomansWebsiteGenerator:
                 next_link = f'<a href="../index.html" class="nav-btn">返回主页 →</a>'
         
         html_content = self.convert_to_html(topic['content'])
+        # 主题页在 chapter_XX/ 目录下
+        css_url = '../' + publish_asset(TOPIC_CSS, self.output_dir)
         
         html = f'''<!DOCTYPE html>
 <html lang="zh-CN">
@@ -225,182 +240,7 @@ class RomansWebsiteGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{topic['title']} - {chapter_title} - 罗马书天书八部</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", "PingFang SC", "Hiragino Sans GB", "Microsoft YaHei", sans-serif;
-            line-height: 1.8;
-            color: #333;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 20px;
-            padding: 40px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
-        
-        .header {{
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 20px;
-            border-bottom: 3px solid #667eea;
-        }}
-        
-        .breadcrumb {{
-            color: #666;
-            font-size: 14px;
-            margin-bottom: 10px;
-        }}
-        
-        .breadcrumb a {{
-            color: #667eea;
-            text-decoration: none;
-        }}
-        
-        .breadcrumb a:hover {{
-            text-decoration: underline;
-        }}
-        
-        h1 {{
-            color: #2c3e50;
-            font-size: 2em;
-            margin-bottom: 10px;
-        }}
-        
-        .chapter-info {{
-            color: #7f8c8d;
-            font-size: 1.1em;
-        }}
-        
-        .content {{
-            margin: 30px 0;
-        }}
-        
-        .content p {{
-            margin-bottom: 20px;
-            text-align: justify;
-            text-indent: 2em;
-        }}
-        
-        .content br {{
-            display: block;
-            content: "";
-            margin: 10px 0;
-        }}
-        
-        .scripture-block {{
-            background: linear-gradient(135deg, #fff8e1 0%, #ffecb3 100%);
-            border-left: 5px solid #ffa726;
-            border-right: 5px solid #ffa726;
-            padding: 25px 30px;
-            margin: 30px 0;
-            border-radius: 12px;
-            font-style: italic;
-            color: #e65100;
-            line-height: 2;
-            box-shadow: 0 4px 15px rgba(255, 167, 38, 0.2);
-            position: relative;
-            font-size: 1.05em;
-        }}
-        
-        .scripture-block::before {{
-            content: '"';
-            position: absolute;
-            left: 10px;
-            top: 5px;
-            font-size: 3em;
-            color: #ffb74d;
-            opacity: 0.3;
-            font-family: Georgia, serif;
-        }}
-        
-        .scripture-block::after {{
-            content: '"';
-            position: absolute;
-            right: 10px;
-            bottom: -10px;
-            font-size: 3em;
-            color: #ffb74d;
-            opacity: 0.3;
-            font-family: Georgia, serif;
-        }}
-        
-        .scripture-ref {{
-            display: inline;
-            color: #9c27b0;
-            font-size: 0.95em;
-            font-weight: 600;
-            font-style: italic;
-            background: linear-gradient(120deg, #f3e5f5 0%, #e1bee7 100%);
-            padding: 2px 8px;
-            border-radius: 4px;
-            margin: 0 3px;
-        }}
-        
-        .inline-scripture {{
-            color: #9c27b0;
-            font-weight: 500;
-            background: linear-gradient(120deg, #f3e5f5 0%, #e1bee7 100%);
-            padding: 3px 8px;
-            border-radius: 5px;
-            border-bottom: 2px solid #ab47bc;
-        }}
-        
-        .navigation {{
-            display: flex;
-            justify-content: space-between;
-            margin-top: 40px;
-            padding-top: 30px;
-            border-top: 2px solid #ecf0f1;
-        }}
-        
-        .nav-btn {{
-            display: inline-block;
-            padding: 12px 24px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            text-decoration: none;
-            border-radius: 25px;
-            font-weight: 600;
-            transition: transform 0.3s, box-shadow 0.3s;
-            box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);
-        }}
-        
-        .nav-btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 6px 20px rgba(102, 126, 234, 0.6);
-        }}
-        
-        @media (max-width: 768px) {{
-            .container {{
-                padding: 20px;
-            }}
-            
-            h1 {{
-                font-size: 1.5em;
-            }}
-            
-            .navigation {{
-                flex-direction: column;
-                gap: 15px;
-            }}
-            
-            .nav-btn {{
-                text-align: center;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{css_url}">
 </head>
 <body>
     <div class="container">
@@ -443,6 +283,7 @@ class RomansWebsiteGenerator:
                 <div class="topic-title">{topic['title']}</div>
                 <div class="topic-preview">{preview_text}...</div>
             </a>''')
+        css_url = '../' + publish_asset(CHAPTER_INDEX_CSS, self.output_dir)
         
         html = f'''<!DOCTYPE html>
 <html lang="zh-CN">
@@ -450,149 +291,7 @@ class RomansWebsiteGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{chapter_title} - 罗马书天书八部</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", "PingFang SC", "Hiragino Sans GB", "Microsoft YaHei", sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        
-        .header {{
-            text-align: center;
-            color: white;
-            margin-bottom: 40px;
-        }}
-        
-        .breadcrumb {{
-            font-size: 14px;
-            margin-bottom: 10px;
-            opacity: 0.9;
-        }}
-        
-        .breadcrumb a {{
-            color: white;
-            text-decoration: none;
-        }}
-        
-        .breadcrumb a:hover {{
-            text-decoration: underline;
-        }}
-        
-        h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            text-shadow: 0 2px 10px rgba(0,0,0,0.2);
-        }}
-        
-        .subtitle {{
-            font-size: 1.2em;
-            opacity: 0.95;
-        }}
-        
-        .topics-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            margin-bottom: 40px;
-        }}
-        
-        .topic-card {{
-            background: white;
-            border-radius: 15px;
-            padding: 25px;
-            text-decoration: none;
-            color: #333;
-            transition: transform 0.3s, box-shadow 0.3s;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-            display: block;
-        }}
-        
-        .topic-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 15px 40px rgba(0,0,0,0.3);
-        }}
-        
-        .topic-number {{
-            display: inline-block;
-            width: 40px;
-            height: 40px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 50%;
-            text-align: center;
-            line-height: 40px;
-            font-weight: bold;
-            margin-bottom: 15px;
-        }}
-        
-        .topic-title {{
-            font-size: 1.3em;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }}
-        
-        .topic-preview {{
-            color: #7f8c8d;
-            font-size: 0.95em;
-            line-height: 1.6;
-        }}
-        
-        .nav-footer {{
-            display: flex;
-            justify-content: space-between;
-            max-width: 600px;
-            margin: 0 auto;
-        }}
-        
-        .nav-btn {{
-            display: inline-block;
-            padding: 15px 30px;
-            background: white;
-            color: #667eea;
-            text-decoration: none;
-            border-radius: 30px;
-            font-weight: 600;
-            transition: transform 0.3s, box-shadow 0.3s;
-            box-shadow: 0 5px 20px rgba(255,255,255,0.3);
-        }}
-        
-        .nav-btn:hover {{
-            transform: translateY(-3px);
-            box-shadow: 0 8px 25px rgba(255,255,255,0.4);
-        }}
-        
-        @media (max-width: 768px) {{
-            h1 {{
-                font-size: 2em;
-            }}
-            
-            .topics-grid {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .nav-footer {{
-                flex-direction: column;
-                gap: 15px;
-            }}
-            
-            .nav-btn {{
-                text-align: center;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{css_url}">
 </head>
 <body>
     <div class="container">
@@ -636,6 +335,7 @@ class RomansWebsiteGenerator:
                 <div class="chapter-title">{chapter_title.split('. ', 1)[-1]}</div>
                 <div class="chapter-stats">{len(topics)} 个主题</div>
             </a>''')
+        css_url = publish_asset(MAIN_INDEX_CSS, self.output_dir)
         
         html = f'''<!DOCTYPE html>
 <html lang="zh-CN">
@@ -643,151 +343,7 @@ class RomansWebsiteGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>罗马书天书八部 - 16章完整版</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", "PingFang SC", "Hiragino Sans GB", "Microsoft YaHei", sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 40px 20px;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-        }}
-        
-        .hero {{
-            text-align: center;
-            color: white;
-            margin-bottom: 60px;
-        }}
-        
-        h1 {{
-            font-size: 3.5em;
-            margin-bottom: 20px;
-            text-shadow: 0 4px 20px rgba(0,0,0,0.3);
-            animation: fadeInDown 1s ease-out;
-        }}
-        
-        .subtitle {{
-            font-size: 1.5em;
-            opacity: 0.95;
-            margin-bottom: 10px;
-        }}
-        
-        .stats {{
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        
-        .chapters-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            gap: 25px;
-            margin-bottom: 60px;
-        }}
-        
-        .chapter-card {{
-            background: white;
-            border-radius: 20px;
-            padding: 30px;
-            text-decoration: none;
-            color: #333;
-            transition: transform 0.3s, box-shadow 0.3s;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-            display: block;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .chapter-card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%);
-            opacity: 0;
-            transition: opacity 0.3s;
-        }}
-        
-        .chapter-card:hover {{
-            transform: translateY(-8px) scale(1.02);
-            box-shadow: 0 20px 50px rgba(0,0,0,0.3);
-        }}
-        
-        .chapter-card:hover::before {{
-            opacity: 1;
-        }}
-        
-        .chapter-number {{
-            display: inline-block;
-            width: 60px;
-            height: 60px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 50%;
-            text-align: center;
-            line-height: 60px;
-            font-size: 1.8em;
-            font-weight: bold;
-            margin-bottom: 20px;
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-        }}
-        
-        .chapter-title {{
-            font-size: 1.4em;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 15px;
-            position: relative;
-        }}
-        
-        .chapter-stats {{
-            color: #7f8c8d;
-            font-size: 0.95em;
-        }}
-        
-        .footer {{
-            text-align: center;
-            color: white;
-            font-size: 0.95em;
-            opacity: 0.9;
-            padding: 20px;
-        }}
-        
-        @keyframes fadeInDown {{
-            from {{
-                opacity: 0;
-                transform: translateY(-30px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            h1 {{
-                font-size: 2.5em;
-            }}
-            
-            .subtitle {{
-                font-size: 1.2em;
-            }}
-            
-            .chapters-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{css_url}">
 </head>
 <body>
     <div class="container">
@@ -810,8 +366,8 @@ class RomansWebsiteGenerator:
         
         return html
     
-    def generate_website(self):
-        """生成完整网站"""
+    def generate_website(self, force=False):
+        """生成网站（只重新生成输入有变化的页面）"""
         print("=" * 60)
         print("开始生成罗马书网站(含前言,共17章)")
         print("=" * 60)
@@ -821,6 +377,11 @@ class RomansWebsiteGenerator:
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(self.data_dir, exist_ok=True)
         
+        # 页面结构写在本脚本里，样式在 templates/ 里（样式URL带内容哈希），任何一个变化时所有页面都要重新生成
+        salt = file_hash(__file__) + ''.join(
+            file_hash(os.path.join(TEMPLATES_DIR, css)) for css in (TOPIC_CSS, CHAPTER_INDEX_CSS, MAIN_INDEX_CSS))
+        manifest = BuildManifest(os.path.join(self.output_dir, '.build_manifest.json'),
+                                 salt=salt, force=force)
         chapter_data = {}
         page_count = 0
         
@@ -847,22 +408,31 @@ class RomansWebsiteGenerator:
             os.makedirs(chapter_dir, exist_ok=True)
             
             # 生成章节索引页
-            chapter_index_html = self.generate_chapter_index(chapter_num, topics)
             index_path = os.path.join(chapter_dir, f"chapter_{chapter_num:02d}.html")
-            with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(chapter_index_html)
-            print(f"  ✓ 生成章节索引: {index_path}")
+            index_inputs = {'chapter': chapter_num, 'topics': topics}
+            if not manifest.is_current(index_path, index_inputs):
+                chapter_index_html = self.generate_chapter_index(chapter_num, topics)
+                with open(index_path, 'w', encoding='utf-8') as f:
+                    f.write(chapter_index_html)
+                manifest.mark_built(index_path, index_inputs)
+                print(f"  ✓ 生成章节索引: {index_path}")
             page_count += 1
             
-            # 生成主题页面
+            # 生成主题页面（位置和总数决定上一页/下一页链接）
+            built = 0
             for idx, topic in enumerate(topics):
-                topic_html = self.generate_topic_page(chapter_num, topic, idx, len(topics))
                 topic_path = os.path.join(chapter_dir, f"topic_{idx + 1}.html")
-                with open(topic_path, 'w', encoding='utf-8') as f:
-                    f.write(topic_html)
+                topic_inputs = {'chapter': chapter_num, 'topic': topic,
+                                'index': idx, 'total': len(topics)}
+                if not manifest.is_current(topic_path, topic_inputs):
+                    topic_html = self.generate_topic_page(chapter_num, topic, idx, len(topics))
+                    with open(topic_path, 'w', encoding='utf-8') as f:
+                        f.write(topic_html)
+                    manifest.mark_built(topic_path, topic_inputs)
+                    built += 1
                 page_count += 1
             
-            print(f"  ✓ 生成 {len(topics)} 个主题页面")
+            print(f"  ✓ 生成 {built} 个主题页面（{len(topics) - built} 个未变化）")
             
             # 保存章节数据
             chapter_data[chapter_num] = {
@@ -873,19 +443,26 @@ class RomansWebsiteGenerator:
             
             print()
         
-        # 生成主页
-        main_index_html = self.generate_main_index(chapter_data)
+        # 生成主页（只用到各章的主题数）
         index_path = os.path.join(self.output_dir, "index.html")
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(main_index_html)
-        print(f"✓ 生成主页: {index_path}")
+        main_inputs = {n: data['topic_count'] for n, data in chapter_data.items()}
+        if not manifest.is_current(index_path, main_inputs):
+            main_index_html = self.generate_main_index(chapter_data)
+            with open(index_path, 'w', encoding='utf-8') as f:
+                f.write(main_index_html)
+            manifest.mark_built(index_path, main_inputs)
+            print(f"✓ 生成主页: {index_path}")
         page_count += 1
         
         # 保存数据JSON
         json_path = os.path.join(self.data_dir, "chapters_data.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(chapter_data, f, ensure_ascii=False, indent=2)
-        print(f"✓ 保存数据: {json_path}")
+        if not manifest.is_current(json_path, chapter_data):
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(chapter_data, f, ensure_ascii=False, indent=2)
+            manifest.mark_built(json_path, chapter_data)
+            print(f"✓ 保存数据: {json_path}")
+        
+        manifest.save()
         
         print()
         print("=" * 60)
@@ -894,11 +471,15 @@ class RomansWebsiteGenerator:
         print(f"📊 统计信息:")
         print(f"   - 章节数: 16")
         print(f"   - 主题总数: {sum(len(data['topics']) for data in chapter_data.values())}")
-        print(f"   - 页面总数: {page_count}")
+        print(f"   - 页面总数: {page_count}（本次生成 {manifest.built} 个文件，跳过 {manifest.skipped} 个）")
         print(f"   - 输出目录: {self.output_dir}/")
         print(f"   - 主页路径: {index_path}")
         print()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='罗马书网站生成器')
+    parser.add_argument('--force', action='store_true', help='忽略构建清单，重新生成所有页面')
+    args = parser.parse_args()
+    
     generator = RomansWebsiteGenerator()
-    generator.generate_website()
+    generator.generate_website(force=args.force)
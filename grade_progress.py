@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+建立根基课程离线批量评分
+Offline bulk grading and per-question statistics over exported student progress
+
+学生在页面上点“📤 导出进度”得到一个JSON文件：
+    {"student": "张三", "exported_at": "...", "progress": {"foundation_L1_S1": {"answers": {...}, ...}, ...}}
+也接受直接导出的 localStorage（页面键 -> JSON字符串或对象）。没有 student 字段时用文件名作为学生名。
+
+每个学生的每一节都按 foundation/data/answers/{页面}.json 评分（规则与页面上的“检查答案”相同，
+见 answer_grading），--jobs N 时按学生分给进程池并行评分，最后汇总：
+    题目统计: 每道题的作答人数、空白、正确/部分正确/错误人数、平均相似度、难度（1 - 平均得分）
+    学生成绩: 每个学生每一节的得分（--students 指定输出文件时）
+输出格式由扩展名决定：.csv，或 .parquet（需要安装 pandas 和 pyarrow）。
+
+用法:
+    python3 grade_progress.py exports/ -o question_stats.csv [--students student_scores.csv] [--jobs 4]
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from answer_grading import CORRECT, INCORRECT, PARTIAL, PARTIAL_CREDIT, grade_answers
+
+DEFAULT_ANSWERS_DIR = os.path.join('foundation', 'data', 'answers')
+
+QUESTION_FIELDS = ['page', 'lesson_title', 'section_title', 'key', 'reference',
+                   'responses', 'blank', 'correct', 'partial', 'incorrect',
+                   'correct_rate', 'mean_similarity', 'difficulty']
+STUDENT_FIELDS = ['student', 'page', 'total', 'correct', 'partial', 'incorrect', 'blank',
+                  'score', 'timestamp']
+
+# 工作进程中的标准答案：页面 -> 答案文件内容
+_answer_files = None
+
+
+def load_answer_files(answers_dir):
+    """读取所有标准答案文件：页面 -> {"lesson_title", "section_title", "answers"}"""
+    answer_files = {}
+    for path in sorted(glob.glob(os.path.join(answers_dir, 'foundation_L*_S*.json'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            answer_files[os.path.splitext(os.path.basename(path))[0]] = json.load(f)
+    return answer_files
+
+
+def _init_worker(answers_dir):
+    global _answer_files
+    _answer_files = load_answer_files(answers_dir)
+
+
+def load_export(path):
+    """读取一个导出文件，返回 (学生名, 页面 -> 进度)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    student = os.path.splitext(os.path.basename(path))[0]
+    if isinstance(data, dict) and isinstance(data.get('progress'), dict):
+        student = data.get('student') or student
+        data = data['progress']
+    if not isinstance(data, dict):
+        raise ValueError('不是进度导出文件')
+
+    progress = {}
+    for page, value in data.items():
+        # localStorage 中保存的是 JSON 字符串
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                continue
+        if isinstance(value, dict) and isinstance(value.get('answers'), dict):
+            progress[page] = value
+    return student, progress
+
+
+def grade_student(path):
+    """评一个学生的所有节（进程池的工作函数）
+
+    返回 (学生名, 成绩行列表, 题目统计) 或出错时 (文件名, None, 错误信息)。
+    题目统计为 (页面, 答案键) -> [作答, 空白, 正确, 部分正确, 错误, 相似度之和]。
+    """
+    try:
+        student, progress = load_export(path)
+    except (OSError, ValueError) as e:
+        return os.path.basename(path), None, str(e)
+
+    rows = []
+    question_stats = {}
+    for page, section in sorted(progress.items()):
+        answer_file = _answer_files.get(page)
+        if answer_file is None:
+            continue
+        answer_key = answer_file.get('answers', {})
+        keys = [key for key, info in answer_key.items() if info.get('has_data') and info.get('text')]
+        answers = section['answers']
+        items = [{'key': key, 'answer': str(answers.get(key) or '')} for key in keys]
+        results, summary = grade_answers(items, answer_key)
+
+        blank = 0
+        for item, result in zip(items, results):
+            is_blank = not item['answer'].strip()
+            blank += is_blank
+            stats = question_stats.setdefault((page, item['key']), [0, 0, 0, 0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += is_blank
+            stats[2 + (CORRECT, PARTIAL, INCORRECT).index(result['grade'])] += 1
+            stats[5] += result['similarity']
+        rows.append({'student': student, 'page': page, 'total': summary['total'],
+                     'correct': summary[CORRECT], 'partial': summary[PARTIAL],
+                     'incorrect': summary[INCORRECT], 'blank': blank,
+                     'score': summary['score'], 'timestamp': section.get('timestamp', '')})
+    return student, rows, question_stats
+
+
+def question_rows(question_stats, answer_files):
+    """汇总后的题目统计 -> 输出行（按页面和答案文件中的题目顺序）"""
+    rows = []
+    for page, answer_file in answer_files.items():
+        for key, info in answer_file.get('answers', {}).items():
+            stats = question_stats.get((page, key))
+            if not stats:
+                continue
+            responses, blank, correct, partial, incorrect, similarity_sum = stats
+            points = correct + PARTIAL_CREDIT * partial
+            rows.append({
+                'page': page,
+                'lesson_title': answer_file.get('lesson_title', ''),
+                'section_title': answer_file.get('section_title', ''),
+                'key': key,
+                'reference': info.get('reference', ''),
+                'responses': responses,
+                'blank': blank,
+                'correct': correct,
+                'partial': partial,
+                'incorrect': incorrect,
+                'correct_rate': round(correct / responses, 4),
+                'mean_similarity': round(similarity_sum / responses, 4),
+                'difficulty': round(1 - points / responses, 4),
+            })
+    return rows
+
+
+def write_table(rows, fields, path):
+    """按扩展名写出 CSV 或 Parquet（原子写入）"""
+    tmp_path = path + '.tmp'
+    if path.endswith('.parquet'):
+        import pandas as pd
+        pd.DataFrame(rows, columns=fields).to_parquet(tmp_path, index=False)
+    else:
+        # utf-8-sig 让 Excel 正确识别中文
+        with open(tmp_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+def collect_exports(inputs):
+    """命令行中的文件和目录 -> 导出文件列表（目录下的 *.json）"""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(glob.glob(os.path.join(item, '*.json'))))
+        else:
+            paths.append(item)
+    return paths
+
+
+def grade_exports(paths, answers_dir=DEFAULT_ANSWERS_DIR, jobs=1):
+    """评分所有导出文件，返回 (学生成绩行, 题目统计行, 出错的文件)"""
+    answer_files = load_answer_files(answers_dir)
+    student_rows = []
+    question_stats = {}
+    failures = []
+
+    if jobs <= 1:
+        _init_worker(answers_dir)
+        results = map(grade_student, paths)
+    else:
+        print(f"⚡ 使用 {jobs} 个进程并行评分")
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                       initargs=(answers_dir,))
+        results = executor.map(grade_student, paths, chunksize=max(1, len(paths) // (jobs * 4)))
+    try:
+        for student, rows, stats in results:
+            if rows is None:
+                failures.append((student, stats))
+                continue
+            student_rows.extend(rows)
+            for question, counts in stats.items():
+                total = question_stats.setdefault(question, [0, 0, 0, 0, 0, 0.0])
+                for i, value in enumerate(counts):
+                    total[i] += value
+    finally:
+        if jobs > 1:
+            executor.shutdown()
+
+    return student_rows, question_rows(question_stats, answer_files), failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='建立根基课程离线批量评分')
+    parser.add_argument('inputs', nargs='+', help='学生导出的进度JSON文件或其所在目录')
+    parser.add_argument('-o', '--output', default='question_stats.csv',
+                        help='题目统计输出文件（.csv 或 .parquet，默认 question_stats.csv）')
+    parser.add_argument('--students', help='学生成绩输出文件（.csv 或 .parquet，可选）')
+    parser.add_argument('--answers-dir', default=DEFAULT_ANSWERS_DIR,
+                        help=f'标准答案目录（默认 {DEFAULT_ANSWERS_DIR}）')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='并行评分的进程数（默认1，0表示使用全部CPU核心）')
+    args = parser.parse_args()
+
+    if any(path and path.endswith('.parquet') for path in (args.output, args.students)):
+        try:
+            import pandas  # noqa: F401
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("❌ 输出 Parquet 需要安装 pandas 和 pyarrow（pip install pandas pyarrow）")
+            sys.exit(1)
+
+    paths = collect_exports(args.inputs)
+    if not paths:
+        print("❌ 没有找到导出文件")
+        sys.exit(1)
+
+    start = time.time()
+    print(f"📝 评分 {len(paths)} 个学生的进度")
+    student_rows, stats_rows, failures = grade_exports(
+        paths, args.answers_dir, args.jobs if args.jobs > 0 else os.cpu_count())
+    for name, error in failures:
+        print(f"  ⚠️ 跳过 {name}: {error}")
+
+    write_table(stats_rows, QUESTION_FIELDS, args.output)
+    print(f"📊 题目统计: {args.output}（{len(stats_rows)} 道题）")
+    if args.students:
+        write_table(student_rows, STUDENT_FIELDS, args.students)
+        print(f"👥 学生成绩: {args.students}（{len(student_rows)} 条）")
+
+    hardest = sorted(stats_rows, key=lambda row: row['difficulty'], reverse=True)[:5]
+    if hardest:
+        print("🔥 最难的题目:")
+        for row in hardest:
+            print(f"   {row['page']} {row['key']}: 难度 {row['difficulty']:.2f}，"
+                  f"正确率 {row['correct_rate']:.0%}（{row['responses']} 人作答）")
+    print(f"✅ 完成，用时 {time.time() - start:.1f} 秒")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+页面模板与共享静态资源
+Precompiled page templates and content-hashed shared assets
+
+模板是普通的 HTML 文件，用 {{ name }} 标记占位符（CSS/JS 里的单个花括号不受影响）。
+模板只在第一次使用时编译成“文字片段 + 字段名”的列表，之后每次渲染只是一次 join。
+
+各页面共用的 CSS/JS 不再内联到每个页面里，而是发布为 assets/{名称}.{内容哈希}.{扩展名}，
+页面通过带哈希的URL引用：内容不变时URL不变，浏览器可以长期缓存；内容变化时URL随之变化。
+
+用法:
+    template = load_template('foundation_section.html')        # templates/ 下的文件
+    css_url = publish_asset('foundation_section.css', output_dir)
+    html = template.render(css_url=css_url, lesson_title='...')
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+
+ASSETS_DIR = 'assets'
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+_PLACEHOLDER_RE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+class Template:
+    """预编译的模板"""
+
+    def __init__(self, source):
+        # 偶数下标是文字片段，奇数下标是字段名
+        self._parts = _PLACEHOLDER_RE.split(source)
+        self.fields = set(self._parts[1::2])
+
+    def render(self, context=None, **kwargs):
+        """用 context 和关键字参数填充占位符；缺少字段时抛出 KeyError"""
+        values = dict(context or {}, **kwargs)
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = str(values[parts[i]])
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def load_template(path):
+    """读取并编译模板（相对路径相对于 templates/ 目录，每个模板只编译一次）"""
+    with open(_template_path(path), 'r', encoding='utf-8') as f:
+        return Template(f.read())
+
+
+@lru_cache(maxsize=None)
+def publish_asset(source, output_dir='.'):
+    """把 templates/ 下的共享资源发布到 output_dir/assets/，返回页面中引用它的相对URL
+
+    文件名带内容哈希，已发布过的相同内容不会重复写入。
+    """
+    source_path = _template_path(source)
+    with open(source_path, 'rb') as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()[:10]
+    stem, ext = os.path.splitext(os.path.basename(source_path))
+    filename = f"{stem}.{digest}{ext}"
+
+    target_dir = os.path.join(output_dir, ASSETS_DIR)
+    target = os.path.join(target_dir, filename)
+    if not os.path.exists(target):
+        os.makedirs(target_dir, exist_ok=True)
+        tmp_path = target + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, target)
+    return f"{ASSETS_DIR}/{filename}"
+
+
+def _template_path(path):
+    return os.path.join(TEMPLATES_DIR, path)
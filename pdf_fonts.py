@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF中文字体的发现、缓存与子集化
+CJK font discovery, cached font registry and glyph subsetting for reportlab
+
+1. 发现: 在 fontconfig（fc-list）、常见字体目录（Linux / macOS / Windows）中
+   按优先级查找 reportlab 能用的 TrueType 中文字体（.ttf/.ttc，CFF 轮廓的 .otf 不支持）。
+   也可以用环境变量 PDF_CJK_FONT=路径[:子字体序号] 直接指定。
+2. 缓存: 发现结果写入 .pdf_cache/fonts/registry.json，字体文件没变时下次直接使用，
+   不再每次运行都逐个尝试解析几十MB的字体文件。
+3. 子集化: 安装了 fontTools 时，把字体裁剪为文档实际用到的字符（几千个字形），
+   结果按 (字体, 字符集) 的哈希缓存。每个排版进程只需解析几百KB的子集字体。
+
+用法:
+    fonts = register_cjk_fonts(text)   # text 为文档中会出现的全部文字
+    fonts.regular, fonts.bold          # reportlab 字体名
+    fonts.key                          # 源字体的标识，可作为排版缓存键的一部分
+    fonts.files                        # 发现的 (常规字体, 粗体)，可传给其他进程的 register_cjk_fonts
+
+    python3 pdf_fonts.py               # 查看发现的字体
+    python3 pdf_fonts.py --refresh     # 重新扫描字体目录
+"""
+
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import namedtuple
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from book_store import atomic_write_text
+
+DEFAULT_CACHE_DIR = os.path.join('.pdf_cache', 'fonts')
+
+FONT_DIRS = [
+    os.path.expanduser('~/.local/share/fonts'),
+    os.path.expanduser('~/.fonts'),
+    '/usr/local/share/fonts',
+    '/usr/share/fonts',
+    '/System/Library/Fonts',
+    '/Library/Fonts',
+    'C:/Windows/Fonts',
+]
+
+# 候选字体文件名（按优先级）: (文件名, 子字体序号)
+REGULAR_CANDIDATES = [
+    ('STHeiti Light.ttc', 0),
+    ('PingFang.ttc', 0),
+    ('NotoSansSC-Regular.ttf', 0),
+    ('wqy-microhei.ttc', 0),
+    ('wqy-zenhei.ttc', 0),
+    ('DroidSansFallbackFull.ttf', 0),
+    ('DroidSansFallback.ttf', 0),
+    ('uming.ttc', 0),
+    ('ukai.ttc', 0),
+    ('msyh.ttc', 0),
+    ('simhei.ttf', 0),
+    ('simsun.ttc', 0),
+]
+BOLD_CANDIDATES = [
+    ('STHeiti Medium.ttc', 0),
+    ('NotoSansSC-Bold.ttf', 0),
+    ('msyhbd.ttc', 0),
+]
+
+FontFile = namedtuple('FontFile', ['path', 'index'])
+RegisteredFonts = namedtuple('RegisteredFonts', ['regular', 'bold', 'key', 'description', 'files'])
+
+FALLBACK_FONTS = RegisteredFonts('Helvetica', 'Helvetica-Bold', 'Helvetica', '默认字体 Helvetica',
+                                 (None, None))
+
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _index_font_files():
+    """字体目录中所有 .ttf/.ttc 文件: 文件名 -> 路径（先出现的目录优先）"""
+    files = {}
+    for font_dir in FONT_DIRS:
+        for path in glob.glob(os.path.join(font_dir, '**', '*.tt[fc]'), recursive=True):
+            files.setdefault(os.path.basename(path), path)
+    return files
+
+
+def _fontconfig_candidates():
+    """fontconfig 认为支持中文的字体文件（没有 fc-list 时为空）"""
+    try:
+        output = subprocess.run(['fc-list', ':lang=zh', 'file', 'index'],
+                                capture_output=True, text=True, timeout=30).stdout
+    except (OSError, subprocess.SubprocessError):
+        return []
+    candidates = []
+    for line in sorted(output.splitlines()):
+        # 格式: /path/font.ttc: :index=0
+        path, _, rest = line.partition(':')
+        index = rest.rpartition('index=')[2].strip() if 'index=' in rest else '0'
+        if path.lower().endswith(('.ttf', '.ttc')) and index.isdigit():
+            candidates.append(FontFile(path, int(index)))
+    return candidates
+
+
+def _usable(font_file):
+    """reportlab 能否加载该字体（CFF轮廓、损坏的文件会失败）"""
+    try:
+        TTFont('_probe', font_file.path, subfontIndex=font_file.index)
+        return True
+    except Exception:
+        return False
+
+
+def _first_usable(candidates):
+    seen = set()
+    for font_file in candidates:
+        if font_file in seen:
+            continue
+        seen.add(font_file)
+        if os.path.exists(font_file.path) and _usable(font_file):
+            return font_file
+    return None
+
+
+def discover_cjk_fonts():
+    """扫描系统字体，返回 (常规字体, 粗体) 的 FontFile，找不到时为 None"""
+    override = os.environ.get('PDF_CJK_FONT')
+    if override:
+        path, sep, index = override.rpartition(':')
+        if not (sep and index.isdigit()):
+            path, index = override, '0'
+        font_file = FontFile(path, int(index))
+        return (font_file if _usable(font_file) else None), None
+
+    files = _index_font_files()
+    regular = _first_usable(
+        [FontFile(files[name], index) for name, index in REGULAR_CANDIDATES if name in files]
+        + _fontconfig_candidates())
+    bold = _first_usable(
+        [FontFile(files[name], index) for name, index in BOLD_CANDIDATES if name in files])
+    return regular, bold
+
+
+def find_cjk_fonts(cache_dir=DEFAULT_CACHE_DIR, refresh=False):
+    """使用缓存的发现结果；缓存不存在、字体文件已变化或 refresh=True 时重新扫描
+
+    没找到字体的结果同样缓存，安装中文字体后用 `python3 pdf_fonts.py --refresh` 重新扫描。
+    """
+    registry_path = os.path.join(cache_dir, 'registry.json')
+    override = os.environ.get('PDF_CJK_FONT', '')
+    if not refresh:
+        try:
+            with open(registry_path, 'r', encoding='utf-8') as f:
+                registry = json.load(f)
+            if registry.get('override') == override and all(
+                    _file_stamp(entry['path']) == entry['stamp']
+                    for entry in registry['fonts'].values() if entry):
+                return tuple(FontFile(entry['path'], entry['index']) if entry else None
+                             for entry in (registry['fonts']['regular'], registry['fonts']['bold']))
+        except (FileNotFoundError, OSError, KeyError, ValueError):
+            pass
+
+    regular, bold = discover_cjk_fonts()
+    registry = {'override': override, 'fonts': {
+        name: font_file and {'path': font_file.path, 'index': font_file.index,
+                             'stamp': _file_stamp(font_file.path)}
+        for name, font_file in (('regular', regular), ('bold', bold))}}
+    os.makedirs(cache_dir, exist_ok=True)
+    atomic_write_text(registry_path, json.dumps(registry, ensure_ascii=False, indent=2))
+    return regular, bold
+
+
+def font_key(font_file):
+    """源字体的标识（路径、序号、大小、修改时间）"""
+    return f"{font_file.path}:{font_file.index}:{_file_stamp(font_file.path)}"
+
+
+def subset_font(font_file, text, cache_dir=DEFAULT_CACHE_DIR):
+    """把字体裁剪为 text 中出现的字符，返回子集字体的 FontFile
+
+    没有安装 fontTools 时返回原字体（reportlab 嵌入时仍会只写入用到的字形，只是解析整个字体较慢）。
+    """
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont as ToolsTTFont
+    except ImportError:
+        return font_file
+
+    chars = ''.join(sorted(set(text)))
+    digest = hashlib.sha256(f"{font_key(font_file)}\n{chars}".encode('utf-8')).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(font_file.path))[0]
+    subset_path = os.path.join(cache_dir, f"{stem}.{font_file.index}.{digest}.ttf")
+    if not os.path.exists(subset_path):
+        options = subset.Options()
+        options.notdef_outline = True
+        options.name_IDs = ['*']
+        font = ToolsTTFont(font_file.path, fontNumber=font_file.index)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=chars)
+        subsetter.subset(font)
+        os.makedirs(cache_dir, exist_ok=True)
+        # 唯一的临时文件：多个进程同时生成同一子集时互不影响
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.tmp_', suffix='.ttf')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                font.save(f)
+            os.replace(tmp_path, subset_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return FontFile(subset_path, 0)
+
+
+def _register(name, font_file):
+    pdfmetrics.registerFont(TTFont(name, font_file.path, subfontIndex=font_file.index))
+
+
+def register_cjk_fonts(text='', regular_name='SimSun', bold_name='SimSun-Bold',
+                       cache_dir=DEFAULT_CACHE_DIR, font_files=None):
+    """发现、子集化并注册中文字体，返回 RegisteredFonts；没有可用字体时返回 Helvetica
+
+    font_files 为已经发现的 (常规字体, 粗体)，传入时不再查找
+    （排版工作进程使用主进程的发现结果）。
+    """
+    regular, bold = font_files if font_files is not None else find_cjk_fonts(cache_dir)
+    if regular is None:
+        return FALLBACK_FONTS
+
+    key = font_key(regular)
+    _register(regular_name, subset_font(regular, text, cache_dir))
+    description = os.path.basename(regular.path)
+    if bold is None:
+        bold_name = regular_name
+    else:
+        key += '|' + font_key(bold)
+        _register(bold_name, subset_font(bold, text, cache_dir))
+        description += ' / ' + os.path.basename(bold.path)
+    return RegisteredFonts(regular_name, bold_name, key, description, (regular, bold))
+
+
+if __name__ == "__main__":
+    regular, bold = find_cjk_fonts(refresh='--refresh' in sys.argv)
+    print(f"常规字体: {regular.path + ':' + str(regular.index) if regular else '未找到'}")
+    print(f"粗体:     {bold.path + ':' + str(bold.index) if bold else '未找到（使用常规字体）'}")
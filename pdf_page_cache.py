@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF逐页文本缓存
+On-disk page-text cache shared by all PDF extractors
+
+以 (PDF内容哈希, 提取后端, 页码) 为键，把每页提取出的文本压缩后存入
+SQLite（默认 .pdf_cache/pages.sqlite）。同一份PDF第二次运行时不再解析PDF，
+调整提取规则的正则时每次运行只需毫秒级读取缓存。
+
+用法:
+    from pdf_page_cache import page_texts, open_pdf
+    for i, text in enumerate(page_texts("一对一（大字版）.pdf")):
+        ...
+    with open_pdf("一对一（大字版）.pdf") as pdf:   # 替代 pdfplumber.open
+        text = pdf.pages[0].extract_text()
+
+    python3 pdf_page_cache.py stats
+    python3 pdf_page_cache.py clear
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+import zlib
+
+DEFAULT_CACHE_DIR = '.pdf_cache'
+
+# 文件哈希的进程内缓存: (路径, 修改时间, 大小) -> sha256
+_hash_memo = {}
+
+
+def file_hash(path):
+    """PDF文件内容的 sha256（同一进程内按修改时间和大小记忆）"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _hash_memo:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        _hash_memo[key] = digest.hexdigest()
+    return _hash_memo[key]
+
+
+def _extract_pdfplumber(pdf_path, page_numbers):
+    import pdfplumber
+    texts = {}
+    with pdfplumber.open(pdf_path) as pdf:
+        for i in page_numbers:
+            texts[i] = pdf.pages[i].extract_text()
+    return texts
+
+
+def _count_pdfplumber(pdf_path):
+    import pdfplumber
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_pypdf2(pdf_path, page_numbers):
+    import PyPDF2
+    texts = {}
+    with open(pdf_path, 'rb') as f:
+        reader = PyPDF2.PdfReader(f)
+        for i in page_numbers:
+            texts[i] = reader.pages[i].extract_text()
+    return texts
+
+
+def _count_pypdf2(pdf_path):
+    import PyPDF2
+    with open(pdf_path, 'rb') as f:
+        return len(PyPDF2.PdfReader(f).pages)
+
+
+# 后端名 -> (提取函数, 计页函数)
+BACKENDS = {
+    'pdfplumber': (_extract_pdfplumber, _count_pdfplumber),
+    'pypdf2': (_extract_pypdf2, _count_pypdf2),
+}
+
+
+class PageTextCache:
+    """PDF逐页文本的 SQLite 缓存"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.db_path = os.path.join(cache_dir, 'pages.sqlite')
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 多个提取进程可能同时读写，使用WAL并等待锁
+            self._conn = sqlite3.connect(self.db_path, timeout=30)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('''CREATE TABLE IF NOT EXISTS documents (
+                pdf_hash TEXT, backend TEXT, page_count INTEGER,
+                PRIMARY KEY (pdf_hash, backend))''')
+            self._conn.execute('''CREATE TABLE IF NOT EXISTS pages (
+                pdf_hash TEXT, backend TEXT, page_num INTEGER, text BLOB,
+                PRIMARY KEY (pdf_hash, backend, page_num))''')
+        return self._conn
+
+    def page_count(self, pdf_path, backend='pdfplumber'):
+        """PDF总页数（缓存命中时不打开PDF）"""
+        conn = self._connect()
+        pdf_hash = file_hash(pdf_path)
+        row = conn.execute('SELECT page_count FROM documents WHERE pdf_hash=? AND backend=?',
+                           (pdf_hash, backend)).fetchone()
+        if row is not None:
+            return row[0]
+        count = BACKENDS[backend][1](pdf_path)
+        with conn:
+            conn.execute('INSERT OR REPLACE INTO documents VALUES (?, ?, ?)',
+                         (pdf_hash, backend, count))
+        return count
+
+    def get_pages(self, pdf_path, backend='pdfplumber', start=0, end=None):
+        """返回 [start, end) 页的文本列表（页码从0开始，无文本的页为 None）
+
+        缺失的页用指定后端一次性提取并写入缓存。
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"未知的PDF提取后端: {backend}")
+        conn = self._connect()
+        pdf_hash = file_hash(pdf_path)
+        if end is None:
+            end = self.page_count(pdf_path, backend)
+
+        texts = {}
+        rows = conn.execute(
+            'SELECT page_num, text FROM pages WHERE pdf_hash=? AND backend=? '
+            'AND page_num >= ? AND page_num < ?', (pdf_hash, backend, start, end))
+        for page_num, blob in rows:
+            texts[page_num] = None if blob is None else zlib.decompress(blob).decode('utf-8')
+
+        missing = [i for i in range(start, end) if i not in texts]
+        if missing:
+            extracted = BACKENDS[backend][0](pdf_path, missing)
+            with conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)',
+                    [(pdf_hash, backend, i,
+                      None if text is None else zlib.compress(text.encode('utf-8')))
+                     for i, text in extracted.items()])
+            texts.update(extracted)
+
+        return [texts[i] for i in range(start, end)]
+
+    def clear(self):
+        """清空缓存"""
+        conn = self._connect()
+        with conn:
+            conn.execute('DELETE FROM pages')
+            conn.execute('DELETE FROM documents')
+
+    def stats(self):
+        """缓存统计: [(pdf_hash, backend, 已缓存页数, 总页数)]"""
+        conn = self._connect()
+        return conn.execute(
+            'SELECT p.pdf_hash, p.backend, COUNT(*), d.page_count FROM pages p '
+            'LEFT JOIN documents d ON p.pdf_hash = d.pdf_hash AND p.backend = d.backend '
+            'GROUP BY p.pdf_hash, p.backend').fetchall()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class CachedPage:
+    """缓存中的一页，提供与 pdfplumber 页面相同的 extract_text()"""
+
+    def __init__(self, page_number, text):
+        self.page_number = page_number
+        self._text = text
+
+    def extract_text(self):
+        return self._text
+
+
+class CachedDocument:
+    """缓存中的整份PDF，可直接替换 `with pdfplumber.open(path) as pdf:`"""
+
+    def __init__(self, texts):
+        self.pages = [CachedPage(i + 1, text) for i, text in enumerate(texts)]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_cache = None
+_default_cache_pid = None
+
+
+def default_cache():
+    """进程内共享的默认缓存（缓存目录可用环境变量 PDF_PAGE_CACHE_DIR 指定）
+
+    SQLite 连接不能跨 fork 使用，进程池的子进程会各自打开新连接。
+    """
+    global _default_cache, _default_cache_pid
+    if _default_cache is None or _default_cache_pid != os.getpid():
+        _default_cache = PageTextCache(os.environ.get('PDF_PAGE_CACHE_DIR', DEFAULT_CACHE_DIR))
+        _default_cache_pid = os.getpid()
+    return _default_cache
+
+
+def page_texts(pdf_path, backend='pdfplumber', start=0, end=None):
+    """使用默认缓存取 [start, end) 页的文本"""
+    return default_cache().get_pages(pdf_path, backend, start, end)
+
+
+def page_count(pdf_path, backend='pdfplumber'):
+    """使用默认缓存取PDF总页数"""
+    return default_cache().page_count(pdf_path, backend)
+
+
+def open_pdf(pdf_path, backend='pdfplumber'):
+    """打开PDF（所有页的文本取自默认缓存），返回 CachedDocument"""
+    return CachedDocument(page_texts(pdf_path, backend))
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    cache = default_cache()
+    if command == 'clear':
+        cache.clear()
+        print("✓ PDF文本缓存已清空")
+    else:
+        for pdf_hash, backend, cached, total in cache.stats():
+            print(f"{pdf_hash[:12]}  {backend:<10}  {cached}/{total} 页")
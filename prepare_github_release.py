@@ -7,6 +7,8 @@ GitHub Pages 发布准备脚本
 
 import os
 import json
+import glob
+import hashlib
 import shutil
 from datetime import datetime
 
@@ -50,6 +52,78 @@ def create_github_optimized_version():
     
     return release_dir
 
+def write_shard(path, data):
+    """写出紧凑的JSON分片，返回 (字节数, sha256)"""
+    content = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(content)
+    return len(content), hashlib.sha256(content).hexdigest()
+
+def create_chapter_shards(release_dir):
+    """把每卷书拆成按章的分片 data/{book}/{章}.json，并生成清单
+    
+    每卷书目录下的 index.json 保存书卷信息和各章分片的字节数与哈希，
+    data/shards.json 汇总所有书卷，页面可按需只加载正在阅读的一章。
+    """
+    print("\n✂️  生成按章分片...")
+    
+    data_dir = os.path.join(release_dir, "data")
+    manifest = {'generated': datetime.now().isoformat(), 'books': {}}
+    
+    for book_file in sorted(glob.glob(os.path.join(data_dir, "*.json"))):
+        if 'backup' in os.path.basename(book_file):
+            continue
+        with open(book_file, 'r', encoding='utf-8') as f:
+            book_data = json.load(f)
+        if not isinstance(book_data, dict) or not book_data.get('verses'):
+            continue
+        
+        book_id = os.path.splitext(os.path.basename(book_file))[0]
+        book_dir = os.path.join(data_dir, book_id)
+        os.makedirs(book_dir, exist_ok=True)
+        
+        meta = {k: v for k, v in book_data.items() if k not in ('verses', 'keyVerses')}
+        chapters = {}
+        for verse in book_data['verses']:
+            chapters.setdefault(verse['chapter'], []).append(verse)
+        key_verses = {}
+        for kv in book_data.get('keyVerses', []):
+            key_verses.setdefault(kv['chapter'], []).append(kv)
+        
+        chapter_index = {}
+        for chapter, verses in sorted(chapters.items()):
+            shard = dict(meta)
+            shard['chapter'] = chapter
+            shard['verses'] = sorted(verses, key=lambda v: v['verse'])
+            shard['keyVerses'] = key_verses.get(chapter, [])
+            size, digest = write_shard(os.path.join(book_dir, f"{chapter}.json"), shard)
+            chapter_index[str(chapter)] = {
+                'path': f"data/{book_id}/{chapter}.json",
+                'bytes': size,
+                'sha256': digest,
+                'verses': len(verses)
+            }
+        
+        index = dict(meta)
+        index['keyVerses'] = book_data.get('keyVerses', [])
+        index['shards'] = chapter_index
+        size, digest = write_shard(os.path.join(book_dir, "index.json"), index)
+        
+        manifest['books'][book_id] = {
+            'index': f"data/{book_id}/index.json",
+            'bytes': size,
+            'sha256': digest,
+            'chapters': len(chapter_index),
+            'total_bytes': sum(c['bytes'] for c in chapter_index.values())
+        }
+        print(f"  ✅ {book_id}: {len(chapter_index)} 章")
+    
+    with open(os.path.join(data_dir, "shards.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"  📋 分片清单: data/shards.json（{len(manifest['books'])} 卷）")
+    
+    return manifest
+
 def optimize_for_static_hosting(release_dir):
     """优化代码以适应静态托管"""
     print("\n🔧 优化代码以适应静态托管...")
@@ -66,6 +140,12 @@ def optimize_for_static_hosting(release_dir):
             '// 静态版本暂不支持在线编辑\n            // fetch("http://localhost:8001/api/save-verse"'
         )
         
+        # 章节数据改为加载按章分片（静态托管没有 /api/verses）
+        content = content.replace(
+            "fetch(`/api/verses?book=${bookKey}&chapter=${chapter}`)",
+            "fetch(`data/${bookKey}/${chapter}.json`)"
+        )
+        
         # 添加静态版本提示
         static_notice = '''
         <!-- GitHub Pages 静态版本提示 -->
@@ -313,13 +393,16 @@ def main():
     # 1. 创建优化版本
     release_dir = create_github_optimized_version()
     
-    # 2. 优化代码
+    # 2. 生成按章分片
+    create_chapter_shards(release_dir)
+    
+    # 3. 优化代码
     optimize_for_static_hosting(release_dir)
     
-    # 3. 创建 GitHub 文件
+    # 4. 创建 GitHub 文件
     create_github_files(release_dir)
     
-    # 4. 创建部署脚本
+    # 5. 创建部署脚本
     create_deployment_script(release_dir)
     
     print("\n" + "=" * 40)
@@ -4,7 +4,7 @@
 从PDF提取建立根基课程完整内容
 """
 
-import pdfplumber
+from pdf_page_cache import open_pdf
 import json
 import re
 
@@ -17,7 +17,7 @@ def extract_from_pdf():
     print("="*70)
     
     # 读取PDF
-    with pdfplumber.open(pdf_path) as pdf:
+    with open_pdf(pdf_path) as pdf:
         print(f"PDF总页数: {len(pdf.pages)}")
         
         # 提取所有文本
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+罗马书讲稿的单遍结构解析器
+Single-pass tokenizer and AST for the Romans source text
+
+每一行只分类一次，得到带类型的节点流：
+    chapter    章节标题      "1 序言"（少于30字）
+    topic      主题标题      "1.  主题标题"（默认少于50字）
+    scripture  独立经文段    含 (罗马书 1:17) 或全角冒号 (罗马书 3：23) 这样的引用，且没有段内经文标记
+    subtitle   小标题        "一、..." 或以问号结尾的短句
+    quote      引用段        整行是一段引号引文（引号内至少30字）
+    paragraph  普通段落
+段内经文 {{inline-scripture}}...{{/inline-scripture}} 在分类时一并切分为 spans
+（偶数下标是普通文字，奇数下标是段内经文）。
+
+parse() 把节点流组装成 文档 -> 章 -> 主题 -> 内容节点 的树。
+网站生成器、PDF生成器和校验脚本都消费同一棵树，不再各自用正则重新扫描。
+
+用法:
+    document = parse_file('BooksofRoman/romans_content.txt')
+    for chapter in document.chapters:
+        for topic in chapter.topics:
+            for block in topic.blocks:
+                print(block.kind, block.text)
+"""
+
+import re
+from collections import namedtuple
+
+# 节点类型
+DOCUMENT = 'document'
+CHAPTER = 'chapter'
+TOPIC = 'topic'
+SCRIPTURE = 'scripture'
+SUBTITLE = 'subtitle'
+QUOTE = 'quote'
+PARAGRAPH = 'paragraph'
+
+INLINE_SCRIPTURE_OPEN = '{{inline-scripture}}'
+
+# 章节 "1 标题" 与主题 "1.  标题" 共用一个正则，第二组是否为 '.' 区分两者
+_HEADING_RE = re.compile(r'^(\d+)(\.?)\s+(.+)$')
+_SCRIPTURE_REF_RE = re.compile(r'\([^)]*(?:书|福音|行传|启示录)\s*\d+[:：]\d+[^)]*\)')
+_SUBTITLE_RE = re.compile(r'^[一二三四五六七八九十]+、')
+_INLINE_RE = re.compile(r'\{\{inline-scripture\}\}(.*?)\{\{/inline-scripture\}\}')
+
+CHAPTER_MAX_LEN = 30
+TOPIC_MAX_LEN = 50
+SUBTITLE_MAX_LEN = 40
+QUOTE_MIN_LEN = 30
+
+_QUOTE_RE = re.compile(rf'^"[^"]{{{QUOTE_MIN_LEN},}}"$')
+
+Token = namedtuple('Token', [
+    'kind', 'text', 'line_no', 'number', 'title', 'verse_text', 'reference', 'spans'])
+Token.__doc__ = ('一行的分类结果：类型、去掉首尾空白的原文、行号（从1开始）；'
+                 '标题行有 number/title，经文段有 verse_text/reference，内容行有 spans')
+
+
+class Section:
+    """树中的容器节点：文档、章或主题"""
+
+    def __init__(self, kind, number=None, title=None, line_no=None):
+        self.kind = kind
+        self.number = number
+        self.title = title
+        self.line_no = line_no
+        self.children = []
+
+    def _children_of(self, kind):
+        return [child for child in self.children if child.kind == kind]
+
+    @property
+    def chapters(self):
+        return self._children_of(CHAPTER)
+
+    @property
+    def topics(self):
+        return self._children_of(TOPIC)
+
+    @property
+    def blocks(self):
+        """直接属于本节点的内容节点（不含子章节/子主题）"""
+        return [child for child in self.children if isinstance(child, Token)]
+
+    def __repr__(self):
+        return f"Section({self.kind!r}, {self.number!r}, {self.title!r}, {len(self.children)} children)"
+
+
+def classify_line(line, line_no=0, chapters=True, topic_max_len=TOPIC_MAX_LEN):
+    """对一行分类，返回 Token；空行返回 None
+
+    chapters=False 时不识别章节标题（单章文件），topic_max_len=None 时主题标题不限长度。
+    """
+    text = line.strip()
+    if not text:
+        return None
+
+    heading = _HEADING_RE.match(text)
+    if heading:
+        number, dot, title = heading.groups()
+        if not dot and chapters and len(text) < CHAPTER_MAX_LEN:
+            return Token(CHAPTER, text, line_no, number, title, None, None, None)
+        if dot and (topic_max_len is None or len(text) < topic_max_len):
+            return Token(TOPIC, text, line_no, number, title, None, None, None)
+
+    spans = tuple(_INLINE_RE.split(text))
+    if INLINE_SCRIPTURE_OPEN not in text and _SCRIPTURE_REF_RE.search(text):
+        tail = _split_tail_reference(text)
+        if tail:
+            return Token(SCRIPTURE, text, line_no, None, None, tail[0].strip(), tail[1], spans)
+        return Token(SCRIPTURE, text, line_no, None, None, None, None, spans)
+
+    if _SUBTITLE_RE.match(text) or (text.endswith(('？', '?')) and len(text) < SUBTITLE_MAX_LEN):
+        return Token(SUBTITLE, text, line_no, None, None, None, None, spans)
+    if _QUOTE_RE.match(text):
+        return Token(QUOTE, text, line_no, None, None, None, None, spans)
+    return Token(PARAGRAPH, text, line_no, None, None, None, None, spans)
+
+
+def _split_tail_reference(text):
+    """把 "经文内容(罗马书 1:17)" 拆成 (经文内容, 引用)，结尾不是引用时返回 None
+
+    等价于 re.search(r'(.+?)(\(...\))$', text)，但只检查最后一个括号段：
+    长段落上用惰性前缀加 $ 锚定的正则会反复回溯，几乎卡死。
+    """
+    if not text.endswith(')'):
+        return None
+    # 引用从最后一段括号内最靠前的 '(' 开始（内容不能为空，所以至少从下标1开始）
+    start = text.find('(', max(1, text.rfind(')', 0, len(text) - 1) + 1))
+    if start < 0 or not _SCRIPTURE_REF_RE.fullmatch(text, start):
+        return None
+    return text[:start], text[start:]
+
+
+def tokenize(lines, chapters=True, topic_max_len=TOPIC_MAX_LEN):
+    """逐行分类，生成 Token 流（跳过空行）"""
+    for line_no, line in enumerate(lines, 1):
+        token = classify_line(line, line_no, chapters, topic_max_len)
+        if token is not None:
+            yield token
+
+
+def parse(lines, title=None, chapters=True, topic_max_len=TOPIC_MAX_LEN):
+    """把行序列解析为文档树
+
+    主题挂在当前章下，内容节点挂在当前主题下；第一个章/主题之前的内容挂在上一级节点上，
+    只遍历 chapters/topics 的消费者自然会忽略它们。
+    """
+    document = Section(DOCUMENT, title=title)
+    chapter = None
+    topic = None
+    for token in tokenize(lines, chapters, topic_max_len):
+        if token.kind == CHAPTER:
+            chapter = Section(CHAPTER, token.number, token.title, token.line_no)
+            document.children.append(chapter)
+            topic = None
+        elif token.kind == TOPIC:
+            topic = Section(TOPIC, token.number, token.title, token.line_no)
+            (chapter or document).children.append(topic)
+        else:
+            (topic or chapter or document).children.append(token)
+    return document
+
+
+def parse_file(file_path, title=None, chapters=True, topic_max_len=TOPIC_MAX_LEN):
+    """读取并解析文件"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return parse(f, title, chapters, topic_max_len)
+
+
+def render_spans(spans, open_tag, close_tag):
+    """把 spans 拼回文本，段内经文用 open_tag/close_tag 包裹"""
+    parts = list(spans)
+    for i in range(1, len(parts), 2):
+        parts[i] = f'{open_tag}{parts[i]}{close_tag}'
+    return ''.join(parts)
+
+
+if __name__ == "__main__":
+    import sys
+    from collections import Counter
+
+    path = sys.argv[1] if len(sys.argv) > 1 else 'BooksofRoman/romans_content.txt'
+    document = parse_file(path)
+    for chapter in document.chapters:
+        counts = Counter(block.kind for topic in chapter.topics for block in topic.blocks)
+        summary = ', '.join(f"{kind} {count}" for kind, count in sorted(counts.items()))
+        print(f"第{chapter.number}章 {chapter.title}: {len(chapter.topics)} 个主题 ({summary})")
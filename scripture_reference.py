@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+经文引用解析
+Scripture reference parser with a full-Bible book table
+
+支持全部 66 卷书的全名、简称和常见别名（如 约壹/约一/约翰一书），
+全角冒号、逗号、分号和各种连字符，以及跨章范围：
+
+    罗 3:23            罗马书 3:9-20,23
+    罗 7:24-8:2        诗 23:1-3；24:1
+    约壹 1：9          请阅读马太福音 5:3-12
+
+正则只编译一次，解析结果用 LRU 缓存，重复的引用不会被重新解析。
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+# (书卷ID, 全名, 简称, 其他别名)
+BOOKS = [
+    # 旧约
+    ('genesis', '创世记', '创', ()),
+    ('exodus', '出埃及记', '出', ()),
+    ('leviticus', '利未记', '利', ()),
+    ('numbers', '民数记', '民', ()),
+    ('deuteronomy', '申命记', '申', ()),
+    ('joshua', '约书亚记', '书', ()),
+    ('judges', '士师记', '士', ()),
+    ('ruth', '路得记', '得', ()),
+    ('1samuel', '撒母耳记上', '撒上', ()),
+    ('2samuel', '撒母耳记下', '撒下', ()),
+    ('1kings', '列王纪上', '王上', ('列王记上',)),
+    ('2kings', '列王纪下', '王下', ('列王记下',)),
+    ('1chronicles', '历代志上', '代上', ()),
+    ('2chronicles', '历代志下', '代下', ()),
+    ('ezra', '以斯拉记', '拉', ()),
+    ('nehemiah', '尼希米记', '尼', ()),
+    ('esther', '以斯帖记', '斯', ()),
+    ('job', '约伯记', '伯', ()),
+    ('psalms', '诗篇', '诗', ()),
+    ('proverbs', '箴言', '箴', ()),
+    ('ecclesiastes', '传道书', '传', ()),
+    ('songofsongs', '雅歌', '歌', ()),
+    ('isaiah', '以赛亚书', '赛', ()),
+    ('jeremiah', '耶利米书', '耶', ()),
+    ('lamentations', '耶利米哀歌', '哀', ()),
+    ('ezekiel', '以西结书', '结', ()),
+    ('daniel', '但以理书', '但', ()),
+    ('hosea', '何西阿书', '何', ()),
+    ('joel', '约珥书', '珥', ()),
+    ('amos', '阿摩司书', '摩', ()),
+    ('obadiah', '俄巴底亚书', '俄', ()),
+    ('jonah', '约拿书', '拿', ()),
+    ('micah', '弥迦书', '弥', ()),
+    ('nahum', '那鸿书', '鸿', ()),
+    ('habakkuk', '哈巴谷书', '哈', ()),
+    ('zephaniah', '西番雅书', '番', ()),
+    ('haggai', '哈该书', '该', ()),
+    ('zechariah', '撒迦利亚书', '亚', ()),
+    ('malachi', '玛拉基书', '玛', ()),
+    # 新约
+    ('matthew', '马太福音', '太', ()),
+    ('mark', '马可福音', '可', ()),
+    ('luke', '路加福音', '路', ()),
+    ('john', '约翰福音', '约', ()),
+    ('acts', '使徒行传', '徒', ()),
+    ('romans', '罗马书', '罗', ()),
+    ('1corinthians', '哥林多前书', '林前', ()),
+    ('2corinthians', '哥林多后书', '林后', ()),
+    ('galatians', '加拉太书', '加', ()),
+    ('ephesians', '以弗所书', '弗', ()),
+    ('philippians', '腓立比书', '腓', ()),
+    ('colossians', '歌罗西书', '西', ()),
+    ('1thessalonians', '帖撒罗尼迦前书', '帖前', ()),
+    ('2thessalonians', '帖撒罗尼迦后书', '帖后', ()),
+    ('1timothy', '提摩太前书', '提前', ()),
+    ('2timothy', '提摩太后书', '提后', ()),
+    ('titus', '提多书', '多', ()),
+    ('philemon', '腓利门书', '门', ()),
+    ('hebrews', '希伯来书', '来', ()),
+    ('james', '雅各书', '雅', ()),
+    ('1peter', '彼得前书', '彼前', ()),
+    ('2peter', '彼得后书', '彼后', ()),
+    ('1john', '约翰一书', '约壹', ('约一', '约翰壹书')),
+    ('2john', '约翰二书', '约贰', ('约二', '约翰贰书')),
+    ('3john', '约翰三书', '约叁', ('约三', '约翰叁书')),
+    ('jude', '犹大书', '犹', ()),
+    ('revelation', '启示录', '启', ()),
+]
+
+# 任意名称（全名/简称/别名） -> 书卷ID
+BOOK_IDS = {}
+# 书卷ID -> (全名, 简称)
+BOOK_NAMES = {}
+for _book_id, _name, _abbr, _aliases in BOOKS:
+    BOOK_NAMES[_book_id] = (_name, _abbr)
+    for _alias in (_name, _abbr) + _aliases:
+        BOOK_IDS[_alias] = _book_id
+
+OLD_TESTAMENT = {b[0] for b in BOOKS[:39]}
+
+# 引用前常见的提示语
+_PREFIXES = ('请阅读', '请读', '阅读', '参阅', '参看', '见')
+
+# 全角及变体符号 -> 半角
+_NORMALIZE = str.maketrans({
+    '：': ':', '∶': ':',
+    '，': ',', '、': ',',
+    '；': ';',
+    '－': '-', '—': '-', '–': '-', '～': '-', '~': '-', '至': '-',
+    '　': ' ',
+    **{chr(0xFF10 + i): str(i) for i in range(10)},
+})
+
+_REF_RE = re.compile(r'^\s*([一-龥]+?)\s*(\d[\d:;,\-\s]*)$')
+_POINT_RE = re.compile(r'^(?:(\d+):)?(\d+)$')
+
+# 一章结束（比任何节号都大）
+END_OF_CHAPTER = 999
+
+VerseRange = namedtuple('VerseRange', ['start', 'end'])
+VerseRange.__doc__ = '经文范围，start/end 为 (章, 节)，可以跨章'
+
+Reference = namedtuple('Reference', ['book_id', 'book_name', 'ranges'])
+Reference.__doc__ = '解析后的引用：书卷ID、原文中的书名、VerseRange 元组'
+
+
+def normalize(ref):
+    """统一全角符号、去掉提示语前缀"""
+    ref = ref.translate(_NORMALIZE).strip()
+    for prefix in _PREFIXES:
+        if ref.startswith(prefix):
+            ref = ref[len(prefix):].lstrip()
+            break
+    return ref
+
+
+def book_id_for(name):
+    """书名（全名、简称或别名）对应的书卷ID，未知时返回 None"""
+    return BOOK_IDS.get(name.strip())
+
+
+@lru_cache(maxsize=8192)
+def parse(ref):
+    """解析完整引用，如 "罗 7:24-8:2"，无法解析时返回 None"""
+    match = _REF_RE.match(normalize(ref))
+    if not match:
+        return None
+    book_name = match.group(1)
+    book_id = BOOK_IDS.get(book_name)
+    ranges = parse_ranges(match.group(2))
+    if not ranges:
+        return None
+    return Reference(book_id, book_name, ranges)
+
+
+@lru_cache(maxsize=8192)
+def parse_ranges(spec):
+    """解析不含书名的章节部分，如 "3:9-20,23" 或 "7:24-8:2;9:1"，返回 VerseRange 元组
+
+    只有章号（如 "23" 或 "23-24"）表示整章；格式错误时返回空元组。
+    """
+    spec = normalize(spec).replace(' ', '')
+    ranges = []
+    chapter = None
+    for segment in spec.split(';'):
+        chapter_only = ':' not in segment
+        for part in segment.split(','):
+            if not part:
+                continue
+            bounds = part.split('-')
+            if len(bounds) > 2 or not all(bounds):
+                return ()
+            points = []
+            for bound in bounds:
+                m = _POINT_RE.match(bound)
+                if not m:
+                    return ()
+                if chapter_only:
+                    points.append((int(m.group(2)), None))
+                elif m.group(1):
+                    chapter = int(m.group(1))
+                    points.append((chapter, int(m.group(2))))
+                elif chapter is None:
+                    return ()
+                else:
+                    points.append((chapter, int(m.group(2))))
+            if chapter_only:
+                first, last = points[0][0], points[-1][0]
+                ranges.append(VerseRange((first, 1), (last, END_OF_CHAPTER)))
+                chapter = last
+            else:
+                ranges.append(VerseRange(points[0], points[-1]))
+    return tuple(ranges)
+
+
+def expand(ranges, index=None, book_id=None):
+    """把范围展开成 [(章, 节), ...]
+
+    单章内的范围直接展开；跨章或整章的范围需要提供经文索引（VerseIndex）和书卷ID，
+    以确定每章实际有多少节。
+    """
+    verses = []
+    for start, end in ranges:
+        if start[0] == end[0] and end[1] != END_OF_CHAPTER:
+            verses.extend((start[0], v) for v in range(start[1], end[1] + 1))
+        elif index is None:
+            raise ValueError('跨章或整章范围需要经文索引')
+        else:
+            verses.extend((v['chapter'], v['verse'])
+                          for v in index.range(book_id, start, end))
+    return verses
+
+
+def format_range(verse_range):
+    """把 VerseRange 格式化回文本，如 7:24-8:2"""
+    (c1, v1), (c2, v2) = verse_range
+    if v1 == 1 and v2 == END_OF_CHAPTER:
+        return f"{c1}" if c1 == c2 else f"{c1}-{c2}"
+    if (c1, v1) == (c2, v2):
+        return f"{c1}:{v1}"
+    if c1 == c2:
+        return f"{c1}:{v1}-{v2}"
+    return f"{c1}:{v1}-{c2}:{v2}"
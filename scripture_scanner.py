@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单遍经文引用扫描器
+Single-pass scanner that finds every scripture reference in a document
+
+用 Aho-Corasick 自动机同时匹配全部书名、简称和别名（来自 scripture_reference.BOOKS），
+书名之后用一个小状态机读取 章:节、范围和列表（如 3:16、7:24-8:2、5:3-12,14；6:1）。
+整篇文本只扫描一次，每个引用带有字符偏移、所在行号和上下文行。
+
+用法:
+    from scripture_scanner import scan
+    for match in scan(text):
+        print(match.reference, match.start, match.end, match.context)
+"""
+
+from collections import deque, namedtuple
+
+from scripture_reference import BOOK_IDS, parse_ranges
+
+_COLONS = frozenset(':：∶')
+_DASHES = frozenset('-－—–~～')
+_COMMAS = frozenset(',，、')
+_SEMICOLONS = frozenset(';；')
+_SPACES = frozenset(' \t　')
+
+ScriptureMatch = namedtuple('ScriptureMatch', [
+    'book_id', 'reference', 'ranges', 'start', 'end', 'line', 'context'])
+ScriptureMatch.__doc__ = ('扫描到的引用：书卷ID、原文中的引用文本、VerseRange 元组、'
+                          '字符偏移 [start, end)、行号（从0开始）、上下文行')
+
+
+def _digit_value(ch):
+    """半角或全角数字的值，不是数字时返回 None"""
+    if '0' <= ch <= '9':
+        return ord(ch) - 48
+    if '０' <= ch <= '９':
+        return ord(ch) - 0xFF10
+    return None
+
+
+class ScriptureScanner:
+    """书名 Aho-Corasick 自动机 + 章节状态机"""
+
+    def __init__(self, names=None):
+        names = BOOK_IDS if names is None else names
+        # 自动机：每个状态的转移表、失败指针、以该状态结尾的书名
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for name, book_id in names.items():
+            state = 0
+            for ch in name:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][ch] = nxt
+                state = nxt
+            self._out[state] = self._out[state] + ((len(name), book_id),)
+        self._build_fail_links()
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, text, context_lines=3):
+        """扫描全文，按出现顺序返回 ScriptureMatch 列表
+
+        同一位置有多个书名时取最长的（如 约翰福音 而不是 约），
+        相互重叠的候选取最靠前的。context 为引用所在行前后各 context_lines 行。
+        """
+        candidates = []
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        line = 0
+        line_of = []
+        for i, ch in enumerate(text):
+            line_of.append(line)
+            if ch == '\n':
+                line += 1
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, book_id in out[state]:
+                end = _scan_spec(text, i + 1)
+                if end:
+                    candidates.append((i + 1 - length, end, book_id, i + 1))
+
+        lines = text.split('\n')
+        matches = []
+        last_end = 0
+        for start, end, book_id, spec_start in sorted(candidates, key=lambda c: (c[0], -c[1])):
+            if start < last_end:
+                continue
+            ranges = parse_ranges(text[spec_start:end])
+            if not ranges:
+                continue
+            last_end = end
+            line = line_of[start]
+            context = tuple(lines[max(0, line - context_lines):line + context_lines + 1])
+            matches.append(ScriptureMatch(book_id, text[start:end], ranges,
+                                          start, end, line, context))
+        return matches
+
+
+def _read_number(text, pos):
+    """从 pos 读取一个数字，返回结束位置（没有数字时返回 pos）"""
+    while pos < len(text) and _digit_value(text[pos]) is not None:
+        pos += 1
+    return pos
+
+
+def _scan_spec(text, pos):
+    """书名之后的章节状态机，返回引用结束位置；不是 章:节 形式时返回 0
+
+    接受: 章:节 [ -节 | -章:节 ] { ,节[-节] | ;章:节[...] }
+    """
+    n = len(text)
+    while pos < n and text[pos] in _SPACES:
+        pos += 1
+    # 章:节（至少要有一个冒号，只有章号的“诗篇23”不算引用）
+    end = _read_number(text, pos)
+    if end == pos or end >= n or text[end] not in _COLONS:
+        return 0
+    verse_end = _read_number(text, end + 1)
+    if verse_end == end + 1:
+        return 0
+    pos = verse_end
+
+    while pos < n:
+        ch = text[pos]
+        if ch in _DASHES or ch in _COMMAS:
+            # 范围或列表：节号，或 章:节
+            num_end = _read_number(text, pos + 1)
+            if num_end == pos + 1:
+                break
+            if num_end < n and text[num_end] in _COLONS:
+                verse_end = _read_number(text, num_end + 1)
+                if verse_end == num_end + 1:
+                    break
+                num_end = verse_end
+            pos = num_end
+        elif ch in _SEMICOLONS:
+            # 分号后必须是 章:节
+            start = pos + 1
+            while start < n and text[start] in _SPACES:
+                start += 1
+            chapter_end = _read_number(text, start)
+            if chapter_end == start or chapter_end >= n or text[chapter_end] not in _COLONS:
+                break
+            verse_end = _read_number(text, chapter_end + 1)
+            if verse_end == chapter_end + 1:
+                break
+            pos = verse_end
+        else:
+            break
+    return pos
+
+
+_default_scanner = None
+
+
+def default_scanner():
+    """共享的扫描器（自动机只构建一次）"""
+    global _default_scanner
+    if _default_scanner is None:
+        _default_scanner = ScriptureScanner()
+    return _default_scanner
+
+
+def scan(text, context_lines=3):
+    """用共享扫描器扫描全文"""
+    return default_scanner().scan(text, context_lines)
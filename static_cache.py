@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+静态文件压缩缓存
+In-memory compressed cache for static responses
+
+书卷JSON和课程HTML体积较大且很少变化：每个文件读一次，
+计算强ETag并缓存 gzip（安装了 brotli 时还有 br）压缩结果；
+文件的修改时间或大小变化时自动失效，总大小超过上限时按 LRU 淘汰。
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 值得压缩的文本类型
+COMPRESSIBLE_EXTENSIONS = {'.json', '.html', '.htm', '.css', '.js', '.txt', '.svg', '.md'}
+# 小于此大小的文件不压缩
+MIN_COMPRESS_SIZE = 1024
+# 缓存总大小上限（字节）
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+class CachedFile:
+    """单个文件的缓存内容及各编码版本"""
+
+    def __init__(self, path, stat):
+        self.path = path
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        with open(path, 'rb') as f:
+            self.body = f.read()
+        digest = hashlib.sha1(self.body).hexdigest()
+        self.etag = f'"{digest}"'
+        self.encoded = {}
+        self._digest = digest
+
+    def matches(self, stat):
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def get_encoded(self, encoding):
+        """取得某种编码的内容和对应ETag（首次调用时压缩）"""
+        if encoding == 'identity':
+            return self.body, self.etag
+        if encoding not in self.encoded:
+            if encoding == 'br':
+                data = brotli.compress(self.body, quality=9)
+            else:
+                data = gzip.compress(self.body, compresslevel=9, mtime=0)
+            self.encoded[encoding] = data
+        return self.encoded[encoding], f'"{self._digest}-{encoding}"'
+
+    def all_etags(self):
+        """本文件所有可能的ETag（用于 If-None-Match 比较）"""
+        return {self.etag} | {f'"{self._digest}-{e}"' for e in ('gzip', 'br')}
+
+    @property
+    def nbytes(self):
+        return len(self.body) + sum(len(d) for d in self.encoded.values())
+
+
+class StaticCache:
+    """按路径缓存文件内容、ETag与压缩结果"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._files = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """取得文件缓存，文件变化时重新读取；不适合缓存的文件返回 None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path) or stat.st_size > self.max_bytes:
+            return None
+
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is not None and cached.matches(stat):
+                self._files.move_to_end(path)
+                return cached
+
+        cached = CachedFile(path, stat)
+        with self._lock:
+            self._files[path] = cached
+            self._files.move_to_end(path)
+            self._evict()
+        return cached
+
+    def encode(self, cached, encoding):
+        """取得编码后的内容（压缩在锁外进行，结果计入缓存大小）"""
+        result = cached.get_encoded(encoding)
+        with self._lock:
+            self._evict()
+        return result
+
+    def _evict(self):
+        total = sum(f.nbytes for f in self._files.values())
+        while total > self.max_bytes and len(self._files) > 1:
+            _, old = self._files.popitem(last=False)
+            total -= old.nbytes
+
+
+def choose_encoding(path, accept_encoding, size):
+    """根据 Accept-Encoding 选择编码：br 优先，其次 gzip，否则不压缩"""
+    if size < MIN_COMPRESS_SIZE:
+        return 'identity'
+    if os.path.splitext(path)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+        return 'identity'
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        fields = part.strip().split(';')
+        name = fields[0].strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in fields[1:]:
+            param = param.strip()
+            if param.startswith('q='):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    if brotli is not None and accepted.get('br', 0) > 0:
+        return 'br'
+    if accepted.get('gzip', 0) > 0:
+        return 'gzip'
+    return 'identity'
+
+
+def etag_matches(if_none_match, etags):
+    """If-None-Match 是否命中（支持 * 和多个ETag，忽略弱校验前缀）"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return True
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag in etags:
+            return True
+    return False
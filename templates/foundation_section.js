@@ -0,0 +1,498 @@
+// 建立根基课程节页面脚本；PAGE_KEY 由页面内联定义，如 'foundation_L1_S1'
+// 存储标准答案
+let standardAnswers = {};
+
+// 页面加载时初始化
+window.addEventListener('load', () => {
+    loadStandardAnswers();
+    loadProgress();
+    updateProgress();
+});
+
+// 自动保存
+document.querySelectorAll('.answer-input, .application-input').forEach(input => {
+    input.addEventListener('input', () => {
+        updateProgress();
+    });
+});
+
+// 加载标准答案
+async function loadStandardAnswers() {
+    try {
+        const response = await fetch(`data/answers/${PAGE_KEY}.json`);
+        if (!response.ok) {
+            console.warn('未找到答案数据文件');
+            return;
+        }
+
+        const answerData = await response.json();
+        standardAnswers = answerData.answers || {};
+        console.log('标准答案已加载:', Object.keys(standardAnswers).length, '个');
+    } catch (e) {
+        console.error('加载标准答案失败:', e);
+    }
+}
+
+// 显示完整提示（标准答案）
+function showFullHint(questionId, ref) {
+    const answerKey = `q${questionId}_${ref}`;
+    const answerInfo = standardAnswers[answerKey];
+
+    if (!answerInfo || !answerInfo.has_data) {
+        showToast('暂无答案数据');
+        return;
+    }
+
+    const standardAnswerDiv = document.querySelector(`.standard-answer[data-ref="${ref}"]`);
+    if (standardAnswerDiv) {
+        if (standardAnswerDiv.classList.contains('show')) {
+            // 隐藏答案
+            standardAnswerDiv.classList.remove('show');
+        } else {
+            // 显示答案
+            standardAnswerDiv.innerHTML = `<strong>📖 标准答案:</strong> ${answerInfo.text}`;
+            standardAnswerDiv.classList.add('show');
+        }
+    }
+}
+
+// 渐进提示（逐步填充答案）
+function showPartialHint(questionId, ref) {
+    const answerKey = `q${questionId}_${ref}`;
+    const answerInfo = standardAnswers[answerKey];
+
+    if (!answerInfo || !answerInfo.has_data) {
+        showToast('暂无答案数据');
+        return;
+    }
+
+    const input = document.querySelector(`textarea[data-question="${questionId}"][data-reference="${ref}"]`);
+    if (!input) return;
+
+    const standardText = answerInfo.text;
+    const currentProgress = parseInt(input.dataset.hintProgress || '0');
+
+    // 每次填充20%的内容
+    const fillPercentage = Math.min(currentProgress + 20, 100);
+    const fillLength = Math.floor((standardText.length * fillPercentage) / 100);
+    const filledText = standardText.substring(0, fillLength);
+
+    input.value = filledText;
+    input.dataset.hintProgress = fillPercentage;
+
+    if (fillPercentage >= 100) {
+        showToast('💡 答案已全部填充');
+    } else {
+        showToast(`💡 已填充 ${fillPercentage}% 的答案`);
+    }
+
+    updateProgress();
+}
+
+// 清空所有答案
+function clearAnswers() {
+    if (!confirm('确定要清空所有答案吗？')) {
+        return;
+    }
+
+    document.querySelectorAll('.answer-input').forEach(input => {
+        input.value = '';
+        input.classList.remove('correct', 'incorrect', 'partial');
+        input.dataset.hintProgress = '0';
+    });
+
+    document.querySelector('.application-input').value = '';
+
+    document.querySelectorAll('.answer-feedback').forEach(feedback => {
+        feedback.textContent = '';
+        feedback.className = 'answer-feedback';
+    });
+
+    document.querySelectorAll('.standard-answer').forEach(div => {
+        div.classList.remove('show');
+    });
+
+    updateProgress();
+    showToast('✓ 答案已清空');
+}
+
+// 检查答案
+async function checkAnswers() {
+    await loadStandardAnswers();
+    const serverGrades = await fetchServerGrades();
+
+    let totalAnswerableQuestions = 0;
+    let correctCount = 0;
+    let incorrectInputs = [];
+
+    document.querySelectorAll('.answer-input').forEach(input => {
+        const ref = input.dataset.reference;
+        const hasAnswer = input.dataset.hasAnswer === 'true';
+
+        if (!ref || !hasAnswer) {
+            return;
+        }
+
+        const questionId = input.dataset.question;
+        const answerKey = `q${questionId}_${ref}`;
+        const answerInfo = standardAnswers[answerKey];
+
+        if (!answerInfo || !answerInfo.has_data) {
+            return;
+        }
+
+        totalAnswerableQuestions++;
+
+        const userAnswer = input.value.trim();
+        const standardAnswer = answerInfo.text || '';
+
+        // 清除之前的标记
+        input.classList.remove('correct', 'incorrect', 'partial');
+
+        const feedbackDiv = input.parentElement.querySelector('.answer-feedback');
+
+        if (userAnswer === '') {
+            // 空答案 - 标记为错误
+            input.classList.add('incorrect');
+            feedbackDiv.textContent = '✗ 请填写答案';
+            feedbackDiv.className = 'answer-feedback incorrect show';
+            incorrectInputs.push(input);
+        } else {
+            // 相似度检查
+            const similarity = answerSimilarity(serverGrades, answerKey, userAnswer, standardAnswer);
+
+            if (similarity >= 0.85) {
+                input.classList.add('correct');
+                feedbackDiv.textContent = '✓ 正确！';
+                feedbackDiv.className = 'answer-feedback correct show';
+                correctCount++;
+            } else if (similarity >= 0.6) {
+                input.classList.add('partial');
+                feedbackDiv.textContent = '△ 部分正确，请对照标准答案修改';
+                feedbackDiv.className = 'answer-feedback partial show';
+                incorrectInputs.push(input);
+            } else {
+                input.classList.add('incorrect');
+                feedbackDiv.textContent = '✗ 不正确，请对照标准答案修改';
+                feedbackDiv.className = 'answer-feedback incorrect show';
+                incorrectInputs.push(input);
+            }
+        }
+    });
+
+    // 如果有错误的答案，定位到第一个错误位置
+    if (incorrectInputs.length > 0) {
+        const firstIncorrect = incorrectInputs[0];
+        // 平滑滚动到第一个错误位置
+        firstIncorrect.scrollIntoView({
+            behavior: 'smooth',
+            block: 'center'
+        });
+        // 短暂聚焦到第一个错误输入框
+        setTimeout(() => {
+            firstIncorrect.focus();
+        }, 500);
+
+        showToast(`❌ 发现 ${incorrectInputs.length} 个错误，已定位到第一个错误`);
+    } else if (correctCount === totalAnswerableQuestions && totalAnswerableQuestions > 0) {
+        showToast('🎉 所有答案都正确！');
+    } else if (totalAnswerableQuestions === 0) {
+        showToast('ℹ️ 本节没有可检查的题目');
+    } else {
+        showToast(`✓ 检查完成 - ${correctCount}/${totalAnswerableQuestions} 正确`);
+    }
+}
+
+// 提交成绩
+async function submitAnswers() {
+    await loadStandardAnswers();
+    const serverGrades = await fetchServerGrades();
+
+    // 按问题ID统计，避免重复计数
+    const questionStats = {};
+    let totalInputs = 0;
+    let correctInputs = 0;
+    let partialInputs = 0;
+    let incorrectInputs = 0;
+
+    document.querySelectorAll('.answer-input').forEach(input => {
+        const ref = input.dataset.reference;
+        const hasAnswer = input.dataset.hasAnswer === 'true';
+
+        if (!ref || !hasAnswer) {
+            return;
+        }
+
+        const questionId = input.dataset.question;
+        const answerKey = `q${questionId}_${ref}`;
+        const answerInfo = standardAnswers[answerKey];
+
+        if (!answerInfo || !answerInfo.has_data) {
+            return;
+        }
+
+        totalInputs++;
+
+        // 初始化问题统计
+        if (!questionStats[questionId]) {
+            questionStats[questionId] = {
+                total: 0,
+                correct: 0,
+                partial: 0,
+                incorrect: 0
+            };
+        }
+        questionStats[questionId].total++;
+
+        const userAnswer = input.value.trim();
+        const standardAnswer = answerInfo.text || '';
+
+        const similarity = answerSimilarity(serverGrades, answerKey, userAnswer, standardAnswer);
+
+        if (similarity >= 0.85) {
+            correctInputs++;
+            questionStats[questionId].correct++;
+        } else if (similarity >= 0.6) {
+            partialInputs++;
+            questionStats[questionId].partial++;
+        } else {
+            incorrectInputs++;
+            questionStats[questionId].incorrect++;
+        }
+    });
+
+    // 计算问题级别的统计
+    let totalQuestions = Object.keys(questionStats).length;
+    let questionCorrectCount = 0;
+    let questionPartialCount = 0;
+    let questionIncorrectCount = 0;
+
+    Object.values(questionStats).forEach(stats => {
+        const accuracy = stats.total > 0 ? stats.correct / stats.total : 0;
+        if (accuracy >= 0.8) {
+            questionCorrectCount++;
+        } else if (accuracy >= 0.4) {
+            questionPartialCount++;
+        } else {
+            questionIncorrectCount++;
+        }
+    });
+
+    // 计算得分（按答案框）
+    const score = totalInputs > 0
+        ? Math.round(((correctInputs + partialInputs * 0.6) / totalInputs) * 100)
+        : 0;
+
+    // 显示成绩模态框
+    const finalScoreEl = document.getElementById('finalScore');
+    const scoreMessageEl = document.getElementById('scoreMessage');
+    const scoreDetailsEl = document.getElementById('scoreDetails');
+
+    finalScoreEl.textContent = score + '分';
+
+    // 根据分数显示不同的消息
+    if (totalInputs === 0) {
+        scoreMessageEl.textContent = '本节暂无可评分的题目';
+    } else if (score >= 90) {
+        scoreMessageEl.textContent = '优秀！你掌握得非常好！';
+    } else if (score >= 75) {
+        scoreMessageEl.textContent = '良好！继续加油！';
+    } else if (score >= 60) {
+        scoreMessageEl.textContent = '及格！建议再复习一下';
+    } else {
+        scoreMessageEl.textContent = '继续努力！多读几遍经文吧';
+    }
+
+    scoreDetailsEl.innerHTML = `
+        <p>📊 总题数: ${totalQuestions} 题 | 总答案框: ${totalInputs} 个</p>
+        <p>📋 问题统计: ✅${questionCorrectCount} ⚠️${questionPartialCount} ❌${questionIncorrectCount}</p>
+        <p>📝 答案框统计: ✅${correctInputs} ⚠️${partialInputs} ❌${incorrectInputs}</p>
+        <p>🎯 成绩计算: 基于答案框正确率 (${Math.round((correctInputs/totalInputs)*100)}% 完全正确)</p>
+    `;
+
+    document.getElementById('scoreModal').classList.add('show');
+
+    // 保存进度
+    saveProgress();
+}
+
+function closeScoreModal() {
+    document.getElementById('scoreModal').classList.remove('show');
+}
+
+// 计算文本相似度（LCS算法）
+function calculateSimilarity(text1, text2) {
+    const clean1 = text1.replace(/[\s\.,;:!?，。；：！？、""''（）【】《》]/g, '');
+    const clean2 = text2.replace(/[\s\.,;:!?，。；：！？、""''（）【】《》]/g, '');
+
+    if (!clean1 || !clean2) return 0;
+
+    const shorter = clean1.length < clean2.length ? clean1 : clean2;
+    const longer = clean1.length < clean2.length ? clean2 : clean1;
+
+    // 最长公共子序列：只保留一行状态（长度为较短文本+1）
+    const row = new Uint32Array(shorter.length + 1);
+    for (let j = 0; j < longer.length; j++) {
+        let diagonal = 0;  // 上一行的 row[i-1]
+        for (let i = 1; i <= shorter.length; i++) {
+            const above = row[i];
+            if (shorter[i-1] === longer[j]) {
+                row[i] = diagonal + 1;
+            } else if (row[i-1] > above) {
+                row[i] = row[i-1];
+            }
+            diagonal = above;
+        }
+    }
+
+    return row[shorter.length] / longer.length;
+}
+
+// 评分接口：本节所有答案一次提交到服务器的 /api/grade，返回 答案键 -> 相似度；
+// 静态托管（没有评分接口）时返回空对象，由 answerSimilarity 在本地计算
+async function fetchServerGrades() {
+    const answers = [];
+    document.querySelectorAll('.answer-input').forEach(input => {
+        const ref = input.dataset.reference;
+        if (ref && input.dataset.hasAnswer === 'true') {
+            answers.push({ key: `q${input.dataset.question}_${ref}`, answer: input.value.trim() });
+        }
+    });
+
+    const grades = {};
+    if (answers.length === 0) {
+        return grades;
+    }
+    try {
+        const response = await fetch('/api/grade', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ page: PAGE_KEY, answers: answers })
+        });
+        if (response.ok) {
+            ((await response.json()).results || []).forEach(result => {
+                if (result.key && typeof result.similarity === 'number') {
+                    grades[result.key] = result.similarity;
+                }
+            });
+        }
+    } catch (e) {
+        console.log('评分接口不可用，使用本地评分');
+    }
+    return grades;
+}
+
+// 一道题的相似度：优先使用服务器的评分，没有时在本地计算
+function answerSimilarity(grades, answerKey, userAnswer, standardAnswer) {
+    if (answerKey in grades) {
+        return grades[answerKey];
+    }
+    return calculateSimilarity(userAnswer, standardAnswer);
+}
+
+function loadProgress() {
+    const key = PAGE_KEY;
+    const saved = localStorage.getItem(key);
+    if (saved) {
+        try {
+            const data = JSON.parse(saved);
+            document.querySelectorAll('.answer-input').forEach(input => {
+                const q = input.dataset.question;
+                const ref = input.dataset.reference || 'main';
+                const savedAnswer = data.answers?.[`q${q}_${ref}`];
+                if (savedAnswer) {
+                    input.value = savedAnswer;
+                }
+            });
+            const appInput = document.querySelector('.application-input');
+            if (appInput && data.application) {
+                appInput.value = data.application;
+            }
+        } catch (e) {
+            console.error('加载进度失败:', e);
+        }
+    }
+}
+
+function saveProgress() {
+    const key = PAGE_KEY;
+    const data = {
+        answers: {},
+        application: '',
+        timestamp: new Date().toISOString()
+    };
+
+    document.querySelectorAll('.answer-input').forEach(input => {
+        const q = input.dataset.question;
+        const ref = input.dataset.reference || 'main';
+        data.answers[`q${q}_${ref}`] = input.value;
+    });
+
+    const appInput = document.querySelector('.application-input');
+    if (appInput) {
+        data.application = appInput.value;
+    }
+
+    localStorage.setItem(key, JSON.stringify(data));
+    showToast('✓ 进度已保存');
+}
+
+function updateProgress() {
+    let totalFields = 0;
+    let filledFields = 0;
+
+    document.querySelectorAll('.answer-input').forEach(input => {
+        totalFields++;
+        if (input.value.trim()) {
+            filledFields++;
+        }
+    });
+
+    const appInput = document.querySelector('.application-input');
+    if (appInput) {
+        totalFields++;
+        if (appInput.value.trim()) {
+            filledFields++;
+        }
+    }
+
+    const percentage = totalFields > 0 ? Math.round((filledFields / totalFields) * 100) : 0;
+    document.getElementById('progressDisplay').textContent = percentage + '%';
+}
+
+// 导出所有节的进度（交给老师用 grade_progress.py 批量评分）
+function exportProgress() {
+    saveProgress();
+    const student = (prompt('请输入你的姓名：') || '').trim();
+    const progress = {};
+    for (let i = 0; i < localStorage.length; i++) {
+        const key = localStorage.key(i);
+        if (/^foundation_L\d+_S\d+$/.test(key)) {
+            try {
+                progress[key] = JSON.parse(localStorage.getItem(key));
+            } catch (e) {
+                console.error('跳过无法解析的进度:', key);
+            }
+        }
+    }
+
+    const data = { student: student, exported_at: new Date().toISOString(), progress: progress };
+    const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
+    const link = document.createElement('a');
+    link.href = URL.createObjectURL(blob);
+    link.download = `foundation_progress${student ? '_' + student : ''}.json`;
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    URL.revokeObjectURL(link.href);
+    showToast(`✓ 已导出 ${Object.keys(progress).length} 节的进度`);
+}
+
+function showToast(message) {
+    const toast = document.getElementById('toast');
+    toast.textContent = message;
+    toast.classList.add('show');
+    setTimeout(() => {
+        toast.classList.remove('show');
+    }, 3000);
+}
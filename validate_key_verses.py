@@ -7,6 +7,8 @@
 
 import json
 
+from verse_index import VerseIndex
+
 # 关键经文的标准和合本文本（用于对比验证）
 KEY_VERSES = {
     (1, 35): '天使回答说："圣灵要临到你身上，至高者的能力要荫庇你，因此所要生的圣者必称为神的儿子。',
@@ -26,19 +28,24 @@ def load_luke_data():
         data = json.load(f)
         return data['verses']
 
-def find_verse(verses, chapter, verse_num):
+def find_verse(index, chapter, verse_num):
     """查找指定经文"""
-    for verse in verses:
-        if verse.get('chapter') == chapter and verse.get('verse') == verse_num:
-            return verse
-    return None
+    return index.get('luke', chapter, verse_num)
 
 def compare_with_standard(verses):
     """与标准和合本文本对比"""
     issues = []
+    index = VerseIndex()
+    for chapter, verse_num, position in index.add_book('luke', verses):
+        issues.append({
+            'type': '重复经文（只使用第一条）',
+            'chapter': chapter,
+            'verse': verse_num,
+            'issue': f'第{position + 1}条与前面的 {chapter}:{verse_num} 重复'
+        })
     
     for (chapter, verse_num), standard_text in KEY_VERSES.items():
-        verse_data = find_verse(verses, chapter, verse_num)
+        verse_data = find_verse(index, chapter, verse_num)
         
         if not verse_data:
             issues.append({
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+统一的经文索引
+Unified verse index shared by the answer generators, validators and server
+
+以 (书卷ID, 章, 节) 整数元组为键，O(1) 查找单节；
+每卷书保存有序的 (章, 节) 列表，用二分查找做范围切片。
+同一 (章, 节) 出现多次时使用第一条（与编辑器的 versesData.find 一致），
+其余记录在 duplicates 中，由调用方报告。
+从 data/*.json 构建后可保存为二进制快照，源文件未变时直接加载快照（毫秒级）。
+
+用法:
+    index = VerseIndex.open('data')
+    index.text('luke', 1, 1)
+    index.range('romans', (7, 24), (8, 2))
+"""
+
+import bisect
+import glob
+import json
+import os
+import pickle
+
+DEFAULT_SNAPSHOT = '.verse_index.pkl'
+SNAPSHOT_VERSION = 2
+
+
+class VerseIndex:
+    """(书卷, 章, 节) -> 经文数据 的索引"""
+
+    def __init__(self):
+        self._verses = {}
+        self._keys = {}
+        self.sources = {}
+        self.duplicates = {}  # 书卷ID -> [(章, 节, 在经文列表中的位置)]，未被索引的重复记录
+
+    def add_book(self, book_id, verses):
+        """加入一卷书的经文列表（索引保存的是原字典的引用，原地修改会同步可见）
+
+        重复的 (章, 节) 只索引第一条，返回被跳过的 [(章, 节, 位置)]。
+        """
+        keys = self._keys.setdefault(book_id, [])
+        duplicates = []
+        for position, verse_data in enumerate(verses):
+            key = (verse_data['chapter'], verse_data['verse'])
+            if self._verses.setdefault((book_id,) + key, verse_data) is verse_data:
+                keys.append(key)
+            else:
+                duplicates.append(key + (position,))
+        keys.sort()
+        if duplicates:
+            self.duplicates.setdefault(book_id, []).extend(duplicates)
+        return duplicates
+
+    def add(self, book_id, verse_data):
+        """加入或替换一节经文（用于新增经文，替换后被替换的记录不再可查）"""
+        key = (verse_data['chapter'], verse_data['verse'])
+        if (book_id,) + key not in self._verses:
+            bisect.insort(self._keys.setdefault(book_id, []), key)
+        self._verses[(book_id,) + key] = verse_data
+
+    def get(self, book_id, chapter, verse):
+        """取一节经文数据，不存在时返回 None"""
+        return self._verses.get((book_id, chapter, verse))
+
+    def text(self, book_id, chapter, verse, field='zh'):
+        """取一节经文的文本，不存在时返回 None"""
+        verse_data = self._verses.get((book_id, chapter, verse))
+        return None if verse_data is None else verse_data.get(field)
+
+    def range(self, book_id, start, end):
+        """取 [start, end] 范围内的经文（start/end 为 (章, 节)，可跨章）"""
+        keys = self._keys.get(book_id, [])
+        lo = bisect.bisect_left(keys, start)
+        hi = bisect.bisect_right(keys, end)
+        return [self._verses[(book_id,) + key] for key in keys[lo:hi]]
+
+    def chapter(self, book_id, chapter):
+        """取一整章经文，按节号排序"""
+        return self.range(book_id, (chapter, 0), (chapter, float('inf')))
+
+    def chapters(self, book_id):
+        """一卷书中有经文的章号列表"""
+        return sorted({c for c, _ in self._keys.get(book_id, [])})
+
+    def books(self):
+        return list(self._keys)
+
+    def duplicate_summary(self, book_id, limit=5):
+        """重复经文的简短说明，如 "17:27 (第822条) 等3处"；没有重复时返回空字符串"""
+        duplicates = self.duplicates.get(book_id, [])
+        shown = ', '.join(f"{c}:{v} (第{position + 1}条)" for c, v, position in duplicates[:limit])
+        if len(duplicates) > limit:
+            shown += f" 等{len(duplicates)}处"
+        return shown
+
+    def __contains__(self, key):
+        return key in self._verses
+
+    def __len__(self):
+        return len(self._verses)
+
+    # ----- 构建与快照 -----
+
+    @classmethod
+    def build(cls, data_dir='data', book_ids=None):
+        """从 data_dir/*.json 构建索引；book_ids 为空时加载所有含 verses 的书卷"""
+        index = cls()
+        for path, book_id in _book_files(data_dir, book_ids):
+            index.sources[book_id] = _file_signature(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                book_data = json.load(f)
+            if isinstance(book_data, dict) and 'verses' in book_data:
+                index.add_book(book_id, book_data['verses'])
+        return index
+
+    def save_snapshot(self, path):
+        """保存二进制快照（先写临时文件再重命名）"""
+        payload = {
+            'version': SNAPSHOT_VERSION,
+            'sources': self.sources,
+            'duplicates': self.duplicates,
+            'books': {book_id: [self._verses[(book_id,) + key] for key in keys]
+                      for book_id, keys in self._keys.items()}
+        }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_snapshot(cls, path):
+        """加载快照，文件不存在或版本不符时返回 None（快照只用于本地生成的可信文件）"""
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(payload, dict) or payload.get('version') != SNAPSHOT_VERSION:
+            return None
+        index = cls()
+        for book_id, verses in payload['books'].items():
+            index._keys[book_id] = [(v['chapter'], v['verse']) for v in verses]
+            for v in verses:
+                index._verses[(book_id, v['chapter'], v['verse'])] = v
+        index.sources = payload['sources']
+        index.duplicates = payload['duplicates']
+        return index
+
+    @classmethod
+    def open(cls, data_dir='data', book_ids=None, snapshot=DEFAULT_SNAPSHOT):
+        """优先加载快照；快照缺失或任何源文件已变化时重新构建并更新快照
+
+        snapshot 为相对路径时放在 data_dir 下，为 None 时不使用快照。
+        """
+        if snapshot is None:
+            return cls.build(data_dir, book_ids)
+        snapshot_path = snapshot if os.path.isabs(snapshot) else os.path.join(data_dir, snapshot)
+
+        expected = {book_id: _file_signature(path)
+                    for path, book_id in _book_files(data_dir, book_ids)}
+        index = cls.load_snapshot(snapshot_path)
+        if index is not None and _sources_match(index.sources, expected):
+            return index
+
+        index = cls.build(data_dir, book_ids)
+        try:
+            index.save_snapshot(snapshot_path)
+        except OSError:
+            pass
+        return index
+
+
+def _book_files(data_dir, book_ids):
+    """列出 (文件路径, 书卷ID)"""
+    if book_ids is None:
+        paths = sorted(glob.glob(os.path.join(data_dir, '*.json')))
+        return [(p, os.path.splitext(os.path.basename(p))[0]) for p in paths
+                if os.path.basename(p) != 'config.json' and 'backup' not in os.path.basename(p)]
+    return [(os.path.join(data_dir, f"{b}.json"), b) for b in book_ids
+            if os.path.exists(os.path.join(data_dir, f"{b}.json"))]
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _sources_match(snapshot_sources, expected):
+    """快照记录的源文件与当前文件签名完全一致"""
+    return ({k: tuple(v) for k, v in snapshot_sources.items()} ==
+            {k: tuple(v) for k, v in expected.items()})
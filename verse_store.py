@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+经文库（SQLite）
+Canonical verse store backed by SQLite, covering both testaments
+
+所有经文按 (书卷ID, 章, 节) 为主键存放在一个 SQLite 文件中，任何引用（范围、多节、跨章）
+都在查询时由单节经文拼出，不再为每种引用写法各存一份文字。
+
+数据来源（按优先级）:
+    foundation/data/verses/*.json    建立根基课程原先手工录入的经文（答案文件中已有的文字）
+    bible-study/data/*.json          查经网站的书卷数据（新约和传道书）
+同一节在多个来源中出现时，先列出的来源优先：课程答案沿用原来录入的文字，
+其余经文取自网站数据。补充文件中无法拆成单节的经文段
+放在 passages 中（如 "15:4-6"），拼接引用时整段使用。
+
+数据库是可重建的缓存（默认 .verse_store.sqlite）：打开时比较源文件的修改时间和大小，
+有变化时重新构建（先写临时文件再替换）。
+
+用法:
+    store = VerseStore.open()
+    store.text('genesis', 1, 1)
+    store.lookup('罗 7:24-8:2')          # 拼好的经文，缺少任何一节时为 None
+    store.missing('创 15:1-6')           # 缺少的 (章, 节)
+
+    python3 verse_store.py 创 15:4-6     # 查询经文
+    python3 verse_store.py --rebuild     # 重新构建数据库
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import sys
+
+import scripture_reference
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(ROOT_DIR, '.verse_store.sqlite')
+DEFAULT_SOURCES = (
+    os.path.join(ROOT_DIR, 'foundation', 'data', 'verses'),
+    os.path.join(ROOT_DIR, 'bible-study', 'data'),
+)
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE sources (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL);
+CREATE TABLE books (book TEXT PRIMARY KEY, name TEXT, testament TEXT);
+CREATE TABLE verses (
+    book TEXT NOT NULL, chapter INTEGER NOT NULL, verse INTEGER NOT NULL,
+    zh TEXT, en TEXT,
+    PRIMARY KEY (book, chapter, verse)
+) WITHOUT ROWID;
+CREATE TABLE passages (
+    book TEXT NOT NULL, chapter INTEGER NOT NULL, verse INTEGER NOT NULL,
+    ref TEXT NOT NULL, verses TEXT NOT NULL, zh TEXT NOT NULL,
+    PRIMARY KEY (book, chapter, verse, ref)
+) WITHOUT ROWID;
+"""
+
+
+def _source_files(sources):
+    """各来源目录中的书卷文件（按来源优先级）"""
+    paths = []
+    for source in sources:
+        for path in sorted(glob.glob(os.path.join(source, '*.json'))):
+            name = os.path.basename(path)
+            if name != 'config.json' and 'backup' not in name:
+                paths.append(path)
+    return paths
+
+
+def _signatures(paths):
+    signatures = {}
+    for path in paths:
+        stat = os.stat(path)
+        signatures[os.path.relpath(path, ROOT_DIR)] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+def _verse_key(verses):
+    """(章, 节) 列表 -> "章:节,章:节"（passages 表中经文段覆盖的节）"""
+    return ','.join(f"{chapter}:{verse}" for chapter, verse in verses)
+
+
+def build(db_path=DEFAULT_DB, sources=DEFAULT_SOURCES):
+    """从来源目录构建数据库（原子替换已有的数据库文件）"""
+    paths = _source_files(sources)
+    tmp_path = db_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                book_data = json.load(f)
+            if not isinstance(book_data, dict) or 'verses' not in book_data:
+                continue
+            book_id = book_data.get('book') or os.path.splitext(os.path.basename(path))[0]
+            conn.execute("INSERT OR IGNORE INTO books VALUES (?, ?, ?)",
+                         (book_id, book_data.get('name'), book_data.get('testament')))
+            # 先出现的来源优先
+            conn.executemany(
+                "INSERT OR IGNORE INTO verses VALUES (?, ?, ?, ?, ?)",
+                ((book_id, v['chapter'], v['verse'], v.get('zh'), v.get('en'))
+                 for v in book_data['verses']))
+            for passage in book_data.get('passages', []):
+                verses = scripture_reference.expand(scripture_reference.parse_ranges(passage['ref']))
+                if len(verses) < 2:
+                    raise ValueError(f"{path}: 无效的经文段 {passage['ref']}")
+                conn.execute("INSERT OR IGNORE INTO passages VALUES (?, ?, ?, ?, ?, ?)",
+                             (book_id, verses[0][0], verses[0][1], passage['ref'],
+                              _verse_key(verses), passage['zh']))
+        conn.executemany("INSERT INTO sources VALUES (?, ?, ?)",
+                         ((path, mtime, size) for path, (mtime, size) in _signatures(paths).items()))
+        conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+
+
+def is_current(db_path, sources):
+    """数据库存在、版本一致且源文件都没有变化"""
+    if not os.path.exists(db_path):
+        return False
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            version = conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            recorded = {path: (mtime, size) for path, mtime, size
+                        in conn.execute("SELECT path, mtime_ns, size FROM sources")}
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+    return version == (str(SCHEMA_VERSION),) and recorded == _signatures(_source_files(sources))
+
+
+class VerseStore:
+    """只读的经文库"""
+
+    def __init__(self, db_path=DEFAULT_DB):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+
+    @classmethod
+    def open(cls, db_path=DEFAULT_DB, sources=DEFAULT_SOURCES, rebuild=False):
+        """打开数据库；不存在、源文件有变化或 rebuild=True 时先重新构建"""
+        if rebuild or not is_current(db_path, sources):
+            build(db_path, sources)
+        return cls(db_path)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM verses").fetchone()[0]
+
+    def books(self):
+        """有经文的书卷ID（按圣经顺序）"""
+        present = {row[0] for row in self._conn.execute("SELECT DISTINCT book FROM verses")}
+        return [book[0] for book in scripture_reference.BOOKS if book[0] in present]
+
+    def text(self, book_id, chapter, verse, field='zh'):
+        """取一节经文，不存在时返回 None"""
+        if field not in ('zh', 'en'):
+            raise ValueError(f"未知字段: {field}")
+        row = self._conn.execute(
+            f"SELECT {field} FROM verses WHERE book = ? AND chapter = ? AND verse = ?",
+            (book_id, chapter, verse)).fetchone()
+        return row[0] if row else None
+
+    def range(self, book_id, start, end):
+        """取 [start, end] 范围内已有的经文，返回 [(章, 节, 文字), ...]（start/end 为 (章, 节)，可跨章）"""
+        return self._conn.execute(
+            "SELECT chapter, verse, zh FROM verses WHERE book = ? "
+            "AND (chapter, verse) >= (?, ?) AND (chapter, verse) <= (?, ?) "
+            "ORDER BY chapter, verse",
+            (book_id, start[0], start[1], end[0], end[1])).fetchall()
+
+    def _requested_verses(self, reference):
+        """引用 -> (书卷ID, 要求的 (章, 节) 列表)；整章或跨章的范围按库中已有的节展开"""
+        parsed = scripture_reference.parse(reference)
+        if parsed is None or parsed.book_id is None:
+            return None, []
+        verses = []
+        for verse_range in parsed.ranges:
+            (c1, v1), (c2, v2) = verse_range
+            if c1 == c2 and v2 != scripture_reference.END_OF_CHAPTER:
+                verses.extend((c1, v) for v in range(v1, v2 + 1))
+            else:
+                verses.extend((c, v) for c, v, _ in self.range(parsed.book_id, (c1, v1), (c2, v2)))
+        return parsed.book_id, verses
+
+    def _assemble(self, book_id, verses):
+        """把要求的节拼成文字片段；返回 (片段列表, 缺少的节)
+
+        某一位置开始的经文段完全落在要求的节中时整段使用，否则使用单节。
+        """
+        if not verses:
+            return [], []
+        texts = {(c, v): zh for c, v, zh in self.range(book_id, min(verses), max(verses))}
+        parts = []
+        missing = []
+        i = 0
+        while i < len(verses):
+            chapter, verse = verses[i]
+            passage = None
+            for passage_verses, zh in self._conn.execute(
+                    "SELECT verses, zh FROM passages WHERE book = ? AND chapter = ? AND verse = ? "
+                    "ORDER BY length(verses) DESC", (book_id, chapter, verse)):
+                rest = _verse_key(verses[i:])
+                if rest == passage_verses or rest.startswith(passage_verses + ','):
+                    passage = (passage_verses.count(',') + 1, zh)
+                    break
+            if passage:
+                parts.append(passage[1])
+                i += passage[0]
+                continue
+            text = texts.get(verses[i])
+            if text:
+                parts.append(text)
+            else:
+                missing.append(verses[i])
+            i += 1
+        return parts, missing
+
+    def lookup(self, reference, separator=''):
+        """引用的完整经文；书名无法识别或缺少任何一节时返回 None"""
+        book_id, verses = self._requested_verses(reference)
+        parts, missing = self._assemble(book_id, verses)
+        if not parts or missing:
+            return None
+        return separator.join(parts)
+
+    def missing(self, reference):
+        """引用中库里没有的 (章, 节)；引用无法解析时返回 None"""
+        book_id, verses = self._requested_verses(reference)
+        if book_id is None:
+            return None
+        return self._assemble(book_id, verses)[1]
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != '--rebuild']
+    with VerseStore.open(rebuild='--rebuild' in sys.argv) as store:
+        if not args:
+            print(f"📖 经文库: {len(store)} 节，{len(store.books())} 卷书")
+            print(f"   {' '.join(scripture_reference.BOOK_NAMES[b][1] for b in store.books())}")
+        else:
+            reference = ' '.join(args)
+            text = store.lookup(reference)
+            if text:
+                print(text)
+            else:
+                missing = store.missing(reference)
+                if missing is None:
+                    print(f"❌ 无法解析引用: {reference}")
+                else:
+                    print(f"❌ 缺少: {', '.join(f'{c}:{v}' for c, v in missing)}")